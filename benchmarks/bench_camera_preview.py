@@ -0,0 +1,150 @@
+"""카메라 프리뷰/촬영 벤치마크 (웹캠 없이 재생용 프레임 소스 사용, 화면 없는 리눅스에서 실행 가능)
+
+WebcamViewer를 실제와 같은 크기로 띄워 일정 시간 동안 프리뷰를 표시한 뒤 촬영을 반복하고,
+프리뷰 표시 fps, 표시되지 못한 프레임 수, 프로세스 CPU 사용률, 프레임 생성 -> 표시 지연, 촬영 -> 시그널 지연과
+촬영한 사진 크기를 출력한다. 프레임은 캡처 스레드의 프레임 번호로 구분한다.
+
+사용법 (프로젝트 루트에서):
+    python benchmarks/bench_camera_preview.py
+    python benchmarks/bench_camera_preview.py --source synthetic:1280x720@30 --seconds 10
+    python benchmarks/bench_camera_preview.py --source video:sample.mp4 --captures 5
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+# 화면이 없는 환경에서도 Qt가 동작하도록 설정
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+
+
+def percentile_row(name, values):
+    values = np.asarray(values) * 1000
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return f"{name:<16}{p50:>10.1f}{p95:>10.1f}{p99:>10.1f}{values.max():>10.1f}"
+
+
+def run(args):
+    from PySide6.QtWidgets import QApplication
+    from webcam_utils.frame_sources import open_frame_source
+    from webcam_utils.webcam_controller import WebcamViewer
+    from utils.image_cache import image_cache
+
+    preview_width, preview_height = (int(value) for value in args.preview.lower().split("x"))
+    source = open_frame_source(args.source)
+    if source is None:
+        raise SystemExit(f"프레임 소스를 열 수 없습니다: {args.source}")
+
+    # 프레임마다 생성 시각 기록 (n번째로 읽은 프레임 = 캡처 스레드 프레임 번호 n)
+    produced = {}
+    source_read = source.read
+
+    def timed_read(image=None):
+        number = source.frame_count
+        ret, frame = source_read(image)
+        if ret:
+            produced[number + 1] = time.perf_counter()
+        return ret, frame
+
+    source.read = timed_read
+
+    app = QApplication.instance() or QApplication([])
+    viewer = WebcamViewer(preview_width=preview_width, preview_height=preview_height,
+                          frame_source=source)
+
+    # 표시된 프레임 번호와 표시 시각 기록
+    presented = {}
+    shown_sequence = [0]  # UI가 마지막으로 가져간 프레임 번호
+    latest_frame = viewer.capture_thread.latest_frame
+    show_frame = viewer.preview_view.show_frame
+
+    def timed_latest_frame(*frame_args):
+        sequence, frame = latest_frame(*frame_args)
+        shown_sequence[0] = sequence
+        return sequence, frame
+
+    def timed_show_frame(frame, *show_args):
+        presented.setdefault(shown_sequence[0], time.perf_counter())
+        show_frame(frame, *show_args)
+
+    viewer.capture_thread.latest_frame = timed_latest_frame
+    viewer.preview_view.show_frame = timed_show_frame
+
+    def pump(seconds):
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            app.processEvents()
+            time.sleep(0.001)
+
+    # 첫 프레임이 나올 때까지 대기 후 측정
+    pump(0.5)
+    produced_before, presented_before = len(produced), len(presented)
+    started = time.perf_counter()
+    cpu_started = time.process_time()
+    pump(args.seconds)
+    elapsed = time.perf_counter() - started
+    cpu_usage = (time.process_time() - cpu_started) / elapsed * 100
+    produced_count = len(produced) - produced_before
+    presented_count = len(presented) - presented_before
+
+    # 촬영 -> photo_captured_signal 지연
+    capture_latency = []
+    frame_age = []
+    captured = []
+    still_sizes = set()
+    viewer.photo_captured_signal.connect(lambda path: captured.append(time.perf_counter()))
+    viewer.photo_captured_signal.connect(
+        lambda path: still_sizes.add(image_cache.get(path).bgr.shape[1::-1]))
+    for _ in range(args.captures):
+        pump(0.2)
+        requested = time.perf_counter()
+        latest = latest_frame()[0]
+        viewer.capture_photo()
+        if captured:
+            capture_latency.append(captured.pop() - requested)
+            if latest in produced:
+                frame_age.append(requested - produced[latest])
+
+    viewer.close()
+
+    print(f"소스 {args.source}, 프리뷰 {preview_width}x{preview_height}, {elapsed:.1f} s")
+    print(f"생성 {produced_count}프레임 ({produced_count / elapsed:.1f} fps), "
+          f"표시 {presented_count}프레임 ({presented_count / elapsed:.1f} fps), "
+          f"표시되지 못한 프레임 {max(0, produced_count - presented_count)}, "
+          f"프로세스 CPU {cpu_usage:.0f}% (코어 1개 = 100%, 프레임 생성 포함)")
+    for width, height in sorted(still_sizes):
+        print(f"촬영 사진 {width}x{height}")
+
+    print()
+    print(f"{'지연 (ms)':<16}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}")
+    latency = [presented[number] - produced[number] for number in presented if number in produced]
+    if latency:
+        print(percentile_row("생성 -> 표시", latency))
+    if frame_age:
+        print(percentile_row("촬영 프레임 나이", frame_age))
+    if capture_latency:
+        print(percentile_row("촬영 -> 시그널", capture_latency))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="카메라 프리뷰/촬영 벤치마크")
+    parser.add_argument("--source", default="synthetic:1920x1080@60",
+                        help="프레임 소스 (synthetic[:WxH@fps], video:<파일>, images:<폴더>)")
+    parser.add_argument("--preview", default="960x540", help="프리뷰 크기 (촬영 화면과 같은 960x540)")
+    parser.add_argument("--seconds", type=float, default=5, help="프리뷰 측정 시간 (초)")
+    parser.add_argument("--captures", type=int, default=10, help="촬영 횟수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.environ["LOCALAPPDATA"] = work_dir
+        run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""cffi ABI 모드와 API 모드의 SmartComm 호출 비용 비교
+
+smartcomm_stub.c로 만든 가짜 libSmartComm2.so를 두 방식으로 불러와
+cdef 해석 시간과 함수 한 번 호출에 드는 시간을 측정한다. (Linux, C 컴파일러 필요)
+
+사용법 (프로젝트 루트에서):
+    python benchmarks/bench_cffi_modes.py
+    python benchmarks/bench_cffi_modes.py --number 500000
+"""
+import argparse
+import importlib
+import os
+import subprocess
+import sys
+import tempfile
+import timeit
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from cffi import FFI
+from printer_utils.cffi_defs import CDEF
+from printer_utils.build_smartcomm import build
+
+BENCH_MODULE = "_smartcomm_bench_api"
+IMAGE_PATH = "C:\\Users\\kiosk\\AppData\\Local\\GureyCitizenCard\\spool\\0123456789abcdef_card.bmp"
+
+
+def build_stub(work_dir):
+    """스텁 공유 라이브러리 컴파일"""
+    source = os.path.join(os.path.dirname(os.path.abspath(__file__)), "smartcomm_stub.c")
+    lib_path = os.path.join(work_dir, "libSmartComm2.so")
+    subprocess.check_call(["cc", "-shared", "-fPIC", "-O2", "-o", lib_path, source])
+    return lib_path
+
+
+def load_abi(lib_path):
+    ffi = FFI()
+    ffi.cdef(CDEF)
+    return ffi, ffi.dlopen(lib_path)
+
+
+def load_api(work_dir):
+    build(module_name=BENCH_MODULE, lib_dir=work_dir, tmpdir=work_dir)
+    sys.path.insert(0, work_dir)
+    module = importlib.import_module(BENCH_MODULE)
+    return module.ffi, module.lib
+
+
+def bench_calls(ffi, lib, number):
+    """호출 유형별 1회 평균 시간 (ns)"""
+    handle = ffi.cast("HSMART", 1)
+    status = ffi.new("DWORD *")
+    rect = ffi.new("RECT *")
+    printer_list = ffi.new("SMART_PRINTER_LIST *")
+
+    cases = {
+        "GetStatus (미리 할당한 DWORD*)": lambda: lib.SmartComm_GetStatus(handle, status),
+        "GetStatus (매번 ffi.new)": lambda: lib.SmartComm_GetStatus(handle, ffi.new("DWORD *")),
+        "DrawImage (ffi.new wchar_t[] 경로)": lambda: lib.SmartComm_DrawImage(
+            handle, 0, 1, 0, 0, 635, 1027, ffi.new("wchar_t[]", IMAGE_PATH), rect),
+        "DrawImage (str 직접 전달)": lambda: lib.SmartComm_DrawImage(
+            handle, 0, 1, 0, 0, 635, 1027, IMAGE_PATH, rect),
+        "GetDeviceList2": lambda: lib.SmartComm_GetDeviceList2(printer_list),
+    }
+
+    results = {}
+    for name, func in cases.items():
+        # 최솟값이 잡음(다른 프로세스, GC)의 영향을 가장 적게 받음
+        best = min(timeit.repeat(func, number=number, repeat=5))
+        results[name] = best / number * 1e9
+    return results
+
+
+def bench_cdef(repeat):
+    """ABI 모드에서 실행할 때마다 드는 cdef 해석 시간 (ms)"""
+    def parse():
+        FFI().cdef(CDEF)
+    return min(timeit.repeat(parse, number=1, repeat=repeat)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="cffi ABI/API 모드 호출 비용 비교")
+    parser.add_argument("--number", type=int, default=200000, help="측정당 호출 횟수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        lib_path = build_stub(work_dir)
+        abi_ffi, abi_lib = load_abi(lib_path)
+        api_ffi, api_lib = load_api(work_dir)
+
+        print(f"cdef 해석 (ABI 모드 시작 비용): {bench_cdef(20):.2f} ms")
+        print()
+
+        abi = bench_calls(abi_ffi, abi_lib, args.number)
+        api = bench_calls(api_ffi, api_lib, args.number)
+
+        print(f"{'호출':<36}{'ABI (ns)':>12}{'API (ns)':>12}{'배율':>8}")
+        for name in abi:
+            print(f"{name:<36}{abi[name]:>12.0f}{api[name]:>12.0f}{abi[name] / api[name]:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
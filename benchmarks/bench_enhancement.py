@@ -0,0 +1,98 @@
+"""인쇄용 사진 보정 비용 벤치마크
+
+카드 사진 칸 크기(기본 438x438)의 이미지에 보정 단계(화이트 밸런스, CLAHE, 언샤프 마스크)를
+반복 적용하여 단계별/전체 p50/p95/p99 시간을 출력한다. 설정값 변경 전후로 비교할 것.
+
+사용법 (프로젝트 루트에서):
+    python benchmarks/bench_enhancement.py
+    python benchmarks/bench_enhancement.py --runs 500 --size 438
+    python benchmarks/bench_enhancement.py --image captured_image.jpg
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import cv2
+import numpy as np
+
+from utils.image_enhancement import (
+    DEFAULT_SETTINGS, ImageEnhancer, white_balance, equalize_luminance, unsharp_mask
+)
+
+
+def make_photo(size, seed):
+    """보정할 사진 (색이 치우친 부드러운 그라데이션 + 잡음, 어두운 조명 흉내)"""
+    rng = np.random.default_rng(seed)
+    coarse = rng.integers(0, 160, (8, 8, 3), dtype=np.uint8)
+    photo = cv2.resize(coarse, (size, size), interpolation=cv2.INTER_CUBIC)
+    photo = cv2.add(photo, rng.integers(0, 20, photo.shape, dtype=np.uint8))
+    # 노란 조명처럼 파란 채널을 낮춤
+    photo[..., 0] = (photo[..., 0] * 0.7).astype(np.uint8)
+    return photo
+
+
+def load_photo(path, size):
+    image = cv2.imread(path)
+    if image is None:
+        raise SystemExit(f"이미지를 읽을 수 없습니다: {path}")
+    return cv2.resize(image, (size, size), interpolation=cv2.INTER_AREA)
+
+
+def measure(func, runs):
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+    return np.asarray(times) * 1000
+
+
+def percentile_row(name, values):
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return f"{name:<16}{p50:>10.2f}{p95:>10.2f}{p99:>10.2f}{values.max():>10.2f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="인쇄용 사진 보정 비용 벤치마크")
+    parser.add_argument("--runs", type=int, default=300, help="반복 횟수")
+    parser.add_argument("--size", type=int, default=438, help="사진 크기 (정사각형 한 변, px)")
+    parser.add_argument("--image", help="합성 이미지 대신 사용할 사진 파일")
+    parser.add_argument("--seed", type=int, default=0, help="합성 이미지 난수 시드")
+    args = parser.parse_args()
+
+    photo = load_photo(args.image, args.size) if args.image else make_photo(args.size, args.seed)
+    settings = dict(DEFAULT_SETTINGS)
+    enhancer = ImageEnhancer(settings)
+
+    stages = [
+        ("화이트 밸런스", lambda: white_balance(photo, settings["enhance_white_balance"])),
+        ("CLAHE (Y)", lambda: equalize_luminance(photo, settings["enhance_clahe_clip"],
+                                                 settings["enhance_clahe_grid"])),
+        ("언샤프 마스크", lambda: unsharp_mask(photo, settings["enhance_sharpen"],
+                                          settings["enhance_sharpen_sigma"])),
+        ("전체", lambda: enhancer.enhance(photo)),
+    ]
+
+    # 첫 호출(라이브러리 초기화)은 제외
+    enhancer.enhance(photo)
+
+    print(f"사진 {args.size}x{args.size}, {args.runs}회, OpenCV 스레드 {cv2.getNumThreads()}개")
+    print(f"설정: { {key: value for key, value in settings.items() if key != 'enhance'} }")
+    print()
+    print(f"{'단계 (ms)':<16}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}")
+    for name, func in stages:
+        print(percentile_row(name, measure(func, args.runs)))
+
+    enhanced = enhancer.enhance(photo)
+    before = np.asarray(cv2.mean(photo)[:3])
+    after = np.asarray(cv2.mean(enhanced)[:3])
+    print()
+    print(f"채널 평균 (B, G, R): 보정 전 {np.round(before, 1)}, 보정 후 {np.round(after, 1)}")
+
+
+if __name__ == "__main__":
+    main()
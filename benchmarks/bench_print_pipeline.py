@@ -0,0 +1,140 @@
+"""인쇄 파이프라인 지연 시간 벤치마크 (프린터 없이 시뮬레이터 사용)
+
+카드 N장을 PrintManager에 등록하여 합성 -> 프린터 배정 -> 그리기 -> 인쇄까지
+끝까지 처리하고, 처리량과 단계별 p50/p95/p99 지연 시간을 출력한다.
+성능 관련 변경 전후로 같은 옵션으로 실행하여 비교할 것.
+
+사용법 (프로젝트 루트에서):
+    python benchmarks/bench_print_pipeline.py
+    python benchmarks/bench_print_pipeline.py --cards 200 --printers 2 --print-latency 0.5
+    python benchmarks/bench_print_pipeline.py --fail-rate 0.05 --seed 1
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import numpy as np
+from PIL import Image
+
+# 단계 이름 -> (시작 표시, 끝 표시) - PrintJob.mark()로 기록된 시각 사용
+STAGES = [
+    ("합성 대기", "queued", "render_start"),
+    ("합성", "render_start", "rendered"),
+    ("프린터 대기", "rendered", "print_start"),
+    ("그리기", "print_start", "drawn"),
+    ("인쇄", "drawn", "print_end"),
+    ("완료 통지", "print_end", "done"),
+    ("전체", "queued", "done"),
+]
+
+
+def make_photo(path, size=(600, 800)):
+    """합성에 쓸 사진 (촬영 사진과 비슷한 크기의 그라데이션 이미지)"""
+    width, height = size
+    gradient = np.linspace(0, 255, width, dtype=np.uint8)
+    pixels = np.dstack([np.tile(gradient, (height, 1))] * 3)
+    Image.fromarray(pixels).save(path, quality=95)
+    return path
+
+
+def percentile_row(name, values):
+    values = np.asarray(values) * 1000
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return f"{name:<12}{p50:>10.1f}{p95:>10.1f}{p99:>10.1f}{values.max():>10.1f}"
+
+
+def run(args):
+    # 스풀 폴더가 임시 폴더를 가리키도록 LOCALAPPDATA를 바꾼 뒤 임포트
+    from PySide6.QtCore import QCoreApplication
+    from printer_utils.cffi_defs import set_backend
+    from printer_utils.fake_backend import FakeSmartComm
+    from utils.print_manager import PrintManager
+
+    latency = {
+        "SmartComm_OpenDevice2": args.open_latency,
+        "SmartComm_DrawImage": (args.draw_latency, args.draw_latency * args.jitter),
+        "SmartComm_Print": (args.print_latency, args.print_latency * args.jitter),
+        "SmartComm_GetStatus": 0.002,
+    }
+    failure_rate = {"SmartComm_Print": args.fail_rate}
+    device_ids = [f"SIM#{index + 1:04d}" for index in range(args.printers)]
+    fake = FakeSmartComm(device_ids, latency=latency, failure_rate=failure_rate, seed=args.seed)
+    set_backend(fake)
+
+    app = QCoreApplication.instance() or QCoreApplication([])
+    photo = make_photo(os.path.join(os.environ["LOCALAPPDATA"], "bench_photo.jpg"))
+
+    finished, failed = [], []
+    log = io.StringIO()
+    output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(log)
+
+    with output:
+        manager = PrintManager()
+        manager.scheduler.job_finished.connect(finished.append)
+        manager.scheduler.job_failed.connect(lambda job, message: failed.append(job))
+        manager.render_worker.job_failed.connect(lambda job, message: failed.append(job))
+
+        started = time.perf_counter()
+        for index in range(args.cards):
+            manager.print_card(photo, f"홍길동{index}")
+
+        deadline = started + args.timeout
+        while len(finished) + len(failed) < args.cards and time.perf_counter() < deadline:
+            app.processEvents()
+            time.sleep(0.001)
+        elapsed = time.perf_counter() - started
+
+        manager.shutdown()
+
+    print(f"카드 {args.cards}장, 프린터 {args.printers}대, "
+          f"인쇄 {args.print_latency * 1000:.0f} ms, 그리기 {args.draw_latency * 1000:.0f} ms, "
+          f"인쇄 실패율 {args.fail_rate:.0%}")
+    print(f"완료 {len(finished)}장, 실패 {len(failed)}장, 경과 {elapsed:.2f} s, "
+          f"처리량 {len(finished) / elapsed * 60:.1f} 장/분")
+    if len(finished) + len(failed) < args.cards:
+        print(f"경고: 제한 시간({args.timeout} s) 안에 끝나지 않은 작업이 있습니다.")
+    if not finished:
+        return
+
+    print()
+    print(f"{'단계 (ms)':<12}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}")
+    for name, start, end in STAGES:
+        values = [job.timestamps[end] - job.timestamps[start] for job in finished
+                  if start in job.timestamps and end in job.timestamps]
+        if values:
+            print(percentile_row(name, values))
+
+    retried = sum(1 for job in finished if job.attempts > 1)
+    if retried:
+        print(f"\n재시도 후 완료: {retried}장, 프린터별 인쇄 수: "
+              f"{ {device_id: fake.printed.count(device_id) for device_id in device_ids} }")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="인쇄 파이프라인 지연 시간 벤치마크")
+    parser.add_argument("--cards", type=int, default=50, help="인쇄할 카드 수")
+    parser.add_argument("--printers", type=int, default=1, help="시뮬레이션할 프린터 수")
+    parser.add_argument("--print-latency", type=float, default=0.2, help="SmartComm_Print 지연 (초)")
+    parser.add_argument("--draw-latency", type=float, default=0.02, help="SmartComm_DrawImage 지연 (초)")
+    parser.add_argument("--open-latency", type=float, default=0.05, help="SmartComm_OpenDevice2 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.1, help="지연 시간 편차 (평균 대비 비율)")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="SmartComm_Print 실패 확률")
+    parser.add_argument("--seed", type=int, default=0, help="지연/실패 난수 시드")
+    parser.add_argument("--timeout", type=float, default=600, help="최대 대기 시간 (초)")
+    parser.add_argument("--verbose", action="store_true", help="PrintManager 로그 출력")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.environ["LOCALAPPDATA"] = work_dir
+        run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+/*
+ * SmartComm2 인터페이스의 최소 구현 (Linux 벤치마크용)
+ *
+ * 실제 프린터 동작 없이 인자만 받고 바로 반환하므로,
+ * bench_cffi_modes.py에서 cffi 호출 자체의 비용만 측정할 수 있다.
+ *
+ *   cc -shared -fPIC -O2 -o libSmartComm2.so smartcomm_stub.c
+ */
+#include <stddef.h>
+#include <string.h>
+#include <wchar.h>
+
+#define MAX_SMART_PRINTER 32
+
+typedef void* HSMART;
+typedef void* RECT;
+typedef unsigned int DWORD;
+typedef unsigned char BYTE;
+
+typedef struct {
+    wchar_t name[128];
+    wchar_t id[64];
+    wchar_t dev[64];
+    wchar_t desc[256];
+    int pid;
+} SMART_PRINTER_ITEM;
+
+typedef struct {
+    int n;
+    SMART_PRINTER_ITEM item[MAX_SMART_PRINTER];
+} SMART_PRINTER_LIST;
+
+typedef struct tagBITMAPINFO BITMAPINFO;
+typedef struct DRAWTEXT2INFO DRAWTEXT2INFO;
+
+static size_t last_path_len;
+
+int SmartComm_GetDeviceList2(SMART_PRINTER_LIST* pDevList)
+{
+    pDevList->n = 1;
+    wcscpy(pDevList->item[0].id, L"STUB#0001");
+    wcscpy(pDevList->item[0].name, L"STUB#0001");
+    return 0;
+}
+
+int SmartComm_OpenDevice2(HSMART* pHandle, wchar_t* szDevice, int nDevType)
+{
+    *pHandle = (HSMART)1;
+    return 0;
+}
+
+int SmartComm_DrawImage(HSMART hHandle, unsigned char page, unsigned char panel,
+                        int x, int y, int cx, int cy, wchar_t* szImgPath, RECT* prcArea)
+{
+    last_path_len = wcslen(szImgPath);
+    return 0;
+}
+
+int SmartComm_GetPreviewBitmap(HSMART hHandle, unsigned char page, BITMAPINFO** const ppbi)
+{
+    *ppbi = NULL;
+    return -1;
+}
+
+int SmartComm_Print(HSMART hHandle) { return 0; }
+
+int SmartComm_CloseDevice(HSMART hHandle) { return 0; }
+
+int SmartComm_GetStatus(HSMART hHandle, DWORD* pStatus)
+{
+    *pStatus = 0;
+    return 0;
+}
+
+int SmartComm_DrawText(HSMART hHandle, BYTE page, BYTE panel, int x, int y,
+                       wchar_t* szFontName, int nFontSize, BYTE nFontStyle,
+                       wchar_t* szText, RECT* prcArea)
+{
+    last_path_len = wcslen(szText);
+    return 0;
+}
+
+int SmartComm_DrawText2(HSMART hHandle, BYTE page, BYTE panel,
+                        DRAWTEXT2INFO* pdt2info, wchar_t* szText)
+{
+    last_path_len = wcslen(szText);
+    return 0;
+}
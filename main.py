@@ -9,6 +9,7 @@ from screens.splash_screen import SplashScreen
 from screens.photo_screen import PhotoScreen
 from screens.info_screen import InfoScreen
 from utils.temp_path import cleanup_temp_files
+from printer_utils.cffi_defs import preload_backend
 
 class KioskApp(QMainWindow):
     def __init__(self):
@@ -44,9 +45,17 @@ class KioskApp(QMainWindow):
         try:
             # 카메라 자원 해제
             if hasattr(self, 'photo_screen') and hasattr(self.photo_screen, 'webcam'):
+                # 캡처 스레드가 카메라를 읽는 중에 해제하지 않도록 먼저 종료
+                if getattr(self.photo_screen.webcam, 'capture_thread', None) is not None:
+                    self.photo_screen.webcam.capture_thread.stop()
                 if hasattr(self.photo_screen.webcam, 'camera'):
                     release_camera(self.photo_screen.webcam.camera)
-            
+
+            # 진행 중인 발급 처리를 마친 뒤 프린터 세션 닫기
+            if hasattr(self, 'info_screen'):
+                self.info_screen.issue_pipeline.shutdown()
+                self.info_screen.print_manager.shutdown()
+
             # 모든 임시 파일 정리
             cleanup_temp_files()
                     
@@ -57,6 +66,8 @@ class KioskApp(QMainWindow):
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    # 스플래시 화면이 뜨는 동안 프린터 DLL을 백그라운드에서 로드
+    preload_backend()
     window = KioskApp()
     window.show()
     sys.exit(app.exec())
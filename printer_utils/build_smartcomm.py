@@ -0,0 +1,66 @@
+"""SmartComm2 API 모드(out-of-line) cffi 모듈 빌드 스크립트
+
+cffi_defs.CDEF 선언으로 C 확장 모듈(printer_utils/_smartcomm_api)을 만들어 두면
+실행할 때마다 cdef를 해석하지 않고, 함수 호출도 libffi를 거치지 않고 바로 호출된다.
+모듈이 없으면 cffi_defs는 자동으로 ABI 모드(dlopen)를 사용한다.
+
+사용법 (프로젝트 루트에서):
+    python -m printer_utils.build_smartcomm
+    python -m printer_utils.build_smartcomm --lib-dir resources --lib SmartComm2
+
+Windows에서는 SmartComm2.dll과 함께 링크용 SmartComm2.lib가 lib-dir에 있어야 하며,
+실행 시 SmartComm2.dll을 찾을 수 있어야 한다 (resources 폴더 또는 PATH).
+"""
+import argparse
+import os
+from cffi import FFI
+from printer_utils.cffi_defs import CDEF
+
+MODULE_NAME = "printer_utils._smartcomm_api"
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESOURCES_DIR = os.path.join(ROOT_DIR, "resources")
+
+
+def make_builder(module_name=MODULE_NAME, lib_dir=RESOURCES_DIR, lib_name="SmartComm2"):
+    """SmartComm 선언으로 API 모드 FFI 빌더 생성
+
+    헤더 파일이 따로 없으므로 cdef에 쓴 선언을 그대로 C 소스로 사용한다.
+    """
+    ffibuilder = FFI()
+    ffibuilder.cdef(CDEF)
+
+    extra_link_args = []
+    if os.name != "nt":
+        # 빌드한 모듈 옆(또는 lib_dir)의 공유 라이브러리를 찾도록 rpath 지정
+        extra_link_args.append(f"-Wl,-rpath,{os.path.abspath(lib_dir)}")
+
+    ffibuilder.set_source(
+        module_name,
+        "#include <stddef.h>\n" + CDEF,
+        libraries=[lib_name],
+        library_dirs=[lib_dir],
+        extra_link_args=extra_link_args,
+    )
+    return ffibuilder
+
+
+def build(module_name=MODULE_NAME, lib_dir=RESOURCES_DIR, lib_name="SmartComm2", tmpdir=ROOT_DIR, verbose=False):
+    """API 모드 모듈을 컴파일하고 만들어진 확장 모듈 경로를 반환"""
+    ffibuilder = make_builder(module_name, lib_dir, lib_name)
+    return ffibuilder.compile(tmpdir=tmpdir, verbose=verbose)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SmartComm2 API 모드 cffi 모듈 빌드")
+    parser.add_argument("--lib-dir", default=RESOURCES_DIR, help="SmartComm2 라이브러리 폴더")
+    parser.add_argument("--lib", default="SmartComm2", help="링크할 라이브러리 이름")
+    parser.add_argument("--verbose", action="store_true", help="컴파일러 출력 표시")
+    args = parser.parse_args()
+
+    module_path = build(lib_dir=args.lib_dir, lib_name=args.lib, verbose=args.verbose)
+    print(f"빌드 완료: {module_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+import os
+import threading
+from collections import namedtuple
+from .config_reader import read_config
+from .card_renderer import load_font, load_background, get_resource_path, point_to_pixel
+from .cffi_defs import PANELID_COLOR, PANELID_BLACK, PANELID_OVERLAY, PANELID_UV
+
+# 레이아웃 파일을 지정하지 않았을 때 사용하는 기본 카드 디자인
+# (카드 58mm x 90mm = 635px x 1027px @ 300 DPI, 사진 40mm x 40mm 가로 중앙)
+DEFAULT_LAYOUT = {
+    "card.width": 635,
+    "card.height": 1027,
+    "card.dpi": 300,
+    "card.background": "gurye_base_card.jpg",
+    "card.panel": "color",
+    "image.photo.x": "center",
+    "image.photo.y": 250,
+    "image.photo.width": 438,
+    "image.photo.height": 438,
+    "text.name.x": "center",
+    "text.name.y": 738,
+    "text.name.width": 438,
+    "text.name.height": 100,
+    "text.name.font": "malgun.ttf,arial.ttf",
+    "text.name.size": 16,
+    "text.name.color": "#000000",
+    "text.name.align": "center",
+    "text.name.valign": "middle",
+}
+
+PANELS = {
+    "color": PANELID_COLOR,
+    "black": PANELID_BLACK,
+    "overlay": PANELID_OVERLAY,
+    "uv": PANELID_UV,
+}
+
+# 정렬 방식 -> Pillow 텍스트 앵커 문자
+H_ANCHORS = {"left": "l", "center": "m", "right": "r"}
+V_ANCHORS = {"top": "t", "middle": "m", "bottom": "b"}
+
+# 컴파일된 렌더링 계획 (카드마다 값만 바꿔 끼워 재사용)
+RenderPlan = namedtuple("RenderPlan", "width height dpi panel background elements")
+ImageSlot = namedtuple("ImageSlot", "key box")
+TextSlot = namedtuple("TextSlot", "key anchor_point anchor font color")
+
+_plan_cache = {}
+_plan_lock = threading.Lock()
+
+
+def read_layout(file_path):
+    """카드 레이아웃 파일을 읽어 기본 레이아웃에 덮어쓴 딕셔너리 반환
+
+    레이아웃 파일은 config.txt와 같은 "키=값" 형식이며 다음 키를 사용한다.
+        card.width / card.height / card.dpi / card.background / card.panel
+        image.<필드>.x / y / width / height
+        text.<필드>.x / y / width / height / font / size / color / align / valign
+    x에 center를 쓰면 카드 가로 중앙에 배치한다.
+
+    Raises:
+        ValueError: 레이아웃 파일이 있지만 읽을 수 없는 경우
+            (다른 디자인의 카드가 기본 레이아웃으로 인쇄되지 않도록 함)
+    """
+    layout = dict(DEFAULT_LAYOUT)
+    if file_path and os.path.exists(file_path):
+        try:
+            layout.update(read_config(file_path, strict=True))
+        except (OSError, UnicodeDecodeError) as e:
+            raise ValueError(f"레이아웃 파일을 읽을 수 없습니다: {file_path} ({e})") from e
+    elif file_path:
+        print(f"레이아웃 파일을 찾을 수 없어 기본 레이아웃을 사용합니다: {file_path}")
+    return layout
+
+
+def _element_keys(layout, kind):
+    """레이아웃에 정의된 image/text 필드 이름을 정의 순서대로 반환"""
+    keys = []
+    for key in layout:
+        parts = key.split(".")
+        if len(parts) == 3 and parts[0] == kind and parts[1] not in keys:
+            keys.append(parts[1])
+    return keys
+
+
+def _resolve_box(layout, prefix, card_width):
+    """필드의 (x, y, width, height) 영역 계산"""
+    width = int(layout[f"{prefix}.width"])
+    height = int(layout[f"{prefix}.height"])
+    x = layout.get(f"{prefix}.x", 0)
+    if x == "center":
+        x = (card_width - width) // 2
+    y = int(layout.get(f"{prefix}.y", 0))
+    return int(x), y, width, height
+
+
+def _parse_color(value):
+    """#RRGGBB 형식의 색상을 RGB 튜플로 변환"""
+    value = str(value).lstrip("#")
+    return tuple(int(value[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def compile_layout(layout):
+    """레이아웃 딕셔너리를 카드마다 재사용할 RenderPlan으로 변환
+
+    배경 이미지와 폰트를 미리 불러오고 모든 좌표와 정렬 기준점을 계산해 두므로
+    카드 한 장을 그릴 때는 필드 값만 대입하면 된다.
+    """
+    width = int(layout["card.width"])
+    height = int(layout["card.height"])
+    dpi = int(layout["card.dpi"])
+    panel = PANELS[str(layout["card.panel"]).lower()]
+
+    background_path = layout.get("card.background")
+    if background_path and not os.path.isabs(background_path):
+        background_path = get_resource_path(background_path)
+    background = load_background(background_path, (width, height))
+
+    elements = []
+    for key in _element_keys(layout, "image"):
+        box = _resolve_box(layout, f"image.{key}", width)
+        elements.append(ImageSlot(key, box))
+
+    for key in _element_keys(layout, "text"):
+        prefix = f"text.{key}"
+        x, y, box_width, box_height = _resolve_box(layout, prefix, width)
+        align = layout.get(f"{prefix}.align", "left")
+        valign = layout.get(f"{prefix}.valign", "top")
+
+        # 정렬 방식에 맞는 기준점을 미리 계산 (Pillow anchor 사용)
+        anchor_x = {"left": x, "center": x + box_width / 2, "right": x + box_width}[align]
+        anchor_y = {"top": y, "middle": y + box_height / 2, "bottom": y + box_height}[valign]
+        anchor = H_ANCHORS[align] + V_ANCHORS[valign]
+
+        font_files = [name.strip() for name in str(layout[f"{prefix}.font"]).split(",")]
+        font = load_font(font_files, point_to_pixel(layout[f"{prefix}.size"], dpi))
+        color = _parse_color(layout.get(f"{prefix}.color", "#000000"))
+        elements.append(TextSlot(key, (anchor_x, anchor_y), anchor, font, color))
+
+    return RenderPlan(width, height, dpi, panel, background, tuple(elements))
+
+
+def get_image_size(plan, key):
+    """이미지 필드가 카드에 찍히는 크기 (너비, 높이) 반환 (필드가 없으면 None)"""
+    for element in plan.elements:
+        if element.key == key and hasattr(element, "box"):
+            return element.box[2], element.box[3]
+    return None
+
+
+def get_layout_path():
+    """config.txt의 card_layout 항목에 지정된 레이아웃 파일 경로 (기본: resources/card_layout.txt)"""
+    layout_file = read_config().get("card_layout", "card_layout.txt")
+    if not os.path.isabs(layout_file):
+        layout_file = get_resource_path(layout_file)
+    return layout_file
+
+
+def get_render_plan(file_path=None):
+    """레이아웃 파일을 컴파일한 RenderPlan 반환 (파일이 바뀌지 않으면 캐시 재사용)"""
+    if file_path is None:
+        file_path = get_layout_path()
+    mtime = os.path.getmtime(file_path) if os.path.exists(file_path) else None
+    key = (file_path, mtime)
+
+    with _plan_lock:
+        plan = _plan_cache.get(key)
+        if plan is None:
+            plan = compile_layout(read_layout(file_path))
+            _plan_cache.clear()
+            _plan_cache[key] = plan
+        return plan
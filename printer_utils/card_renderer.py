@@ -0,0 +1,115 @@
+import os
+import sys
+import threading
+from PIL import Image, ImageDraw, ImageFont
+
+CARD_DPI = 300
+
+# 배경/폰트는 한 번만 불러와 재사용
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def get_resource_path(filename):
+    """resources 폴더의 파일 경로 반환 (PyInstaller 번들 경로 처리)"""
+    if hasattr(sys, '_MEIPASS'):
+        base_path = sys._MEIPASS
+    else:
+        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_path, "resources", filename)
+
+
+def point_to_pixel(point_size, dpi=CARD_DPI):
+    """폰트 포인트 크기를 인쇄 해상도의 픽셀 크기로 변환"""
+    return round(point_size * dpi / 72)
+
+
+def load_font(font_files, pixel_size):
+    """후보 폰트 파일 중 처음으로 불러지는 폰트 반환 (캐시 사용)"""
+    key = ("font", tuple(font_files), pixel_size)
+    with _cache_lock:
+        if key in _cache:
+            return _cache[key]
+
+    font = None
+    font_dir = os.path.join(os.environ.get("WINDIR", "C:\\Windows"), "Fonts")
+    for font_file in font_files:
+        for path in (font_file, os.path.join(font_dir, font_file)):
+            try:
+                font = ImageFont.truetype(path, pixel_size)
+                break
+            except OSError:
+                continue
+        if font is not None:
+            break
+
+    if font is None:
+        print(f"폰트를 찾을 수 없어 기본 폰트를 사용합니다: {font_files}")
+        font = ImageFont.load_default(pixel_size)
+
+    with _cache_lock:
+        _cache[key] = font
+    return font
+
+
+def load_background(path, size):
+    """카드 배경을 카드 크기로 변환하여 반환 (캐시 사용, 없으면 흰 배경)"""
+    key = ("background", path, size)
+    with _cache_lock:
+        if key in _cache:
+            return _cache[key]
+
+    if path and os.path.exists(path):
+        with Image.open(path) as source:
+            background = source.convert("RGB").resize(size, Image.LANCZOS)
+    else:
+        print(f"배경 이미지를 찾을 수 없어 흰 배경을 사용합니다: {path}")
+        background = Image.new("RGB", size, (255, 255, 255))
+
+    with _cache_lock:
+        _cache[key] = background
+    return background
+
+
+def render_card(plan, fields):
+    """컴파일된 레이아웃(RenderPlan)에 필드 값을 대입하여 카드 전체 이미지 생성
+
+    Args:
+        plan (RenderPlan): card_layout.compile_layout()으로 만든 렌더링 계획
+        fields (dict): 필드 이름 -> 값 (이미지 필드는 파일 경로 또는 PIL Image,
+            텍스트 필드는 문자열)
+
+    Returns:
+        PIL.Image: RGB 카드 이미지 (plan.width x plan.height)
+    """
+    card = plan.background.copy()
+    draw = None
+
+    for element in plan.elements:
+        value = fields.get(element.key)
+        if value is None or value == "":
+            continue
+
+        if hasattr(element, "box"):
+            x, y, width, height = element.box
+            if isinstance(value, Image.Image):
+                image = value.convert("RGB")
+            else:
+                with Image.open(value) as source:
+                    image = source.convert("RGB")
+            if image.size != (width, height):
+                image = image.resize((width, height), Image.LANCZOS)
+            card.paste(image, (x, y))
+        else:
+            if draw is None:
+                draw = ImageDraw.Draw(card)
+            draw.text(element.anchor_point, str(value), font=element.font,
+                      fill=element.color, anchor=element.anchor)
+
+    return card
+
+
+def save_card(card, path, dpi=CARD_DPI):
+    """프린터에 보낼 카드 이미지를 무손실 BMP로 저장"""
+    card.save(path, format="BMP", dpi=(dpi, dpi))
+    return path
@@ -1,11 +1,11 @@
 import sys
 import os
-from pathlib import Path
+import threading
 from cffi import FFI
+from .config_reader import read_config
 
-ffi = FFI()
-
-ffi.cdef("""
+# SmartComm2 API 선언 (ABI 모드 dlopen과 build_smartcomm.py의 API 모드 빌드에서 공통 사용)
+CDEF = """
 #define MAX_SMART_PRINTER 32
          
 #define SMART_OPENDEVICE_BYID 0
@@ -27,6 +27,7 @@ typedef unsigned int DWORD;
 typedef int LONG;
 typedef unsigned short WORD;
 typedef unsigned char BYTE;
+typedef wchar_t WCHAR;
 
 typedef struct {
     wchar_t name[128];
@@ -121,26 +122,8 @@ int SmartComm_DrawText2(
     wchar_t* szText
 );
 
-""")
-
-# PyInstaller 번들 경로 처리
-if hasattr(sys, '_MEIPASS'):
-    base_path = sys._MEIPASS
-else:
-    base_path = os.path.dirname(os.path.abspath(__file__))
-    base_path = os.path.dirname(base_path)  # printer_utils에서 한 단계 상위로
-
-dll_path = os.path.join(base_path, "resources", "SmartComm2.dll")
-print(f"DLL 경로: {dll_path}")
-print(f"DLL 파일 존재 여부: {os.path.exists(dll_path)}")
-
-try:
-    lib = ffi.dlopen(dll_path)
-    print("DLL 로드 성공")
-except Exception as e:
-    print(f"DLL 로드 실패: {e}")
-    lib = None
-    
+"""
+
 MAX_SMART_PRINTER = 32
 SMART_OPENDEVICE_BYID = 0
 SMART_OPENDEVICE_BYDESC = 1
@@ -149,4 +132,164 @@ PAGE_BACK = 1
 PANELID_COLOR = 1
 PANELID_BLACK = 2
 PANELID_OVERLAY = 4
-PANELID_UV = 8
\ No newline at end of file
+PANELID_UV = 8
+
+# SmartComm_GetStatus 상태 워드의 플리퍼 비트 (기존 check_flipper 예제 코드의 값)
+# 상태 워드의 다른 비트는 SDK 헤더로 확인되지 않아 정의하지 않으며, 인쇄 가능 여부
+# 판단(status_monitor)에는 상태 워드 비트를 사용하지 않는다.
+STATUS_FLIPPER = 1 << 3
+
+# 사용할 수 있는 백엔드 (환경 변수 SMARTCOMM_BACKEND 또는 config.txt의 printer_backend)
+#   compiled: build_smartcomm.py로 빌드한 API 모드 확장 모듈 (기본값, 없으면 dll 사용)
+#   dll: resources/SmartComm2.dll을 ABI 모드로 dlopen
+#   simulator: 프린터 없이 동작하는 메모리 내 가짜 백엔드
+BACKEND_DLL = "dll"
+BACKEND_COMPILED = "compiled"
+BACKEND_SIMULATOR = "simulator"
+
+# 임포트만으로는 cdef 해석이나 DLL 로드를 하지 않고, 첫 호출(또는 preload_backend) 때 로드
+_load_lock = threading.RLock()
+_abi_ffi = None
+_loaded = None  # (ffi, 백엔드) - 로드 전에는 None
+
+# 테스트용 가짜 백엔드 등 SmartComm 호출 대상을 교체할 때 사용
+_backend_override = None
+
+
+def get_dll_path():
+    """SmartComm2.dll 경로 반환 (PyInstaller 번들 경로 처리)"""
+    if hasattr(sys, '_MEIPASS'):
+        base_path = sys._MEIPASS
+    else:
+        base_path = os.path.dirname(os.path.abspath(__file__))
+        base_path = os.path.dirname(base_path)  # printer_utils에서 한 단계 상위로
+    return os.path.join(base_path, "resources", "SmartComm2.dll")
+
+
+def get_backend_name():
+    """설정된 백엔드 이름 반환 (환경 변수가 config.txt보다 우선)"""
+    name = os.environ.get("SMARTCOMM_BACKEND") or read_config().get("printer_backend", BACKEND_COMPILED)
+    return str(name).strip().lower()
+
+
+def _get_abi_ffi():
+    """ABI 모드 FFI 객체 (cdef는 처음 한 번만 해석)"""
+    global _abi_ffi
+    with _load_lock:
+        if _abi_ffi is None:
+            abi_ffi = FFI()
+            abi_ffi.cdef(CDEF)
+            _abi_ffi = abi_ffi
+        return _abi_ffi
+
+
+def _load_dll():
+    dll_path = get_dll_path()
+    print(f"DLL 경로: {dll_path}")
+    print(f"DLL 파일 존재 여부: {os.path.exists(dll_path)}")
+
+    abi_ffi = _get_abi_ffi()
+    try:
+        lib = abi_ffi.dlopen(dll_path)
+        print("DLL 로드 성공")
+    except Exception as e:
+        print(f"DLL 로드 실패: {e}")
+        lib = None
+    return abi_ffi, lib
+
+
+def _load_compiled():
+    if hasattr(os, "add_dll_directory"):
+        # 확장 모듈이 링크한 SmartComm2.dll을 resources 폴더에서 찾도록 함
+        dll_dir = os.path.dirname(get_dll_path())
+        if os.path.isdir(dll_dir):
+            os.add_dll_directory(dll_dir)
+    try:
+        from . import _smartcomm_api
+    except ImportError as e:
+        print(f"컴파일된 SmartComm 모듈을 사용할 수 없어 ABI 모드로 DLL을 엽니다: {e}")
+        return _load_dll()
+    print("컴파일된 SmartComm 모듈 로드 성공")
+    return _smartcomm_api.ffi, _smartcomm_api.lib
+
+
+def _load_simulator():
+    from .fake_backend import FakeSmartComm
+    print("SmartComm 시뮬레이터를 사용합니다.")
+    return _get_abi_ffi(), FakeSmartComm()
+
+
+_LOADERS = {
+    BACKEND_DLL: _load_dll,
+    BACKEND_COMPILED: _load_compiled,
+    BACKEND_SIMULATOR: _load_simulator,
+}
+
+
+def load_backend(name=None):
+    """SmartComm 백엔드를 로드 (이미 로드되었으면 그대로 반환)
+
+    Args:
+        name (str): dll, compiled, simulator 중 하나 (None이면 설정값 사용)
+
+    Returns:
+        tuple: (ffi, 백엔드)
+    """
+    global _loaded
+    loaded = _loaded
+    if loaded is not None:
+        return loaded
+
+    with _load_lock:
+        if _loaded is None:
+            name = name or get_backend_name()
+            loader = _LOADERS.get(name)
+            if loader is None:
+                print(f"알 수 없는 프린터 백엔드({name}), DLL을 사용합니다.")
+                loader = _load_dll
+            _loaded = loader()
+        return _loaded
+
+
+def preload_backend():
+    """스플래시 화면 동안 백그라운드 스레드에서 백엔드를 미리 로드"""
+    thread = threading.Thread(target=load_backend, name="smartcomm-loader", daemon=True)
+    thread.start()
+    return thread
+
+
+def set_backend(backend):
+    """SmartComm 함수 호출 대상을 교체 (None이면 설정된 백엔드 사용)
+
+    교체한 백엔드는 ABI 모드 ffi로 만든 구조체를 받는다.
+    """
+    global _backend_override
+    _backend_override = backend
+
+
+def get_backend():
+    """현재 SmartComm 함수 호출 대상을 반환 (처음 호출할 때 로드)"""
+    if _backend_override is not None:
+        return _backend_override
+    return load_backend()[1]
+
+
+def get_ffi():
+    """현재 백엔드와 짝이 맞는 FFI 객체 반환 (구조체/문자열 생성용)"""
+    if _backend_override is not None:
+        return _get_abi_ffi()
+    return load_backend()[0]
+
+
+class _LazyFFI:
+    """get_ffi()로 속성 접근을 넘기는 대리 객체
+
+    `from .cffi_defs import ffi`로 가져가도 임포트 시점에는 아무것도 로드하지 않고,
+    ffi.new() 등을 처음 호출할 때 백엔드에 맞는 FFI 객체를 사용하게 한다.
+    """
+
+    def __getattr__(self, name):
+        return getattr(get_ffi(), name)
+
+
+ffi = _LazyFFI()
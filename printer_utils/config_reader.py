@@ -1,7 +1,12 @@
 import os
 
-def read_config(file_path=None):
-    """config.txt 파일을 읽어서 딕셔너리로 반환"""
+def read_config(file_path=None, strict=False):
+    """config.txt 파일을 읽어서 딕셔너리로 반환
+
+    Args:
+        file_path (str): 읽을 파일 경로 (기본: 프로젝트 루트의 config.txt)
+        strict (bool): True면 읽기 오류를 빈 설정으로 넘기지 않고 그대로 발생
+    """
     if file_path is None:
         # 스크립트 파일의 디렉토리 경로
         script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -12,9 +17,13 @@ def read_config(file_path=None):
     
     config = {}
     try:
-        with open(file_path, 'r') as f:
+        # 한글 주석이 있으므로 시스템 로캘(cp949)이 아닌 UTF-8로 읽음 (메모장 BOM 허용)
+        with open(file_path, 'r', encoding='utf-8-sig') as f:
             for line in f:
                 line = line.strip()
+                # 주석 줄은 건너뜀
+                if line.startswith('#'):
+                    continue
                 if line and '=' in line:
                     key, value = line.split('=', 1)
                     key = key.strip()
@@ -30,5 +39,7 @@ def read_config(file_path=None):
                     config[key] = value
         return config
     except Exception as e:
+        if strict:
+            raise
         print(f"설정 파일 읽기 오류: {e}")
         return {}
\ No newline at end of file
@@ -1,4 +1,4 @@
-from .cffi_defs import ffi, lib
+from .cffi_defs import ffi, get_backend, STATUS_FLIPPER
 from pathlib import Path
 import ctypes
 import os
@@ -9,7 +9,7 @@ def get_device_list():
     # SMART_PRINTER_LIST 구조체 메모리 할당
     printer_list = ffi.new("SMART_PRINTER_LIST *")
     # DLL의 SmartComm_GetDeviceList2 함수를 호출하여 프린터 목록을 채움
-    result = lib.SmartComm_GetDeviceList2(printer_list)
+    result = get_backend().SmartComm_GetDeviceList2(printer_list)
     return result, printer_list
 
 # 프린터 리스트에서 특정 인덱스에 해당하는 프린터의 ID를 반환하는 함수
@@ -20,8 +20,11 @@ def get_device_id(printer_list, index):
 def open_device(device_id, open_device_by):
     # HSMART 핸들용 메모리 할당
     device_handle = ffi.new("HSMART *")
+    # 문자열로 저장해 둔 ID는 wchar_t 배열로 변환 (세션 재연결 시 사용)
+    if isinstance(device_id, str):
+        device_id = ffi.new("wchar_t[]", device_id)
     # DLL의 SmartComm_OpenDevice2 함수를 호출하여 장치를 열고 핸들을 받아옴
-    result = lib.SmartComm_OpenDevice2(device_handle, device_id, open_device_by)
+    result = get_backend().SmartComm_OpenDevice2(device_handle, device_id, open_device_by)
     return result, device_handle[0]
 
 # 프린터에 이미지를 출력하기 위한 함수
@@ -50,7 +53,7 @@ def draw_image(device_handle, page, panel, x, y, cx, cy, image_filename):
     rect_area = ffi.new("RECT *")
     
     # DLL의 SmartComm_DrawImage 함수를 호출하여 지정 영역에 이미지를 그림
-    result = lib.SmartComm_DrawImage(device_handle, page, panel, x, y, cx, cy, image, rect_area)
+    result = get_backend().SmartComm_DrawImage(device_handle, page, panel, x, y, cx, cy, image, rect_area)
     
     print(f"SmartComm_DrawImage 결과: {result}")
     
@@ -61,24 +64,24 @@ def get_preview_bitmap(device_handle, page):
     # BITMAPINFO 구조체에 대한 포인터 메모리 할당
     p_bitmap_info = ffi.new("BITMAPINFO **")
     # DLL의 SmartComm_GetPreviewBitmap 함수를 호출하여 비트맵 정보를 가져옴
-    result = lib.SmartComm_GetPreviewBitmap(device_handle, page, p_bitmap_info)
+    result = get_backend().SmartComm_GetPreviewBitmap(device_handle, page, p_bitmap_info)
     return result, p_bitmap_info[0]
 
 # 프린터 장치에 인쇄 명령을 보내는 함수
 def print_image(device_handle):
-    result = lib.SmartComm_Print(device_handle)
+    result = get_backend().SmartComm_Print(device_handle)
     return result
 
 # 열려있는 프린터 장치의 연결을 종료하는 함수
 def close_device(device_handle):
-    lib.SmartComm_CloseDevice(device_handle)
+    get_backend().SmartComm_CloseDevice(device_handle)
 
 def get_printer_status(device_handle):
     """
     SmartComm_GetStatus 함수를 호출하여 프린터 상태를 가져오고, 플리퍼 장착 여부를 확인하는 함수
     """
     status = ffi.new("DWORD *")  # DWORD 타입 변수 생성
-    result = lib.SmartComm_GetStatus(device_handle, status)
+    result = get_backend().SmartComm_GetStatus(device_handle, status)
 
     if result != 0:
         print(f"SmartComm_GetStatus 호출 실패 (오류 코드: {result})")
@@ -87,7 +90,7 @@ def get_printer_status(device_handle):
     status_value = status[0]
 
     # 플리퍼 옵션 확인 (상태 값의 특정 비트 확인 필요)
-    is_flipper_installed = (status_value & (1 << 3)) != 0  # 예제: 3번째 비트가 플리퍼 상태를 나타낸다고 가정
+    is_flipper_installed = (status_value & STATUS_FLIPPER) != 0
 
     return is_flipper_installed
 
@@ -154,7 +157,7 @@ def draw_text(device_handle, page, panel, x, y, font_name, font_size, font_style
     rect_area = ffi.NULL
 
     # DLL 호출
-    result = lib.SmartComm_DrawText(device_handle, page, panel, x, y, font_wchar, font_size, font_style, text_wchar, rect_area)
+    result = get_backend().SmartComm_DrawText(device_handle, page, panel, x, y, font_wchar, font_size, font_style, text_wchar, rect_area)
 
     if result != 0:
         print(f"❌ 텍스트 그리기 실패 (오류 코드: {result})")
@@ -191,7 +194,7 @@ def draw_text2(device_handle, page, panel, x, y, width, height, font_name, font_
     text_wchar = ffi.new("wchar_t[]", text.replace("\\n", "\n"))  # 개행 문자 처리
 
     # ✅ SmartComm_DrawText2 호출
-    result = lib.SmartComm_DrawText2(device_handle, page, panel, text_info, text_wchar)
+    result = get_backend().SmartComm_DrawText2(device_handle, page, panel, text_info, text_wchar)
 
     if result != 0:
         print(f"❌ SmartComm_DrawText2 호출 실패 (오류 코드: {result})")
@@ -0,0 +1,189 @@
+import random
+import time
+from collections import Counter
+from .cffi_defs import ffi, MAX_SMART_PRINTER
+
+# 가짜 백엔드가 돌려주는 일반 오류 코드
+FAKE_ERROR = -1
+
+
+class FakeSmartComm:
+    """SmartComm2.dll 없이 인쇄 파이프라인을 검증/측정하기 위한 가짜 백엔드
+
+    cffi_defs.set_backend(FakeSmartComm())로 등록하거나 SMARTCOMM_BACKEND=simulator로
+    실행하면 device_functions의 모든 호출이 이 객체로 전달된다.
+    장치 분리/재연결, 지정한 호출 실패, 함수별 지연 시간과 무작위 실패를 흉내낼 수 있다.
+
+    Args:
+        device_ids: 연결된 것으로 보고할 장치 ID 목록
+        latency (dict): 함수 이름 -> 지연 시간(초) 또는 (평균, 편차) 튜플
+        failure_rate (dict): 함수 이름 -> 실패 확률 (0.0 ~ 1.0)
+        seed: 지연/실패 난수 시드 (같은 값이면 같은 결과 재현)
+        preview_size (tuple): GetPreviewBitmap이 돌려줄 비트맵 크기 (너비, 높이)
+    """
+
+    def __init__(self, device_ids=("SMART-51#0001",), latency=None, failure_rate=None,
+                 seed=None, preview_size=(1027, 635)):
+        self.latency = dict(latency or {})
+        self.failure_rate = dict(failure_rate or {})
+        self.random = random.Random(seed)
+        self.preview_size = preview_size
+        self.previews = {}  # 핸들 번호 -> 미리보기 비트맵 메모리 (DLL 소유 메모리 흉내)
+
+        self.device_ids = list(device_ids)
+        self.unplugged = set()
+        self.handles = {}  # 핸들 번호 -> 장치 ID
+        self.next_handle = 1
+        self.calls = Counter()  # 함수 이름별 호출 횟수
+        self.pending_failures = {}  # 함수 이름 -> [오류 코드, 남은 횟수]
+        self.printed = []  # 인쇄된 장치 ID 기록
+        self.status_words = {}  # 장치 ID -> GetStatus가 돌려줄 상태 워드
+
+    # ---- 테스트 제어용 메서드 ----
+
+    def fail_next(self, func_name, code=FAKE_ERROR, count=1):
+        """지정한 함수의 다음 호출(count회)을 실패로 만듦"""
+        self.pending_failures[func_name] = [code, count]
+
+    def unplug(self, device_id):
+        """장치를 분리된 상태로 만들고 열려있던 핸들을 무효화"""
+        self.unplugged.add(device_id)
+        for handle_no, handle_device in list(self.handles.items()):
+            if handle_device == device_id:
+                del self.handles[handle_no]
+
+    def set_status(self, device_id, status_word):
+        """GetStatus가 돌려줄 상태 워드 지정 (PrinterStatus.raw에 그대로 기록됨)"""
+        self.status_words[device_id] = status_word
+
+    def plug(self, device_id):
+        """분리된 장치를 다시 연결"""
+        self.unplugged.discard(device_id)
+        if device_id not in self.device_ids:
+            self.device_ids.append(device_id)
+
+    # ---- 내부 도우미 ----
+
+    def _delay(self, func_name):
+        """설정된 만큼 호출을 지연 (실제 장치 I/O처럼 GIL을 놓고 대기)"""
+        latency = self.latency.get(func_name)
+        if not latency:
+            return
+        if isinstance(latency, tuple):
+            mean, jitter = latency
+            latency = max(0.0, self.random.gauss(mean, jitter))
+        time.sleep(latency)
+
+    def _enter(self, func_name):
+        """호출 횟수를 기록하고 예약된 실패가 있거나 무작위 실패에 걸리면 오류 코드를 반환"""
+        self.calls[func_name] += 1
+        self._delay(func_name)
+        failure = self.pending_failures.get(func_name)
+        if failure:
+            code, remaining = failure
+            if remaining <= 1:
+                del self.pending_failures[func_name]
+            else:
+                failure[1] = remaining - 1
+            return code
+        rate = self.failure_rate.get(func_name)
+        if rate and self.random.random() < rate:
+            return FAKE_ERROR
+        return 0
+
+    def _make_preview(self):
+        """24비트 bottom-up 미리보기 비트맵 (BITMAPINFO + 픽셀) 생성"""
+        width, height = self.preview_size
+        stride = ((width * 24 + 31) // 32) * 4
+        header_size = ffi.sizeof("BITMAPINFOHEADER")
+        memory = ffi.new("char[]", header_size + stride * height)
+
+        header = ffi.cast("BITMAPINFOHEADER *", memory)
+        header.biSize = header_size
+        header.biWidth = width
+        header.biHeight = height
+        header.biPlanes = 1
+        header.biBitCount = 24
+        header.biSizeImage = stride * height
+
+        # 흰색 카드 (BGR)
+        ffi.memmove(memory + header_size, b"\xff" * (stride * height), stride * height)
+        return memory
+
+    def _device_of(self, handle):
+        """핸들에 연결된 장치 ID를 반환 (무효한 핸들이면 None)"""
+        handle_no = int(ffi.cast("uintptr_t", handle))
+        return self.handles.get(handle_no)
+
+    def _handle_call(self, func_name, handle):
+        result = self._enter(func_name)
+        if result != 0:
+            return result
+        if self._device_of(handle) is None:
+            return FAKE_ERROR
+        return 0
+
+    # ---- SmartComm API ----
+
+    def SmartComm_GetDeviceList2(self, printer_list):
+        result = self._enter("SmartComm_GetDeviceList2")
+        if result != 0:
+            return result
+        plugged = [d for d in self.device_ids if d not in self.unplugged]
+        plugged = plugged[:MAX_SMART_PRINTER]
+        printer_list.n = len(plugged)
+        for index, device_id in enumerate(plugged):
+            printer_list.item[index].id = device_id
+            printer_list.item[index].name = device_id
+        return 0
+
+    def SmartComm_OpenDevice2(self, handle_ptr, device_id, open_device_by):
+        result = self._enter("SmartComm_OpenDevice2")
+        if result != 0:
+            return result
+        device_id = ffi.string(device_id)
+        if device_id not in self.device_ids or device_id in self.unplugged:
+            return FAKE_ERROR
+        handle_no = self.next_handle
+        self.next_handle += 1
+        self.handles[handle_no] = device_id
+        handle_ptr[0] = ffi.cast("HSMART", handle_no)
+        return 0
+
+    def SmartComm_CloseDevice(self, handle):
+        self.calls["SmartComm_CloseDevice"] += 1
+        handle_no = int(ffi.cast("uintptr_t", handle))
+        self.handles.pop(handle_no, None)
+        self.previews.pop(handle_no, None)
+        return 0
+
+    def SmartComm_DrawImage(self, handle, page, panel, x, y, cx, cy, image_path, rect_area):
+        return self._handle_call("SmartComm_DrawImage", handle)
+
+    def SmartComm_DrawText(self, handle, page, panel, x, y, font_name, font_size, font_style, text, rect_area):
+        return self._handle_call("SmartComm_DrawText", handle)
+
+    def SmartComm_DrawText2(self, handle, page, panel, text_info, text):
+        return self._handle_call("SmartComm_DrawText2", handle)
+
+    def SmartComm_GetPreviewBitmap(self, handle, page, bitmap_info_ptr):
+        result = self._handle_call("SmartComm_GetPreviewBitmap", handle)
+        if result == 0:
+            # 다음 호출 전까지 유효한 메모리를 핸들별로 보관 (실제 DLL과 같은 수명)
+            handle_no = int(ffi.cast("uintptr_t", handle))
+            memory = self._make_preview()
+            self.previews[handle_no] = memory
+            bitmap_info_ptr[0] = ffi.cast("BITMAPINFO *", memory)
+        return result
+
+    def SmartComm_GetStatus(self, handle, status):
+        result = self._handle_call("SmartComm_GetStatus", handle)
+        if result == 0:
+            status[0] = self.status_words.get(self._device_of(handle), 0)
+        return result
+
+    def SmartComm_Print(self, handle):
+        result = self._handle_call("SmartComm_Print", handle)
+        if result == 0:
+            self.printed.append(self._device_of(handle))
+        return result
@@ -1,41 +1,175 @@
 from .cffi_defs import ffi
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
-def bitmapinfo_to_image(bitmap_info):
-    
+BI_RGB = 0
+BI_BITFIELDS = 3
+
+# 비트 수 -> (Pillow 모드, raw 디코더 모드)
+PIL_RAW_MODES = {
+    1: ("P", "P;1"),
+    4: ("P", "P;4"),
+    8: ("P", "P"),
+    24: ("RGB", "BGR"),
+    32: ("RGB", "BGRX"),
+}
+
+# BI_BITFIELDS 32비트에서 지원하는 바이트 순서 (Pillow raw 디코더 모드와 같은 이름)
+BITFIELDS_ORDERS = ("BGRX", "RGBX", "XBGR", "XRGB")
+
+
+def _channel_order(red_mask, green_mask, blue_mask):
+    """BI_BITFIELDS 색상 마스크로 32비트 픽셀의 바이트 순서 결정 (예: "BGRX")
+
+    각 채널이 한 바이트를 통째로 차지하는 마스크만 지원한다.
+    """
+    order = ["X"] * 4
+    for channel, mask in (("R", red_mask), ("G", green_mask), ("B", blue_mask)):
+        if mask not in (0xFF, 0xFF00, 0xFF0000, 0xFF000000):
+            raise ValueError(f"지원하지 않는 색상 마스크입니다. ({channel}=0x{mask:08X})")
+        order[(mask.bit_length() - 1) // 8] = channel
+    order = "".join(order)
+    if order not in BITFIELDS_ORDERS:
+        raise ValueError(f"지원하지 않는 색상 마스크 조합입니다. ({order})")
+    return order
+
+
+def _parse_bitmapinfo(bitmap_info):
+    """BITMAPINFO 헤더를 해석하여 픽셀 메모리 위치와 형식 정보를 반환
+
+    Returns:
+        dict: width, height, bit_count, stride, bottom_up, pixels(버퍼),
+            palette(RGBQUAD 배열 또는 None), channel_order(32비트 바이트 순서, 예: "BGRX")
+    """
     bm_info = ffi.cast("BITMAPINFO *", bitmap_info)
 
     header = bm_info.bmiHeader
     width = header.biWidth
-    height = header.biHeight
+    height = abs(header.biHeight)
     bit_count = header.biBitCount
-    size_image = header.biSizeImage
 
-    # 픽셀 데이터 시작 오프셋 결정
-    if bit_count > 8:
-        offset = header.biSize
-    else:
-        num_colors = header.biClrUsed if header.biClrUsed != 0 else (1 << bit_count)
-        offset = header.biSize + num_colors * ffi.sizeof("RGBQUAD")
-    
+    if bit_count not in PIL_RAW_MODES:
+        raise ValueError(f"{bit_count}비트 이미지는 지원하지 않습니다.")
+    if header.biCompression not in (BI_RGB, BI_BITFIELDS):
+        raise ValueError(f"압축된 비트맵은 지원하지 않습니다. (biCompression={header.biCompression})")
+
     bm_ptr = ffi.cast("char *", bm_info)
-    pixel_data_ptr = bm_ptr + offset
-
-    if size_image == 0:
-        row_bytes = ((width * bit_count + 31) // 32) * 4
-        size_image = row_bytes * abs(height)
-
-    pixel_data = ffi.buffer(pixel_data_ptr, size_image)[:]
-
-    if bit_count == 24:
-        try:
-            img = Image.frombuffer("RGB", (width, abs(height)), pixel_data, "raw", "BGR", 0, 1)
-            if header.biHeight > 0:
-                img = img.transpose(Image.FLIP_TOP_BOTTOM)
-            return img
-        except Exception as e:
-            print("이미지 변환 중 오류 발생:", e)
-            return None
+    offset = header.biSize
+
+    channel_order = PIL_RAW_MODES[bit_count][1] if bit_count == 32 else None
+    if header.biCompression == BI_BITFIELDS:
+        if bit_count != 32:
+            raise ValueError(f"{bit_count}비트 BI_BITFIELDS 비트맵은 지원하지 않습니다.")
+        # 색상 마스크 3개(DWORD, R/G/B 순)는 BITMAPINFOHEADER 바로 뒤에 있음
+        # (V4/V5 헤더는 헤더 안의 같은 위치에 들어 있음)
+        header_size = ffi.sizeof("BITMAPINFOHEADER")
+        masks = ffi.cast("DWORD *", bm_ptr + header_size)
+        channel_order = _channel_order(masks[0], masks[1], masks[2])
+        if header.biSize == header_size:
+            offset += 3 * ffi.sizeof("DWORD")
+
+    # 8비트 이하는 헤더 뒤에 팔레트(RGBQUAD 배열)가 이어짐
+    palette = None
+    if bit_count <= 8:
+        num_colors = header.biClrUsed if header.biClrUsed != 0 else (1 << bit_count)
+        palette_size = num_colors * ffi.sizeof("RGBQUAD")
+        palette = np.frombuffer(ffi.buffer(bm_ptr + offset, palette_size), dtype=np.uint8)
+        palette = palette.reshape(num_colors, 4)  # B, G, R, 예약
+        offset += palette_size
+
+    # 각 행은 4바이트 단위로 정렬됨
+    stride = ((width * bit_count + 31) // 32) * 4
+    pixels = ffi.buffer(bm_ptr + offset, stride * height)
+
+    return {
+        "width": width,
+        "height": height,
+        "bit_count": bit_count,
+        "stride": stride,
+        # biHeight가 양수이면 아래쪽 행부터 저장된 비트맵
+        "bottom_up": header.biHeight > 0,
+        "pixels": pixels,
+        "palette": palette,
+        "channel_order": channel_order,
+    }
+
+
+def bitmapinfo_to_array(bitmap_info):
+    """BITMAPINFO 픽셀 메모리를 복사 없이 NumPy 배열로 감싸서 반환
+
+    아래쪽 행부터 저장된 비트맵은 음수 stride 뷰로 위아래를 뒤집는다.
+    반환된 배열은 DLL이 소유한 메모리를 그대로 가리키므로, 같은 핸들로
+    다음 SmartComm 함수를 호출하기 전까지만 유효하다. 보관하려면 .copy() 할 것.
+
+    Returns:
+        tuple: (픽셀 배열, 팔레트)
+            - 24/32비트: (높이, 너비, 3/4) BGR/BGRX 배열, 팔레트 None
+              (BI_BITFIELDS 마스크가 BGRX가 아니면 BGRX로 재배열한 사본)
+            - 4/8비트: (높이, 너비) 팔레트 인덱스 배열 (4비트는 풀어낸 사본)
+            - 1비트: (높이, 너비) 팔레트 인덱스 배열 (풀어낸 사본)
+            - 팔레트: (색상 수, 3) RGB 배열
+    """
+    info = _parse_bitmapinfo(bitmap_info)
+    width, height, bit_count = info["width"], info["height"], info["bit_count"]
+
+    rows = np.frombuffer(info["pixels"], dtype=np.uint8).reshape(height, info["stride"])
+    if info["bottom_up"]:
+        rows = rows[::-1]
+
+    palette = None
+    if info["palette"] is not None:
+        # RGBQUAD(B, G, R, X) -> RGB 뷰
+        palette = info["palette"][:, 2::-1]
+
+    if bit_count in (24, 32):
+        channels = bit_count // 8
+        pixels = rows[:, :width * channels].reshape(height, width, channels)
+        order = info["channel_order"]
+        if order is not None and order != "BGRX":
+            pixels = pixels[:, :, [order.index(channel) for channel in "BGRX"]]
+    elif bit_count == 8:
+        pixels = rows[:, :width]
+    elif bit_count == 4:
+        # 한 바이트에 두 픽셀 (상위 4비트가 앞 픽셀)
+        packed = rows[:, :(width + 1) // 2]
+        pixels = np.empty((height, packed.shape[1] * 2), dtype=np.uint8)
+        pixels[:, 0::2] = packed >> 4
+        pixels[:, 1::2] = packed & 0x0F
+        pixels = pixels[:, :width]
     else:
-        print(f"현재 {bit_count}비트 이미지는 지원하지 않습니다.")
-        return None
\ No newline at end of file
+        pixels = np.unpackbits(rows, axis=1)[:, :width]
+
+    return pixels, palette
+
+
+def bitmapinfo_to_image(bitmap_info):
+    """BITMAPINFO를 PIL 이미지로 변환 (1/4/8/24/32비트 지원)
+
+    DIB 메모리에서 Pillow 이미지 메모리로 한 번만 복사한다.
+    중간 bytes 사본이나 상하 반전용 사본을 만들지 않는다.
+    """
+    try:
+        info = _parse_bitmapinfo(bitmap_info)
+    except ValueError as e:
+        print(f"이미지 변환 중 오류 발생: {e}")
+        return None
+
+    mode, raw_mode = PIL_RAW_MODES[info["bit_count"]]
+    if info["channel_order"] is not None:
+        raw_mode = info["channel_order"]
+    orientation = -1 if info["bottom_up"] else 1
+
+    try:
+        img = Image.frombuffer(mode, (info["width"], info["height"]), info["pixels"],
+                               "raw", raw_mode, info["stride"], orientation)
+        if img.mode != mode:
+            # RGBX 순서는 Pillow가 RGBX 모드로 메모리를 직접 참조하므로 RGB로 변환 (사본 생성)
+            img = img.convert(mode)
+        # frombuffer는 원본 메모리를 참조할 수 있으므로 DLL 메모리와 분리
+        img = img.copy() if img.readonly else img
+        if info["palette"] is not None:
+            img.putpalette(info["palette"][:, 2::-1].tobytes())
+        return img
+    except Exception as e:
+        print("이미지 변환 중 오류 발생:", e)
+        return None
@@ -0,0 +1,190 @@
+import json
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from utils.temp_path import get_spool_path
+from .print_job import PrintJob, JOB_QUEUED, FINAL_STATES
+
+# 완료/실패로 끝난 작업이 이만큼 쌓이면 대기 작업이 남아 있어도 저널 압축
+COMPACT_AFTER_RECORDS = 100
+
+
+class PrintJobQueue:
+    """추가 전용(append-only) 저널에 기록되는 인쇄 작업 큐
+
+    작업 등록과 상태 변경을 한 줄짜리 JSON 레코드로 저널 파일 끝에 덧붙이고
+    매번 디스크에 flush한다. 키오스크가 비정상 종료되더라도 다음 실행 시
+    recover()로 저널을 재생하여 완료되지 않은 작업을 다시 인쇄할 수 있다.
+    대기 작업이 모두 끝나거나 끝난 작업이 COMPACT_AFTER_RECORDS건 쌓이면 저널을
+    압축하므로 하루 종일 운영해도 저널이 계속 커지지 않는다.
+    상태 기록(fsync)과 압축은 전용 스레드에서 호출 순서대로 처리하므로 UI 스레드나
+    프린터 워커 스레드에서 set_state()를 호출해도 디스크 기록을 기다리지 않는다.
+
+    저널 레코드 형식:
+        {"op": "add", "job": {...}, "ts": ...}
+        {"op": "state", "job_id": "...", "state": "...", "error": ..., "ts": ...}
+    """
+
+    def __init__(self, journal_path=None):
+        if journal_path is None:
+            journal_path = get_spool_path("print_jobs.journal")
+        self.journal_path = journal_path
+        self.spool_dir = os.path.dirname(journal_path)
+        self.jobs = {}  # job_id -> PrintJob (완료되지 않은 작업)
+        self.finished_since_compact = 0  # 마지막 압축 이후 끝난 작업 수
+        self.lock = threading.Lock()
+        # 저널 기록 전용 스레드 (한 개라서 기록 순서가 유지됨)
+        self.writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="journal")
+
+    def _append(self, record):
+        """저널 파일 끝에 레코드를 한 줄 추가하고 디스크에 기록"""
+        record["ts"] = time.time()
+        line = json.dumps(record, ensure_ascii=False)
+        with self.lock:
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def spool_image(self, image_path, job_id):
+        """인쇄할 이미지를 작업 전용 파일로 복사 (다음 작업이 덮어쓰지 않도록)"""
+        ext = os.path.splitext(image_path)[1] or ".jpg"
+        spooled_path = os.path.join(self.spool_dir, f"{job_id}{ext}")
+        shutil.copyfile(image_path, spooled_path)
+        return spooled_path
+
+    def spool_photo(self, photo, job_id, dpi):
+        """메모리에 있는 사진을 작업 전용 파일로 저장 (재시작 후 다시 합성할 때만 사용)
+
+        인쇄 크기로 만든 사진이 다시 손실 압축되지 않도록 무손실 PNG로 저장한다.
+        """
+        spooled_path = os.path.join(self.spool_dir, f"{job_id}.png")
+        photo.save(spooled_path, format="PNG", dpi=(dpi, dpi), compress_level=1)
+        return spooled_path
+
+    def card_path(self, job):
+        """작업의 합성 카드 이미지 경로 (재시작 후에도 같은 경로)"""
+        return os.path.join(self.spool_dir, f"{job.job_id}_card.bmp")
+
+    def enqueue(self, job):
+        """작업을 큐에 등록하고 저널에 기록"""
+        job.state = JOB_QUEUED
+        # 저널에 쓰기 전에 등록하여 그 사이에 압축되어도 작업이 빠지지 않도록 함
+        # (압축과 겹쳐 같은 add 레코드가 두 번 남아도 재생 결과는 같음)
+        self.jobs[job.job_id] = job
+        # 등록은 디스크에 기록될 때까지 기다림 (기록에 실패하면 호출한 쪽으로 예외 전달)
+        self.writer.submit(self._append, {"op": "add", "job": job.to_record()}).result()
+        return job
+
+    def set_state(self, job, state, error=None):
+        """작업 상태를 변경하고 저널 기록을 예약 (기록을 기다리지 않음, 어느 스레드에서나 호출 가능)"""
+        job.state = state
+        job.error = error
+        record = {"op": "state", "job_id": job.job_id, "state": state, "error": error}
+        finished = state in FINAL_STATES
+        if finished:
+            self.jobs.pop(job.job_id, None)
+        try:
+            self.writer.submit(self._write_state, job, record, finished)
+        except RuntimeError:
+            # close() 이후 늦게 도착한 상태 변경 (다음 실행 때 recover()가 저널 기준으로 처리)
+            print(f"저널이 닫혀 {job} 상태({state})를 기록하지 않았습니다.")
+
+    def _write_state(self, job, record, finished):
+        """상태 레코드를 기록하고 끝난 작업을 정리 (저널 기록 스레드에서 실행)"""
+        try:
+            self._append(record)
+            if finished:
+                self._remove_spooled_image(job)
+                self.finished_since_compact += 1
+                if not self.jobs or self.finished_since_compact >= COMPACT_AFTER_RECORDS:
+                    self._compact()
+        except Exception as e:
+            print(f"인쇄 작업 저널 기록 중 오류: {e}")
+
+    def close(self):
+        """예약된 저널 기록을 모두 마친 뒤 기록 스레드 종료"""
+        self.writer.shutdown(wait=True)
+
+    def _remove_spooled_image(self, job):
+        """완료된 작업의 스풀 이미지(사진, 합성 카드) 삭제"""
+        for path in (job.image_filename, self.card_path(job)):
+            if not path or os.path.dirname(path) != self.spool_dir:
+                continue
+            try:
+                if os.path.exists(path):
+                    os.remove(path)
+            except Exception as e:
+                print(f"스풀 이미지 삭제 중 오류: {e}")
+
+    def pending_jobs(self):
+        """완료되지 않은 작업 목록 (등록 순서)"""
+        return sorted(list(self.jobs.values()), key=lambda job: job.created_at)
+
+    def _replay(self):
+        """저널을 처음부터 읽어 작업별 마지막 상태를 복원"""
+        jobs = {}
+        if not os.path.exists(self.journal_path):
+            return jobs
+
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # 기록 중 종료되어 잘린 마지막 줄은 무시
+                    print(f"손상된 저널 레코드를 건너뜁니다: {line[:80]}")
+                    continue
+
+                if record.get("op") == "add":
+                    job = PrintJob.from_record(record["job"])
+                    jobs[job.job_id] = job
+                elif record.get("op") == "state":
+                    job = jobs.get(record.get("job_id"))
+                    if job is not None:
+                        job.state = record["state"]
+                        job.error = record.get("error")
+        return jobs
+
+    def recover(self):
+        """이전 실행에서 완료되지 않은 작업을 복원하고 저널을 압축
+
+        처리 중(rendering/waiting/printing)에 종료된 작업도 다시 인쇄하도록 queued로 되돌린다.
+
+        Returns:
+            list: 다시 처리해야 할 PrintJob 목록
+        """
+        replayed = self._replay()
+        for job in replayed.values():
+            if job.state in FINAL_STATES:
+                self._remove_spooled_image(job)
+
+        unfinished = [job for job in replayed.values() if job.state not in FINAL_STATES]
+        unfinished.sort(key=lambda job: job.created_at)
+        for job in unfinished:
+            job.state = JOB_QUEUED
+            self.jobs[job.job_id] = job
+
+        self._compact()
+        if unfinished:
+            print(f"이전 실행에서 완료되지 않은 인쇄 작업 {len(unfinished)}건을 복원했습니다.")
+        return unfinished
+
+    def _compact(self):
+        """완료되지 않은 작업만 남긴 새 저널로 교체"""
+        temp_path = self.journal_path + ".tmp"
+        with self.lock:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                for job in self.pending_jobs():
+                    record = {"op": "add", "job": job.to_record(), "ts": time.time()}
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            # 같은 디렉토리 안에서의 교체는 원자적으로 처리됨
+            os.replace(temp_path, self.journal_path)
+            self.finished_since_compact = 0
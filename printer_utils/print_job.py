@@ -0,0 +1,71 @@
+import time
+import uuid
+
+# 작업 상태
+JOB_QUEUED = "queued"
+JOB_RENDERING = "rendering"
+JOB_WAITING = "waiting"  # 합성을 마치고 프린터 배정/인쇄 차례를 기다리는 중 (재시도 대기 포함)
+JOB_PRINTING = "printing"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+# 더 이상 처리하지 않는 상태
+FINAL_STATES = (JOB_DONE, JOB_FAILED)
+
+
+class PrintJob:
+    """프린터로 보낼 카드 한 장의 작업 정보"""
+
+    def __init__(self, image_filename, name, on_finished=None, job_id=None):
+        # 재시작 후에도 작업을 구분할 수 있도록 고유 ID 사용
+        self.job_id = job_id or uuid.uuid4().hex
+        self.image_filename = image_filename
+        self.name = name
+        self.on_finished = on_finished  # 인쇄 완료 시 호출할 콜백 (저장되지 않음)
+        self.photo = None  # 메모리로 전달된 사진 (PIL Image, 합성 후 해제 - 저장되지 않음)
+        self.card_filename = None  # 합성된 카드 이미지 (재시작 시 다시 합성)
+        self.render_plan = None  # 카드를 합성한 레이아웃 (크기/패널 정보)
+
+        self.state = JOB_QUEUED
+        self.error = None
+        self.created_at = time.time()
+
+        self.attempts = 0  # 실제로 인쇄를 시도한 횟수
+        self.device_id = None  # 마지막으로 배정된 프린터
+        self.failed_devices = set()  # 이 작업이 실패한 프린터 (재시도 시 제외)
+        self.is_canceled = False
+
+        # 단계별 시각 (time.perf_counter, 성능 측정용 - 저장되지 않음)
+        self.timestamps = {}
+        self.mark("queued")
+
+    def mark(self, event):
+        """처리 단계가 지나간 시각 기록 (재시도하면 마지막 시도로 덮어씀)"""
+        self.timestamps[event] = time.perf_counter()
+
+    def cancel(self):
+        """작업 취소 표시 (진행 중인 단계가 끝나면 중단)"""
+        self.is_canceled = True
+
+    def to_record(self):
+        """저널에 기록할 딕셔너리로 변환"""
+        return {
+            "job_id": self.job_id,
+            "image_filename": self.image_filename,
+            "name": self.name,
+            "created_at": self.created_at,
+        }
+
+    @classmethod
+    def from_record(cls, record):
+        """저널 기록에서 작업 복원"""
+        job = cls(
+            record["image_filename"],
+            record["name"],
+            job_id=record["job_id"],
+        )
+        job.created_at = record.get("created_at", job.created_at)
+        return job
+
+    def __repr__(self):
+        return f"PrintJob({self.job_id[:8]}, {self.name!r}, {self.state}, device={self.device_id})"
@@ -0,0 +1,304 @@
+import queue
+import time
+from PySide6.QtCore import QObject, QThread, QTimer, Signal
+
+# 실패한 프린터를 다시 배정 대상으로 삼기까지 기다리는 시간 (초)
+UNHEALTHY_RETRY_SEC = 30
+
+# 프린터가 없어 대기 중인 작업을 다시 배정해 보는 주기 (ms)
+WAITING_RETRY_MS = 5000
+
+
+class PrinterWorker(QThread):
+    """프린터 한 대(세션 하나)의 작업 큐를 순서대로 처리하는 스레드"""
+    job_started = Signal(object, object)  # (작업, 워커)
+    job_done = Signal(object, object)  # (작업, 워커)
+    job_failed = Signal(object, object, str)  # (작업, 워커, 오류 메시지)
+
+    def __init__(self, session, print_func):
+        super().__init__()
+        self.session = session
+        self.print_func = print_func
+        self.jobs = queue.Queue()
+        self.current_job = None
+
+        # 상태 정보 (스케줄러가 메인 스레드에서 갱신)
+        self.healthy = True
+        self.failed_at = 0.0
+        self.failure_count = 0
+
+    @property
+    def device_id(self):
+        return self.session.device_id
+
+    def load(self):
+        """대기 중인 작업 수 + 현재 처리 중인 작업"""
+        return self.jobs.qsize() + (1 if self.current_job is not None else 0)
+
+    def submit(self, job):
+        self.jobs.put(job)
+
+    def take_pending(self):
+        """아직 시작하지 않은 작업을 모두 꺼내 반환 (다른 프린터로 재배정용)"""
+        pending = []
+        while True:
+            try:
+                job = self.jobs.get_nowait()
+            except queue.Empty:
+                break
+            if job is None:
+                # 종료 요청은 그대로 유지
+                self.jobs.put(None)
+                break
+            pending.append(job)
+        return pending
+
+    def stop(self):
+        """인쇄 중인 작업만 마친 뒤 스레드 종료
+
+        아직 시작하지 않은 작업은 인쇄하지 않고 꺼내 반환한다.
+        (저널에 남아 있으므로 다음 실행 때 PrintJobQueue.recover()로 복원됨)
+
+        Returns:
+            list: 꺼낸 작업 목록
+        """
+        pending = self.take_pending()
+        self.jobs.put(None)
+        return pending
+
+    def run(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
+
+            self.current_job = job
+            job.attempts += 1
+            self.job_started.emit(job, self)
+            job.mark("print_start")
+            try:
+                # 같은 핸들을 쓰는 다른 스레드(상태 조회 등)와 겹치지 않도록 잠금
+                with self.session.lock:
+                    success, message = self.print_func(self.session, job)
+            except Exception as e:
+                # 핸들 상태를 알 수 없으므로 다음 작업에서 다시 열도록 함
+                self.session.invalidate()
+                success, message = False, f"인쇄 중 오류 발생: {str(e)}"
+            finally:
+                self.current_job = None
+                job.mark("print_end")
+
+            if success:
+                self.job_done.emit(job, self)
+            else:
+                self.job_failed.emit(job, self, message)
+
+
+class PrintScheduler(QObject):
+    """연결된 모든 프린터에 카드 작업을 분배하는 스케줄러
+
+    작업은 건강한 프린터 중 대기 작업이 가장 적은 프린터로 보내고,
+    한 프린터에서 실패하면 아직 시도하지 않은 다른 프린터로 다시 보낸다.
+    모든 프린터에서 실패했으면(프린터 1대 구성 포함) 대기 목록에 보관했다가
+    상태 조회로 프린터가 다시 인쇄 가능하다고 확인되면 max_attempts회까지 다시 시도한다.
+    사용 가능한 프린터가 없으면 작업을 보관했다가 프린터가 연결되면 보낸다.
+    장치 목록은 PrinterStatusMonitor가 조회하여 on_devices_changed로 알려주므로
+    이 객체(UI 스레드)는 SmartComm DLL을 직접 호출하지 않는다.
+    """
+    job_started = Signal(object)
+    job_finished = Signal(object)
+    job_failed = Signal(object, str)
+
+    def __init__(self, session_pool, print_func, max_attempts=3):
+        super().__init__()
+        self.session_pool = session_pool
+        self.print_func = print_func
+        self.max_attempts = max_attempts
+        self.workers = {}  # 장치 ID -> PrinterWorker
+        # 프린터 상태/목록 조회 스레드 (PrinterStatusMonitor, 없으면 상태 확인 생략)
+        self.status_monitor = None
+
+        # 프린터가 없어 배정하지 못한 작업
+        self.waiting = []
+        self.retry_timer = QTimer(self)
+        self.retry_timer.setInterval(WAITING_RETRY_MS)
+        self.retry_timer.timeout.connect(self._retry_waiting)
+
+    def on_devices_changed(self, devices):
+        """조회 스레드가 보고한 장치 목록에서 새로 연결된 프린터의 워커를 추가
+
+        Args:
+            devices: [(장치 인덱스, 장치 ID), ...]
+        """
+        added = False
+        for index, device_id in devices:
+            if device_id in self.workers:
+                continue
+            session = self.session_pool.get(index, device_id)
+            worker = PrinterWorker(session, self.print_func)
+            worker.job_started.connect(self._on_job_started)
+            worker.job_done.connect(self._on_job_done)
+            worker.job_failed.connect(self._on_job_failed)
+            worker.start()
+            self.workers[device_id] = worker
+            added = True
+            print(f"프린터 추가: {device_id}")
+
+        # 새 프린터로 대기 중인 작업 배정
+        if added and self.waiting:
+            self._retry_waiting()
+
+    def _is_available(self, worker):
+        """건강하거나 실패 후 다시 인쇄 가능으로 확인된(또는 충분한 시간이 지난) 프린터인지 확인"""
+        if self.status_monitor is not None:
+            # 인쇄할 수 없다고 보고된 프린터는 제외
+            status = self.status_monitor.snapshot(worker.device_id)
+            if status is not None and not status.is_ready:
+                return False
+            # 실패 이후에 조회한 상태가 인쇄 가능이면 복구된 것으로 봄
+            if not worker.healthy and status is not None and status.timestamp > worker.failed_at:
+                worker.healthy = True
+        if worker.healthy:
+            return True
+        return time.monotonic() - worker.failed_at >= UNHEALTHY_RETRY_SEC
+
+    def _pick_worker(self, job):
+        """작업이 실패한 적 없는 사용 가능한 프린터 중 가장 한가한 프린터 선택"""
+        candidates = [
+            worker for device_id, worker in self.workers.items()
+            if device_id not in job.failed_devices and self._is_available(worker)
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda worker: worker.load())
+
+    def submit(self, job):
+        """작업을 프린터에 배정
+
+        Returns:
+            bool: 프린터 배정 여부 (대기 목록에 보관되었거나 실패하면 False)
+        """
+        worker = self._pick_worker(job)
+        if worker is None and self.status_monitor is not None:
+            # 새로 연결된 프린터가 있을 수 있으므로 조회 스레드에 목록 조회 요청 (기다리지 않음)
+            self.status_monitor.request_discovery()
+
+        if worker is None:
+            if self.workers and all(device_id in job.failed_devices for device_id in self.workers):
+                # 모든 프린터에서 이미 실패한 작업
+                self.job_failed.emit(job, "사용 가능한 프린터가 없습니다.")
+                return False
+            # 프린터가 연결되거나 복구될 때까지 보관
+            print(f"{job} 사용 가능한 프린터가 없어 대기합니다.")
+            self.waiting.append(job)
+            if not self.retry_timer.isActive():
+                self.retry_timer.start()
+            return False
+
+        job.device_id = worker.device_id
+        worker.submit(job)
+        print(f"{job} 작업을 프린터에 배정했습니다.")
+        return True
+
+    def _retry_waiting(self):
+        """대기 중인 작업을 먼저 등록된 순서대로 다시 배정"""
+        waiting, self.waiting = self.waiting, []
+        waiting.sort(key=lambda job: job.created_at)
+        for job in waiting:
+            if not job.is_canceled:
+                self.submit(job)
+        if not self.waiting:
+            self.retry_timer.stop()
+
+    def on_status_changed(self, device_id, status):
+        """상태 조회 스레드가 보고한 프린터 상태 변화 반영"""
+        print(f"프린터 상태 변경: {device_id} - {status.describe()}")
+        worker = self.workers.get(device_id)
+        if worker is None:
+            return
+
+        if status.is_ready:
+            if status.timestamp <= worker.failed_at:
+                # 실패 전에 조회한 상태이면 복구된 것으로 보지 않음
+                return
+            worker.healthy = True
+            # 복구된 프린터로 대기 중인 작업 배정
+            if self.waiting:
+                self._retry_waiting()
+            return
+
+        # 인쇄할 수 없는 프린터에 쌓여있던 작업은 다른 프린터로 옮기거나
+        # 다른 프린터가 없으면 복구될 때까지 대기 목록에 보관
+        for pending in worker.take_pending():
+            self.submit(pending)
+
+    def _on_job_started(self, job, worker):
+        self.job_started.emit(job)
+
+    def _on_job_done(self, job, worker):
+        worker.healthy = True
+        worker.failure_count = 0
+        self.job_finished.emit(job)
+
+    def _on_job_failed(self, job, worker, message):
+        print(f"{job} 인쇄 실패: {message}")
+        if job.is_canceled:
+            self.job_failed.emit(job, message)
+            return
+
+        worker.healthy = False
+        worker.failed_at = time.monotonic()
+        worker.failure_count += 1
+        job.failed_devices.add(worker.device_id)
+        pending_jobs = worker.take_pending()
+
+        if job.attempts >= self.max_attempts:
+            self.job_failed.emit(job, message)
+        elif any(device_id not in job.failed_devices for device_id in self.workers):
+            # 아직 시도하지 않은 다른 프린터에서 재시도
+            self.submit(job)
+        else:
+            # 다른 프린터가 없으면 바로 다시 보내지 않고 대기 목록에 보관
+            # (실패 이후 조회한 상태가 인쇄 가능이어야 배정되므로 재시도 횟수를 연달아 쓰지 않음)
+            job.failed_devices.clear()
+            self.waiting.append(job)
+            if not self.retry_timer.isActive():
+                self.retry_timer.start()
+
+        # 실패한 프린터에 쌓여있던 작업은 다른 프린터로 옮기거나
+        # 다른 프린터가 없으면 복구될 때까지 대기 목록에 보관
+        for pending in pending_jobs:
+            self.submit(pending)
+
+    def cancel_all(self):
+        """대기 중이거나 진행 중인 모든 작업 취소"""
+        canceled = False
+        waiting, self.waiting = self.waiting, []
+        for job in waiting:
+            job.cancel()
+            self.job_failed.emit(job, "인쇄 작업 취소")
+            canceled = True
+        for worker in self.workers.values():
+            for job in worker.take_pending():
+                job.cancel()
+                self.job_failed.emit(job, "인쇄 작업 취소")
+                canceled = True
+            if worker.current_job is not None:
+                worker.current_job.cancel()
+                canceled = True
+        return canceled
+
+    def shutdown(self):
+        """모든 워커를 종료하고 인쇄 중인 작업이 끝날 때까지 대기
+
+        대기 중인 작업은 인쇄하지 않는다. (다음 실행 때 저널에서 복원됨)
+        """
+        self.retry_timer.stop()
+        left = len(self.waiting)
+        self.waiting = []
+        for worker in self.workers.values():
+            left += len(worker.stop())
+        if left:
+            print(f"인쇄하지 않은 작업 {left}건은 다음 실행 때 다시 인쇄합니다.")
+        for worker in self.workers.values():
+            worker.wait()
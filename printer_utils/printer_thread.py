@@ -9,9 +9,10 @@ class PrinterThread(QThread):
     error = Signal(str)
     # preview_ready = Signal(object)  # 미리보기 이미지 전달용
     
-    def __init__(self, file_name = None):
+    def __init__(self, file_name = None, device_index = 0):
         super().__init__()
         self.file_name = file_name
+        self.device_index = device_index
     
         
     def run(self):
@@ -24,8 +25,7 @@ class PrinterThread(QThread):
                 return
                 
             # 장치 선택
-            device_index = 0
-            device_id = get_device_id(printer_list, device_index)
+            device_id = get_device_id(printer_list, self.device_index)
             
             # 장치 열기
             result, device_handle = open_device(device_id, SMART_OPENDEVICE_BYID)
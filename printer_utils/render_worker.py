@@ -0,0 +1,60 @@
+import queue
+from PySide6.QtCore import QThread, Signal
+
+
+class RenderWorker(QThread):
+    """인쇄 전에 카드 이미지를 미리 합성하는 스레드
+
+    프린터 워커가 이전 카드를 인쇄하는 동안 다음 카드를 합성하여
+    프린터 세션에서는 완성된 이미지 한 장만 보내도록 한다.
+    """
+    job_started = Signal(object)
+    job_rendered = Signal(object)
+    job_failed = Signal(object, str)
+
+    def __init__(self, render_func):
+        super().__init__()
+        self.render_func = render_func
+        self.jobs = queue.Queue()
+
+    def submit(self, job):
+        self.jobs.put(job)
+
+    def take_pending(self):
+        """아직 합성하지 않은 작업을 모두 꺼내 반환"""
+        pending = []
+        while True:
+            try:
+                job = self.jobs.get_nowait()
+            except queue.Empty:
+                break
+            if job is None:
+                # 종료 요청은 그대로 유지
+                self.jobs.put(None)
+                break
+            pending.append(job)
+        return pending
+
+    def stop(self):
+        """합성 중인 작업만 마친 뒤 스레드 종료 (대기 작업은 저널에 남아 다음 실행 때 복원됨)"""
+        self.take_pending()
+        self.jobs.put(None)
+
+    def run(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
+            if job.is_canceled:
+                self.job_failed.emit(job, "인쇄 작업 취소")
+                continue
+
+            self.job_started.emit(job)
+            job.mark("render_start")
+            try:
+                self.render_func(job)
+            except Exception as e:
+                self.job_failed.emit(job, f"카드 이미지 합성 실패: {str(e)}")
+                continue
+            job.mark("rendered")
+            self.job_rendered.emit(job)
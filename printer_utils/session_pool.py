@@ -0,0 +1,108 @@
+import threading
+from .cffi_defs import ffi, SMART_OPENDEVICE_BYID
+from .device_functions import get_device_list, get_device_id, open_device, close_device
+
+
+class PrinterSession:
+    """프린터 한 대의 HSMART 핸들을 여러 인쇄 작업에 걸쳐 유지하는 세션
+
+    핸들은 처음 사용할 때 한 번 열고, 오류나 장치 분리가 감지되어
+    invalidate()가 호출된 경우에만 다음 작업에서 다시 연다.
+    같은 핸들을 여러 스레드가 동시에 쓰지 않도록 lock으로 보호한다.
+    """
+
+    def __init__(self, device_index=0, device_id=None):
+        self.device_index = device_index
+        self.device_id = device_id
+        self.handle = None
+        self.lock = threading.RLock()
+        self.open_count = 0  # 장치를 연 횟수 (재연결 추적용)
+
+    def is_open(self):
+        """핸들이 열려있는지 여부"""
+        return self.handle is not None
+
+    def ensure_open(self):
+        """핸들이 없으면 장치 목록을 조회해 열고, 있으면 그대로 재사용
+
+        Returns:
+            int: 0 - 성공, 그 외 - SmartComm 오류 코드
+        """
+        with self.lock:
+            if self.handle is not None:
+                return 0
+
+            result, printer_list = get_device_list()
+            if result != 0:
+                print(f"프린터 목록 가져오기 실패 (오류 코드: {result})")
+                return result
+
+            # 장치 ID를 알고 있으면 재연결 후 바뀐 인덱스를 다시 찾음
+            if self.device_id is not None:
+                for index in range(printer_list.n):
+                    if ffi.string(get_device_id(printer_list, index)) == self.device_id:
+                        self.device_index = index
+                        break
+                else:
+                    print(f"프린터를 찾을 수 없습니다: {self.device_id}")
+                    return -1
+            elif self.device_index < printer_list.n:
+                # 목록 구조체가 해제되어도 재연결할 수 있도록 문자열로 보관
+                self.device_id = ffi.string(get_device_id(printer_list, self.device_index))
+            else:
+                print(f"프린터 {self.device_index}번 장치를 찾을 수 없습니다.")
+                return -1
+
+            result, device_handle = open_device(self.device_id, SMART_OPENDEVICE_BYID)
+            if result != 0:
+                print(f"장치 열기 실패: {self.device_id} (오류 코드: {result})")
+                return result
+
+            self.handle = device_handle
+            self.open_count += 1
+            print(f"프린터 세션 열림: {self.device_id}")
+            return 0
+
+    def invalidate(self):
+        """오류 또는 장치 분리 후 핸들을 닫아 다음 작업에서 다시 열도록 함"""
+        with self.lock:
+            if self.handle is None:
+                return
+            try:
+                close_device(self.handle)
+            except Exception as e:
+                print(f"프린터 세션 닫기 중 오류: {e}")
+            self.handle = None
+            print(f"프린터 세션 무효화: {self.device_id}")
+
+    def close(self):
+        """프로그램 종료 시 세션 정리"""
+        self.invalidate()
+
+
+class PrinterSessionPool:
+    """장치별 PrinterSession을 보관하는 풀
+
+    장치 ID가 주어지면 ID로, 없으면 장치 인덱스로 세션을 구분한다.
+    """
+
+    def __init__(self):
+        self.sessions = {}
+        self.lock = threading.Lock()
+
+    def get(self, device_index=0, device_id=None):
+        """장치에 해당하는 세션을 반환 (없으면 생성)"""
+        key = device_id if device_id is not None else device_index
+        with self.lock:
+            session = self.sessions.get(key)
+            if session is None:
+                session = PrinterSession(device_index, device_id)
+                self.sessions[key] = session
+            return session
+
+    def close_all(self):
+        """열려있는 모든 세션 닫기"""
+        with self.lock:
+            sessions = list(self.sessions.values())
+        for session in sessions:
+            session.close()
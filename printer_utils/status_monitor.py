@@ -0,0 +1,186 @@
+import threading
+import time
+from collections import namedtuple
+from PySide6.QtCore import QThread, Signal
+from .device_functions import get_device_list, get_device_id
+from .cffi_defs import ffi, get_backend
+
+# 기본 조회 주기 (ms)
+DEFAULT_POLL_MS = 2000
+
+# 연결된 프린터 목록(USB 장치 열거)을 다시 조회하는 주기 (초)
+DISCOVERY_INTERVAL_SEC = 10
+
+_StatusFields = namedtuple(
+    "PrinterStatus",
+    "device_id connected busy result raw timestamp",
+)
+
+
+class PrinterStatus(_StatusFields):
+    """프린터 한 대의 상태 스냅샷 (읽기 전용, timestamp는 time.monotonic 기준 조회 시각)
+
+    GetStatus 상태 워드(raw)의 비트 의미는 SmartComm2 SDK 헤더로 확인하기 전까지
+    해석하지 않고 기록만 한다. 인쇄 가능 여부는 장치 열기와 GetStatus 호출의 성공
+    여부로만 판단한다. busy는 인쇄 작업이 세션을 쓰고 있어 조회하지 못한 경우이다.
+    """
+    __slots__ = ()
+
+    @property
+    def is_ready(self):
+        """새 카드를 받을 수 있는 상태인지 여부 (인쇄 중인 것은 대기열로 처리 가능)"""
+        return self.connected
+
+    def describe(self):
+        """사용자에게 보여줄 상태 설명"""
+        if not self.connected:
+            if self.result == -1:
+                return "프린터가 연결되어 있지 않습니다."
+            return f"프린터 상태를 확인할 수 없습니다. (오류 코드: {self.result})"
+        return "인쇄 가능"
+
+    def same_state(self, other):
+        """조회 시각을 제외한 상태가 같은지 비교"""
+        return other is not None and self[:-1] == other[:-1]
+
+
+def decode_status(device_id, result, status_word):
+    """SmartComm_GetStatus 결과를 PrinterStatus로 변환 (result가 0이 아니면 연결되지 않은 것으로 봄)"""
+    connected = result == 0
+    return PrinterStatus(device_id, connected, False, result,
+                         status_word if connected else None, time.monotonic())
+
+
+class PrinterStatusMonitor(QThread):
+    """열려있는 프린터 세션의 상태를 주기적으로 조회하여 공유하는 스레드
+
+    조회 결과는 장치 ID별 PrinterStatus 딕셔너리로 보관하며, 갱신할 때마다
+    딕셔너리를 통째로 교체하므로 다른 스레드는 잠금 없이 snapshot()으로 읽을 수 있다.
+    상태가 바뀌면 status_changed 시그널을 보낸다.
+    연결된 프린터 목록 조회(GetDeviceList2)도 UI 스레드가 아닌 이 스레드에서 하며,
+    목록이 바뀌면 devices_changed 시그널로 알린다.
+    """
+    status_changed = Signal(str, object)  # (장치 ID, PrinterStatus)
+    devices_changed = Signal(object)  # [(장치 인덱스, 장치 ID), ...]
+
+    def __init__(self, session_pool, poll_ms=DEFAULT_POLL_MS):
+        super().__init__()
+        self.session_pool = session_pool
+        self.poll_ms = poll_ms
+        self._snapshots = {}
+        self._devices = None  # 마지막으로 조회한 장치 목록
+        self._discovered = False  # 첫 장치 목록 조회를 마쳤는지 (실패 포함)
+        self._discovery_requested = False
+        self._stopping = False
+        self._wake = threading.Event()  # 조회 대기 중인 스레드를 깨움 (종료/목록 조회 요청)
+
+    def snapshot(self, device_id):
+        """장치의 마지막 상태 (조회된 적 없으면 None)"""
+        return self._snapshots.get(device_id)
+
+    def snapshots(self):
+        """모든 장치의 마지막 상태 딕셔너리 (수정하지 말 것)"""
+        return self._snapshots
+
+    def discovery_done(self):
+        """첫 장치 목록 조회를 마쳤는지 여부 (조회에 실패한 경우도 마친 것으로 봄)"""
+        return self._discovered
+
+    def devices(self):
+        """마지막으로 조회한 장치 목록 [(장치 인덱스, 장치 ID), ...] (찾은 적 없으면 빈 목록)"""
+        return self._devices or []
+
+    def ready_devices(self):
+        """인쇄 가능한 장치 ID 목록"""
+        return [device_id for device_id, status in self._snapshots.items() if status.is_ready]
+
+    def _poll_session(self, session, previous):
+        """세션 하나의 상태를 조회 (인쇄 중이라 잠금을 얻지 못하면 busy로 표시)"""
+        if not session.lock.acquire(blocking=False):
+            if previous is None:
+                return None
+            # 조회하지 못했으므로 조회 시각은 그대로 둠
+            return previous._replace(busy=True)
+
+        try:
+            # 아직 열리지 않았거나 분리 후 닫힌 세션은 다시 열어봄
+            if session.ensure_open() != 0:
+                return decode_status(session.device_id, -1, 0)
+
+            status = ffi.new("DWORD *")
+            result = get_backend().SmartComm_GetStatus(session.handle, status)
+            if result != 0:
+                # 장치 분리 등 - 다음 조회나 작업에서 다시 열도록 함
+                session.invalidate()
+            return decode_status(session.device_id, result, status[0])
+        finally:
+            session.lock.release()
+
+    def request_discovery(self):
+        """다음 조회 때 장치 목록도 다시 조회하도록 요청 (다른 스레드에서 호출 가능, 기다리지 않음)"""
+        self._discovery_requested = True
+        self._wake.set()
+
+    def discover_devices(self):
+        """연결된 프린터 목록을 조회하여 바뀌었으면 devices_changed 발생"""
+        result, printer_list = get_device_list()
+        if result != 0:
+            print(f"프린터 목록 가져오기 실패 (오류 코드: {result})")
+            return
+        devices = [(index, ffi.string(get_device_id(printer_list, index)))
+                   for index in range(printer_list.n)]
+        if devices != self._devices:
+            self._devices = devices
+            self.devices_changed.emit(devices)
+
+    def poll_once(self):
+        """모든 세션의 상태를 한 번 조회"""
+        snapshots = dict(self._snapshots)
+        changed = []
+        for session in list(self.session_pool.sessions.values()):
+            if session.device_id is None:
+                continue
+            previous = snapshots.get(session.device_id)
+            try:
+                status = self._poll_session(session, previous)
+            except Exception as e:
+                print(f"프린터 상태 조회 중 오류: {e}")
+                continue
+            if status is None:
+                continue
+            snapshots[session.device_id] = status
+            if not status.same_state(previous):
+                changed.append(status)
+
+        # 딕셔너리를 통째로 교체하여 읽는 쪽은 잠금 없이 일관된 값을 봄
+        self._snapshots = snapshots
+        for status in changed:
+            self.status_changed.emit(status.device_id, status)
+
+    def run(self):
+        # DLL 로드는 UI 스레드가 아닌 이 스레드에서 처리
+        try:
+            get_backend()
+        except Exception as e:
+            print(f"프린터 백엔드 로드 중 오류: {e}")
+
+        next_discovery = 0.0
+        while not self._stopping:
+            now = time.monotonic()
+            if self._discovery_requested or now >= next_discovery:
+                self._discovery_requested = False
+                next_discovery = now + DISCOVERY_INTERVAL_SEC
+                try:
+                    self.discover_devices()
+                except Exception as e:
+                    print(f"프린터 목록 조회 중 오류: {e}")
+                self._discovered = True
+            self.poll_once()
+            self._wake.wait(self.poll_ms / 1000)
+            self._wake.clear()
+
+    def stop(self):
+        """조회 스레드 종료"""
+        self._stopping = True
+        self._wake.set()
+        self.wait()
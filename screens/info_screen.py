@@ -1,6 +1,6 @@
 from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import QWidget, QPushButton, QLabel, QVBoxLayout, QFrame, QHBoxLayout, QLineEdit
-from PySide6.QtCore import QCoreApplication, Qt
+from PySide6.QtCore import QCoreApplication, Qt, Signal, QTimer
 import os
 from datetime import datetime
 from calendar import monthrange
@@ -10,11 +10,19 @@ from utils.image_preview_manager import ImagePreviewManager
 from utils.keyboard_manager import KeyboardManager
 from utils.print_manager import PrintManager
 from utils.dialog_manager import MessageDialog
+from utils.issuance_pipeline import IssuancePipeline
+from utils.auto_framing import auto_framer
 from excel_utils.manager import ExcelManager
 from utils.temp_path import get_temp_path, cleanup_temp_files
 
+# 화면 표시 때 얼굴 검출이 끝나지 않았으면 첫 프리뷰를 그리기 전에 기다리는 최대 시간 (ms)
+FRAMING_WAIT_MS = 300
+
+
 class InfoScreen(QWidget):
     """정보 입력 및 이미지 편집 화면"""
+    # 얼굴 검출 작업 완료 (이미지 경로, Future) - 작업 스레드에서 UI 스레드로 전달
+    face_detected = Signal(str, object)
     
     def __init__(self, stack, screen_size):
         super().__init__()
@@ -27,6 +35,17 @@ class InfoScreen(QWidget):
         self.print_manager = PrintManager()
         self.excel_manager = ExcelManager(self)  # 엑셀 매니저 추가
         
+        # 크롭/인코딩/기록 저장/인쇄 등록은 작업 스레드에서 처리
+        self.issue_pipeline = IssuancePipeline(self.print_manager, self.excel_manager.validator)
+        self.issue_pipeline.progress.connect(self.on_issue_progress)
+        self.issue_pipeline.finished.connect(self.on_issue_finished)
+        self.issue_pipeline.failed.connect(self.on_issue_failed)
+        
+        # 얼굴 검출이 화면 표시 후에 끝나면 그때 위치를 맞춰 첫 프리뷰를 그림
+        self.face_detected.connect(self.on_face_detected)
+        self.framing_pending = False  # 첫 프리뷰가 얼굴 검출 결과를 기다리는 중인지
+        self.framing_wait_id = 0  # 이전 화면 표시 때 예약한 대기 타이머 구분용
+        
         # UI 초기화 - 키보드 매니저는 입력 필드 생성 후 초기화
         self.setupUI()
         
@@ -108,6 +127,7 @@ class InfoScreen(QWidget):
         
         # 버튼들
         issue_btn = QPushButton("발급")
+        self.issue_btn = issue_btn
         retake_btn = QPushButton("재촬영")
         reset_btn = QPushButton("초기화")
         
@@ -197,13 +217,71 @@ class InfoScreen(QWidget):
     def showEvent(self, event):
         """위젯이 표시될 때 호출되는 이벤트 핸들러"""
         super().showEvent(event)
-        # 이미지 경로 설정
-        self.image_manager.set_image_path(self.captured_image_path)
-        # 이미지 미리보기 업데이트
-        self.image_manager.update_preview()
+        # 이미지 경로 설정 (첫 프리뷰는 배율/위치를 정한 뒤 한 번만 그림)
+        self.image_manager.set_image_path(self.captured_image_path, render=False)
+        # 촬영 때 시작한 얼굴 검출 결과로 첫 배율/위치 설정
+        if self.start_auto_framing():
+            self.image_manager.update_preview()
+        else:
+            # 이전 사진이 보이지 않도록 비워두고 검출이 끝나면 그림
+            self.image_manager.clear_preview()
         # 키보드 표시 (초기 설정된 필드에 연결)
         self.keyboard_manager.show_keyboard()
     
+    def start_auto_framing(self):
+        """얼굴 검출이 끝났으면 바로 적용하고, 아직이면 끝날 때 적용하도록 예약 (기다리지 않음)
+
+        Returns:
+            bool: 첫 프리뷰를 바로 그려도 되면 True, 검출 결과를 기다려야 하면 False
+        """
+        self.framing_pending = False
+        path = self.captured_image_path
+        future = auto_framer.get(path)
+        if future is None:
+            return True
+        if future.done():
+            self.apply_auto_framing(path, future)
+            return True
+
+        self.framing_pending = True
+        self.framing_wait_id += 1
+        future.add_done_callback(lambda done, path=path: self.face_detected.emit(path, done))
+        # 검출이 늦어지면 기본 배율로 그림
+        QTimer.singleShot(FRAMING_WAIT_MS,
+                          lambda wait_id=self.framing_wait_id: self.stop_waiting_for_framing(wait_id))
+        return False
+    
+    def on_face_detected(self, path, future):
+        """화면 표시 후에 끝난 얼굴 검출 결과를 적용하여 첫 프리뷰 그리기"""
+        # 이미 그렸거나 다른 사진(같은 경로의 이전 촬영 포함)의 결과이면 무시
+        if not self.framing_pending or path != self.captured_image_path or future is not auto_framer.get(path):
+            return
+        self.framing_pending = False
+        # 그 사이 사용자가 직접 조정했으면 덮어쓰지 않음
+        if self.image_manager.is_default_view():
+            self.apply_auto_framing(path, future)
+        self.image_manager.update_preview()
+    
+    def stop_waiting_for_framing(self, wait_id):
+        """검출이 FRAMING_WAIT_MS 안에 끝나지 않으면 기본 배율로 첫 프리뷰 그리기 (늦은 결과는 적용하지 않음)"""
+        if not self.framing_pending or wait_id != self.framing_wait_id:
+            return
+        self.framing_pending = False
+        self.image_manager.update_preview()
+    
+    def apply_auto_framing(self, path, future):
+        """현재 사진의 검출 결과이면 프리뷰 배율/위치에 적용"""
+        if path != self.captured_image_path or future is not auto_framer.get(path):
+            return False
+        try:
+            face = future.result()
+        except Exception as e:
+            print(f"얼굴 검출 중 오류 발생: {e}")
+            return False
+        if face is None:
+            return False
+        return self.image_manager.apply_face_framing(face)
+    
     def reset_form(self):
         """폼 초기화"""
         self.name_input.clear()
@@ -217,6 +295,9 @@ class InfoScreen(QWidget):
         """재촬영 버튼 클릭 시 호출되는 메서드"""
         # 이미지 위치와 회전 각도 초기화
         self.image_manager.reset()
+        # 지울 사진은 캐시와 얼굴 검출 결과에서도 제거
+        self.image_manager.invalidate_image()
+        auto_framer.discard(self.captured_image_path)
         
         # 키보드 숨기기
         self.keyboard_manager.hide_keyboard()
@@ -262,6 +343,17 @@ class InfoScreen(QWidget):
             dialog.exec()
             return
         
+        # 프린터 상태 확인 (상태 조회 스레드의 마지막 결과 사용)
+        ready, message = self.print_manager.printer_ready()
+        if not ready:
+            dialog = MessageDialog(
+                parent=self,
+                title="프린터 오류",
+                message=f"{message}\n관리자에게 문의하세요."
+            )
+            dialog.exec()
+            return
+        
         # 엑셀 검증 진행
         validation_result = self.excel_manager.validate_user(name, birth)
         
@@ -281,12 +373,9 @@ class InfoScreen(QWidget):
         # 키보드 숨기기
         self.keyboard_manager.hide_keyboard()
             
-        # 프리뷰 영역 좌표 계산 (이미지 저장 없이)
-        self.image_manager.show_preview_area(debug_mode=False)
-            
-        # 프리뷰 영역 크롭
-        crop_result = self.image_manager.crop_preview_area()
-        if crop_result is None:
+        # 프리뷰 영역 좌표와 원본 이미지 (크롭 자체는 작업 스레드에서 처리)
+        crop_params = self.image_manager.get_crop_params()
+        if crop_params is None:
             # 이미지 처리 실패 시 메시지 표시
             dialog = MessageDialog(
                 parent=self,
@@ -296,46 +385,56 @@ class InfoScreen(QWidget):
             dialog.exec()
             return
             
-        # 크롭된 이미지 경로
-        cropped_image_path = crop_result["output_path"]
-        
         # 원본 이미지 경로 저장
-        self.original_image_path = crop_result["original_path"]
+        self.original_image_path = crop_params["original_path"]
         
-        # 엑셀에 카드 발급 정보 등록
-        success = self.excel_manager.register_card(name, birth)
+        # 중복 발급을 막기 위해 처리가 끝날 때까지 발급 버튼 비활성화
+        self.issue_btn.setEnabled(False)
+        self.issue_btn.setText("처리 중")
         
-        if not success:
-            # 등록 실패 시 메시지 표시 - 메시지 변경 및 확인 절차 추가
-            dialog = MessageDialog(
-                parent=self,
-                title="데이터 저장 오류",
-                message="발급 기록을 저장할 수 없습니다.\n\n발급기록.csv 파일이 열려있다면 닫아주세요.\n그래도 문제가 계속되면 관리자에게 문의하세요."
-            )
-            dialog.exec()
-            return
-        
-        # 인쇄 작업 시작 - 이름만 전달
-        success = self.print_manager.print_card(
-            cropped_image_path, 
+        # 크롭 -> 리사이즈 -> 인코딩 -> 발급 기록 저장 -> 인쇄 등록
+        self.issue_pipeline.submit(
             name,
-            on_finished_callback=self.on_printing_finished,
-            show_preview=True
+            birth,
+            crop_params,
+            on_printed=self.on_printing_finished
         )
-        
-        if success:
-            # 프린트 작업 시작 후 스플래시 화면으로 돌아가기
-            self.stack.setCurrentIndex(0)
-            self.reset_form()
-            
-            # 발급 완료 메시지 표시
-            dialog = MessageDialog(
-                parent=self.stack.parent(),
-                title="발급 완료",
-                message="카드 발급이 완료되었습니다.",
-                auto_close_ms=3000  # 3초 후 자동 닫기
-            )
-            dialog.exec()
+
+    def on_issue_progress(self, message):
+        """발급 처리 단계 표시"""
+        self.issue_btn.setText(message)
+
+    def restore_issue_button(self):
+        """발급 버튼을 원래 상태로 되돌림"""
+        self.issue_btn.setText("발급")
+        self.issue_btn.setEnabled(True)
+
+    def on_issue_finished(self, result):
+        """발급 처리 완료 (인쇄 작업 등록까지 끝남)"""
+        self.restore_issue_button()
+        
+        # 프린트 작업 시작 후 스플래시 화면으로 돌아가기
+        self.stack.setCurrentIndex(0)
+        self.reset_form()
+        
+        # 발급 완료 메시지 표시
+        dialog = MessageDialog(
+            parent=self.stack.parent(),
+            title="발급 완료",
+            message="카드 발급이 완료되었습니다.",
+            auto_close_ms=3000  # 3초 후 자동 닫기
+        )
+        dialog.exec()
+
+    def on_issue_failed(self, title, message):
+        """발급 처리 실패"""
+        self.restore_issue_button()
+        dialog = MessageDialog(
+            parent=self,
+            title=title,
+            message=message
+        )
+        dialog.exec()
 
     # on_printing_finished 메서드 수정
     def on_printing_finished(self):
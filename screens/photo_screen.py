@@ -37,6 +37,10 @@ class PhotoScreen(QWidget):
         # 웹캠의 photo_captured_signal을 on_photo_captured 메서드에 연결
         self.webcam.photo_captured_signal.connect(self.on_photo_captured)
 
+        # 촬영 화면이 현재 페이지일 때만 카메라 캡처/프리뷰 동작 (처음에는 스플래시 화면)
+        self.webcam.pause()
+        self.stack.currentChanged.connect(self.on_page_changed)
+
         self.capture_button = self.add_capture_button()
 
         layout = QVBoxLayout()
@@ -144,6 +148,14 @@ class PhotoScreen(QWidget):
             
         self.stack.setCurrentIndex(2)
 
+    def on_page_changed(self, index):
+        """스택 페이지가 바뀌면 카메라 일시 정지/재개 (장치는 열어 두어 바로 다시 시작)"""
+        if self.stack.widget(index) is self:
+            self.webcam.resume()
+        else:
+            self.webcam.reset_countdown()
+            self.webcam.pause()
+
     def close_application(self):
         """앱 종료 동작"""
         QCoreApplication.instance().quit()  # 전체 애플리케이션 종료
@@ -0,0 +1,115 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import cv2
+from printer_utils.config_reader import read_config
+from utils.preview_geometry import PreviewGeometry
+
+# 얼굴 검출은 이 크기(긴 변)로 줄인 사본에서 수행
+DETECT_MAX_SIDE = 480
+# 증명사진 비율: 얼굴 너비가 프리뷰 너비에서 차지하는 비율과 얼굴 중심의 세로 위치
+FACE_WIDTH_RATIO = 0.45
+FACE_CENTER_Y = 0.45
+
+
+class AutoFramer:
+    """촬영한 사진에서 얼굴을 찾아 정보 입력 화면의 첫 프리뷰 배율/위치를 정하는 클래스
+
+    얼굴 검출(OpenCV Haar cascade, CPU)은 줄인 사본으로 작업 스레드에서 실행하며,
+    submit()은 결과를 기다리지 않고 Future를 반환한다.
+    config.txt의 auto_framing = 0 으로 끌 수 있다.
+    """
+
+    def __init__(self):
+        self.enabled = bool(read_config().get("auto_framing", 1))
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="auto-framing")
+        self.classifier = None  # 작업 스레드에서 처음 사용할 때 로드
+        self._futures = {}  # 이미지 경로 -> 마지막으로 등록한 검출 작업
+        self._lock = threading.Lock()
+
+    def submit(self, path, bgr):
+        """사진의 얼굴 검출 시작 (같은 경로의 이전 결과는 대체됨)
+
+        Returns:
+            Future: 얼굴 영역 (x, y, width, height, 원본 좌표) 또는 None
+        """
+        if not self.enabled:
+            return None
+        future = self.executor.submit(self.detect_face, bgr)
+        with self._lock:
+            self._futures[path] = future
+        return future
+
+    def get(self, path):
+        """경로의 마지막 검출 작업 (없으면 None)"""
+        with self._lock:
+            return self._futures.get(path)
+
+    def discard(self, path):
+        """더 이상 쓰지 않는 사진의 검출 결과 삭제"""
+        with self._lock:
+            self._futures.pop(path, None)
+
+    def _load_classifier(self):
+        if self.classifier is None:
+            cascade_path = os.path.join(cv2.data.haarcascades, "haarcascade_frontalface_default.xml")
+            classifier = cv2.CascadeClassifier(cascade_path)
+            if classifier.empty():
+                print(f"얼굴 검출 모델을 불러올 수 없습니다: {cascade_path}")
+                self.enabled = False
+                return None
+            self.classifier = classifier
+        return self.classifier
+
+    def detect_face(self, bgr):
+        """가장 큰 얼굴 영역 반환 (작업 스레드에서 실행, 찾지 못하면 None)"""
+        classifier = self._load_classifier()
+        if classifier is None:
+            return None
+
+        height, width = bgr.shape[:2]
+        scale = min(1.0, DETECT_MAX_SIDE / max(width, height))
+        small = cv2.resize(bgr, (int(width * scale), int(height * scale)), interpolation=cv2.INTER_AREA)
+        gray = cv2.equalizeHist(cv2.cvtColor(small, cv2.COLOR_BGR2GRAY))
+
+        min_side = max(24, int(min(gray.shape[:2]) * 0.1))
+        faces = classifier.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=5,
+                                            minSize=(min_side, min_side))
+        if len(faces) == 0:
+            return None
+
+        x, y, w, h = max(faces, key=lambda face: face[2] * face[3])
+        return tuple(int(round(value / scale)) for value in (x, y, w, h))
+
+
+# 웹캠 촬영 화면이 검출을 시작하고 정보 입력 화면이 결과를 사용
+auto_framer = AutoFramer()
+
+
+def compute_framing(face, image_size, frame_size, zoom_range):
+    """얼굴이 증명사진 비율로 보이도록 하는 프리뷰 배율과 이동량 계산
+
+    Args:
+        face: 얼굴 영역 (x, y, width, height, 원본 좌표)
+        image_size: 원본 이미지 크기 (너비, 높이)
+        frame_size: 프리뷰 프레임 크기 (너비, 높이)
+        zoom_range: 줌 슬라이더 범위 (최솟값, 최댓값, 슬라이더 값 = 배율 x 10)
+
+    Returns:
+        tuple: (줌 슬라이더 값, (x, y) 이동량)
+    """
+    x, y, w, h = face
+    frame_width, frame_height = frame_size
+
+    # 배율 1.0일 때의 표시 배율로 원하는 얼굴 너비가 되는 배율 계산 (표시 크기는 배율에 비례)
+    base = PreviewGeometry(image_size, frame_size, 1.0)
+    base_scale = base.display_width / image_size[0]
+    zoom = FACE_WIDTH_RATIO * frame_width / (w * base_scale)
+    zoom_value = int(round(min(max(zoom * 10, zoom_range[0]), zoom_range[1])))
+
+    # 얼굴 중심이 프레임의 목표 위치에 오도록 이동 (프레임 밖이 보이지 않게 제한)
+    geometry = PreviewGeometry(image_size, frame_size, zoom_value / 10.0)
+    face_x, face_y = geometry.to_preview([(x + w / 2, y + h / 2)])[0]
+    position_x = frame_width / 2 - face_x
+    position_y = frame_height * FACE_CENTER_Y - face_y
+    return zoom_value, geometry.clamp_position(int(position_x), int(position_y))
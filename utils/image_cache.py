@@ -0,0 +1,114 @@
+import os
+import threading
+import cv2
+from utils.image_pyramid import ImagePyramid
+
+
+class DecodedImage:
+    """한 번 디코딩한 이미지 (BGR 원본과 필요할 때 만드는 프리뷰용 이미지 단계)
+
+    캐시에 보관되어 여러 곳에서 함께 사용하므로 배열은 읽기 전용이다.
+    그림을 그리거나 수정하려면 .copy() 할 것.
+    """
+
+    def __init__(self, path, mtime, bgr):
+        self.path = path
+        self.mtime = mtime
+        bgr.setflags(write=False)
+        self.bgr = bgr
+        self._pyramid = None
+        self._lock = threading.Lock()
+
+    @property
+    def pyramid(self):
+        """프리뷰 확대/축소용 이미지 단계 (처음 사용할 때 백그라운드에서 생성 시작)
+
+        프리뷰 버퍼는 BGR로 그리므로 색 변환 없이 원본으로 만든다.
+        """
+        if self._pyramid is None:
+            pyramid = ImagePyramid(self.bgr)
+            with self._lock:
+                if self._pyramid is None:
+                    self._pyramid = pyramid
+                    pyramid.build_async()
+        return self._pyramid
+
+    @property
+    def width(self):
+        return self.bgr.shape[1]
+
+    @property
+    def height(self):
+        return self.bgr.shape[0]
+
+
+class ImageCache:
+    """파일 경로와 수정 시각으로 디코딩 결과를 보관하는 캐시
+
+    같은 파일을 다시 읽을 때는 디코딩 없이 보관된 배열을 돌려주고,
+    파일이 바뀌면(수정 시각 변경) 다시 디코딩한다.
+    """
+
+    def __init__(self, max_entries=4):
+        self.max_entries = max_entries
+        self._entries = {}  # 경로 -> DecodedImage
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _mtime(path):
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def get(self, path):
+        """디코딩된 이미지 반환 (파일이 없거나 읽을 수 없으면 None)"""
+        mtime = self._mtime(path)
+        if mtime is None:
+            self.invalidate(path)
+            return None
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry.mtime == mtime:
+                return entry
+
+        bgr = cv2.imread(path)
+        if bgr is None:
+            return None
+        return self._store(path, mtime, bgr)
+
+    def put(self, path, bgr):
+        """이미 메모리에 있는 이미지를 파일 경로로 등록 (디스크에서 다시 읽지 않도록)
+
+        웹캠에서 촬영한 프레임처럼 방금 파일로 저장한 이미지에 사용한다.
+        """
+        mtime = self._mtime(path)
+        if mtime is None:
+            return None
+        entry = self._store(path, mtime, bgr)
+        # 화면이 바뀌는 동안 프리뷰용 이미지 단계를 미리 만들어 둠
+        entry.pyramid
+        return entry
+
+    def _store(self, path, mtime, bgr):
+        entry = DecodedImage(path, mtime, bgr)
+        with self._lock:
+            self._entries.pop(path, None)
+            self._entries[path] = entry
+            # 오래된 항목부터 정리
+            while len(self._entries) > self.max_entries:
+                del self._entries[next(iter(self._entries))]
+        return entry
+
+    def invalidate(self, path=None):
+        """특정 경로(None이면 전체)의 캐시 삭제"""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(path, None)
+
+
+# 웹캠 촬영 화면과 정보 입력 화면이 함께 사용하는 캐시
+image_cache = ImageCache()
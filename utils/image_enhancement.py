@@ -0,0 +1,78 @@
+import cv2
+import numpy as np
+from printer_utils.config_reader import read_config
+
+# config.txt 항목 -> 기본값 (0이면 해당 보정을 건너뜀)
+DEFAULT_SETTINGS = {
+    "enhance": 1,  # 보정 전체 사용 여부
+    "enhance_white_balance": 0.6,  # 회색 가정 화이트 밸런스 강도 (0 ~ 1)
+    "enhance_clahe_clip": 1.5,  # 밝기 대비 보정(CLAHE) 강도
+    "enhance_clahe_grid": 4,  # CLAHE 타일 수 (가로/세로)
+    "enhance_sharpen": 0.4,  # 언샤프 마스크 강도
+    "enhance_sharpen_sigma": 1.0,  # 언샤프 마스크 흐림 반경
+}
+
+# 화이트 밸런스로 한 채널을 조정하는 최대 비율 (한 가지 색이 대부분인 사진 보호)
+MAX_CHANNEL_GAIN = 1.5
+
+
+def white_balance(bgr, strength):
+    """회색 가정(gray world) 화이트 밸런스 - 채널 평균이 같아지도록 채널별 배율 적용"""
+    means = np.asarray(cv2.mean(bgr)[:3])
+    if means.min() <= 0:
+        return bgr
+    gains = means.mean() / means
+    gains = np.clip(1 + (gains - 1) * strength, 1 / MAX_CHANNEL_GAIN, MAX_CHANNEL_GAIN)
+    # 채널별 배율을 256단계 조회표 하나로 만들어 한 번에 적용
+    table = np.clip(np.arange(256)[:, None] * gains + 0.5, 0, 255).astype(np.uint8)
+    return cv2.LUT(bgr, table.reshape(256, 1, 3))
+
+
+def equalize_luminance(bgr, clip_limit, grid):
+    """밝기(YCrCb의 Y) 채널에만 CLAHE 적용 (색상은 그대로)
+
+    Lab보다 변환 비용이 훨씬 적다 (438x438 기준 왕복 0.5 ms, Lab은 4.3 ms).
+    """
+    luma, cr, cb = cv2.split(cv2.cvtColor(bgr, cv2.COLOR_BGR2YCrCb))
+    # CLAHE 객체는 스레드 간에 공유하지 않도록 호출마다 생성 (생성 비용은 무시할 수준)
+    clahe = cv2.createCLAHE(clipLimit=clip_limit, tileGridSize=(grid, grid))
+    return cv2.cvtColor(cv2.merge((clahe.apply(luma), cr, cb)), cv2.COLOR_YCrCb2BGR)
+
+
+def unsharp_mask(bgr, amount, sigma):
+    """언샤프 마스크: 원본 + amount x (원본 - 흐린 이미지)"""
+    blurred = cv2.GaussianBlur(bgr, (0, 0), sigma)
+    return cv2.addWeighted(bgr, 1 + amount, blurred, -amount, 0)
+
+
+class ImageEnhancer:
+    """인쇄할 사진(카드 사진 칸 크기)의 노출/색/선명도 보정
+
+    행사장마다 조명이 달라지는 것을 보정하기 위해 화이트 밸런스 -> 밝기 대비(CLAHE)
+    -> 선명도 순서로 적용한다. 작은 인쇄용 이미지에만 적용하므로 작업 스레드에서
+    카드 한 장당 수 ms 이내로 끝난다. 각 단계의 강도는 config.txt에서 조정한다.
+    """
+
+    def __init__(self, settings=None):
+        if settings is None:
+            settings = read_config()
+        self.settings = {key: settings.get(key, value) for key, value in DEFAULT_SETTINGS.items()}
+
+    @property
+    def enabled(self):
+        return bool(self.settings["enhance"])
+
+    def enhance(self, bgr):
+        """보정한 새 이미지 반환 (입력 배열은 수정하지 않음)"""
+        if not self.enabled:
+            return bgr
+        settings = self.settings
+        result = bgr
+        if settings["enhance_white_balance"] > 0:
+            result = white_balance(result, settings["enhance_white_balance"])
+        if settings["enhance_clahe_clip"] > 0:
+            result = equalize_luminance(result, settings["enhance_clahe_clip"],
+                                        int(settings["enhance_clahe_grid"]))
+        if settings["enhance_sharpen"] > 0:
+            result = unsharp_mask(result, settings["enhance_sharpen"], settings["enhance_sharpen_sigma"])
+        return result
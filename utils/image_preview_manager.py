@@ -1,10 +1,18 @@
 from PySide6.QtWidgets import QFrame, QLabel, QSlider, QPushButton, QHBoxLayout
-from PySide6.QtCore import Qt, QPoint, Signal
-from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtCore import Qt
 import cv2
 import numpy as np
-import os
 from utils.temp_path import get_temp_path
+from utils.image_cache import image_cache
+from utils.image_pyramid import render_viewport
+from utils.preview_scheduler import PreviewRenderScheduler
+from utils.preview_geometry import PreviewGeometry
+from utils.frame_presenter import FramePresenter
+from utils.auto_framing import compute_framing
+
+# 줌 슬라이더 범위와 기본값 (슬라이더 값 = 배율 x 10)
+ZOOM_RANGE = (10, 55)
+DEFAULT_ZOOM = 14
 
 class ImagePreviewManager:
     """이미지 프리뷰, 회전, 확대/축소 등 이미지 처리 관련 기능을 관리하는 클래스"""
@@ -17,6 +25,11 @@ class ImagePreviewManager:
         self.image_position = {"x": 0, "y": 0}
         self.rotation_angle = 0
         self.captured_image_path = "resources/captured_image.jpg"  # 기본 경로 설정
+        self.geometry = None  # 마지막으로 계산한 프리뷰 좌표 변환
+        self.geometry_key = None
+        
+        # 드래그/확대/회전 이벤트마다 그리지 않고 한 프레임에 한 번만 그림
+        self.render_scheduler = PreviewRenderScheduler(self.update_preview, parent=parent_widget)
         
         # UI 요소 생성
         self.setup_ui()
@@ -40,6 +53,8 @@ class ImagePreviewManager:
         self.preview_label = QLabel(self.preview_frame)
         self.preview_label.setFixedSize(self.preview_width, self.preview_height)
         self.preview_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        # 프리뷰 출력 버퍼/QImage/픽스맵 재사용
+        self.presenter = FramePresenter(self.preview_label)
         
         # 마우스 이벤트 추적을 위한 설정
         self.preview_frame.mousePressEvent = self.start_drag
@@ -64,10 +79,10 @@ class ImagePreviewManager:
         zoom_label.setStyleSheet("color: #333; font-size: 13px;")
         
         self.zoom_slider = QSlider(Qt.Orientation.Horizontal)
-        self.zoom_slider.setRange(10, 55)
-        self.zoom_slider.setValue(14)
+        self.zoom_slider.setRange(*ZOOM_RANGE)
+        self.zoom_slider.setValue(DEFAULT_ZOOM)
         self.zoom_slider.setFixedWidth(200)  # 슬라이더 너비 고정
-        self.zoom_slider.valueChanged.connect(self.update_preview)
+        self.zoom_slider.valueChanged.connect(self.request_preview)
         self.zoom_slider.setStyleSheet("""
             QSlider::groove:horizontal {
                 height: 4px;
@@ -104,10 +119,22 @@ class ImagePreviewManager:
 
         controls_layout.addWidget(zoom_container)
 
-    def set_image_path(self, image_path):
-        """이미지 경로 설정"""
+    def set_image_path(self, image_path, render=True):
+        """이미지 경로 설정 (render=False이면 배율/위치를 정한 뒤 호출하는 쪽에서 그림)"""
+        if image_path != self.captured_image_path:
+            # 더 이상 쓰지 않는 이전 이미지는 캐시에서 제거
+            image_cache.invalidate(self.captured_image_path)
         self.captured_image_path = image_path
-        self.update_preview()
+        if render:
+            self.update_preview()
+
+    def load_image(self):
+        """현재 이미지를 디코딩된 상태로 반환 (캐시 사용, 파일이 바뀌면 다시 읽음)"""
+        return image_cache.get(self.captured_image_path)
+
+    def invalidate_image(self):
+        """현재 이미지 캐시 삭제 (재촬영 등으로 파일이 없어질 때)"""
+        image_cache.invalidate(self.captured_image_path)
     
     def start_drag(self, event):
         """이미지 드래그 시작"""
@@ -117,44 +144,15 @@ class ImagePreviewManager:
         """이미지 드래그 중"""
         if self.drag_start_pos:
             delta = event.pos() - self.drag_start_pos
+            geometry = self.get_geometry()
             
-            # 현재 줌 레벨에서의 이미지 크기 계산
-            zoom = self.zoom_slider.value() / 10.0
-            
-            # 이미지 파일 경로
-            image_path = self.captured_image_path
-            current_image = cv2.imread(image_path)
-            
-            if current_image is not None:
-                img_height, img_width = current_image.shape[:2]
-                
-                # 이미지 크기와 프리뷰 프레임의 비율 계산
-                frame_ratio = self.preview_frame.width() / self.preview_frame.height()
-                image_ratio = img_width / img_height
-                
-                if image_ratio > frame_ratio:
-                    # 이미지가 더 넓은 경우
-                    display_width = self.preview_frame.width() * zoom
-                    display_height = display_width / image_ratio
-                else:
-                    # 이미지가 더 높은 경우
-                    display_height = self.preview_frame.height() * zoom
-                    display_width = display_height * image_ratio
-                
-                # 드래그 범위 제한
-                if display_width > self.preview_frame.width() or display_height > self.preview_frame.height():
-                    self.image_position["x"] += delta.x()
-                    self.image_position["y"] += delta.y()
-                    
-                    # 최대 이동 범위 계산
-                    max_x = (display_width - self.preview_frame.width()) / 2
-                    max_y = (display_height - self.preview_frame.height()) / 2
-                    
-                    # 이동 범위 제한
-                    self.image_position["x"] = max(-max_x, min(max_x, self.image_position["x"]))
-                    self.image_position["y"] = max(-max_y, min(max_y, self.image_position["y"]))
-                    
-                    self.update_preview()
+            # 이미지가 프레임보다 클 때만 이동 (프레임 밖으로 벗어나지 않도록 제한)
+            if geometry is not None and geometry.can_drag():
+                x, y = geometry.clamp_position(self.image_position["x"] + delta.x(),
+                                               self.image_position["y"] + delta.y())
+                self.image_position["x"] = x
+                self.image_position["y"] = y
+                self.request_preview()
             
             self.drag_start_pos = event.pos()
     
@@ -166,230 +164,187 @@ class ImagePreviewManager:
         """이미지 회전"""
         self.rotation_angle = (self.rotation_angle + 90) % 360
         self.image_position = {"x": 0, "y": 0}
-        self.update_preview()
+        self.request_preview()
+    
+    def request_preview(self):
+        """다음 프레임에 프리뷰 업데이트 예약 (연속된 요청은 하나로 합쳐짐)"""
+        self.render_scheduler.request()
     
     def update_preview(self):
-        """이미지 프리뷰 업데이트"""
-        # 이미지 파일 경로 사용
-        image_path = self.captured_image_path
-        image = cv2.imread(image_path)
+        """이미지 프리뷰 업데이트 (바로 그림)"""
+        # 예약된 그리기는 지금 그리는 것으로 대체
+        self.render_scheduler.cancel()
+        image = self.load_image()
         
         if image is not None:
-            # OpenCV BGR -> RGB 변환
-            image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            img_height, img_width = image_rgb.shape[:2]
-            
-            # 회전 적용
-            if self.rotation_angle != 0:
-                matrix = cv2.getRotationMatrix2D((img_width/2, img_height/2), self.rotation_angle, 1)
-                image_rgb = cv2.warpAffine(image_rgb, matrix, (img_width, img_height))
+            geometry = self.get_geometry(image)
             
-            # 프리뷰 프레임과 이미지 비율 계산
-            frame_ratio = self.preview_frame.width() / self.preview_frame.height()
-            image_ratio = img_width / img_height
+            # 표시 크기 이상인 가장 작은 이미지 단계 선택 (원본 전체를 리사이즈하지 않음)
+            level = image.pyramid.level_for(geometry.display_width, geometry.display_height)
             
-            # 줌 레벨 계산
-            zoom = self.zoom_slider.value() / 10.0
+            # 재사용하는 캔버스를 흰색으로 초기화 (프리뷰 프레임 크기)
+            canvas = self.presenter.next_buffer(self.preview_frame.width(), self.preview_frame.height())
+            canvas.fill(255)
             
-            # 이미지 크기 계산
-            if image_ratio > frame_ratio:
-                # 이미지가 더 넓은 경우
-                display_width = self.preview_frame.width() * zoom
-                display_height = display_width / image_ratio
-            else:
-                # 이미지가 더 높은 경우
-                display_height = self.preview_frame.height() * zoom
-                display_width = display_height * image_ratio
+            # 회전/확대/이동을 한 번에 적용하여 캔버스에 보이는 영역만 그림
+            render_viewport(level, geometry.display_width, geometry.display_height,
+                            geometry.x_offset, geometry.y_offset, canvas, geometry.rotation_angle)
             
-            # 이미지 리사이즈
-            image_rgb = cv2.resize(image_rgb, (int(display_width), int(display_height)))
-            
-            # 캔버스 생성 (프리뷰 프레임 크기)
-            canvas = np.full((self.preview_frame.height(), self.preview_frame.width(), 3), 255, dtype=np.uint8)
-            
-            # 이미지 중앙 정렬 및 위치 조정
-            x_offset = int((self.preview_frame.width() - display_width) / 2 + self.image_position["x"])
-            y_offset = int((self.preview_frame.height() - display_height) / 2 + self.image_position["y"])
-            
-            # 이미지를 캔버스에 붙이기 (범위 체크)
-            y1 = max(0, y_offset)
-            y2 = min(self.preview_frame.height(), y_offset + image_rgb.shape[0])
-            x1 = max(0, x_offset)
-            x2 = min(self.preview_frame.width(), x_offset + image_rgb.shape[1])
-            
-            if y2 > y1 and x2 > x1:
-                img_y1 = max(0, -y_offset)
-                img_y2 = img_y1 + (y2 - y1)
-                img_x1 = max(0, -x_offset)
-                img_x2 = img_x1 + (x2 - x1)
-                
-                canvas[y1:y2, x1:x2] = image_rgb[img_y1:img_y2, img_x1:img_x2]
-            
-            # QImage로 변환 및 표시
-            height, width = canvas.shape[:2]
-            bytes_per_line = 3 * width
-            qt_image = QImage(canvas.data, width, height, bytes_per_line, QImage.Format.Format_RGB888)
-            self.preview_label.setPixmap(QPixmap.fromImage(qt_image))
+            # 버퍼를 가리키는 QImage로 바로 표시
+            self.presenter.present()
+    
+    def clear_preview(self):
+        """프리뷰를 흰 화면으로 비움"""
+        self.render_scheduler.cancel()
+        canvas = self.presenter.next_buffer(self.preview_frame.width(), self.preview_frame.height())
+        canvas.fill(255)
+        self.presenter.present()
     
     def reset(self):
         """프리뷰 상태 초기화"""
         self.rotation_angle = 0
-        self.zoom_slider.setValue(14)
+        self.zoom_slider.setValue(DEFAULT_ZOOM)
         self.image_position = {"x": 0, "y": 0}
         self.update_preview()
     
-    def get_preview_coordinates(self):
-        """현재 프리뷰 영역의 원본 이미지 내 좌표와 크기 계산"""
-        # 이미지 파일 경로
-        image_path = self.captured_image_path
-        image = cv2.imread(image_path)
-        
+    def is_default_view(self):
+        """사용자가 아직 확대/이동/회전하지 않은 초기 상태인지 여부"""
+        return (self.zoom_slider.value() == DEFAULT_ZOOM and self.rotation_angle == 0
+                and self.image_position == {"x": 0, "y": 0})
+    
+    def apply_face_framing(self, face):
+        """검출된 얼굴이 증명사진 비율로 보이도록 배율과 위치 설정 (그리기는 호출하는 쪽에서)
+
+        Args:
+            face: 얼굴 영역 (x, y, width, height, 원본 좌표)
+        """
+        image = self.load_image()
         if image is None:
-            return None
-            
-        # 원본 이미지 크기
-        img_height, img_width = image.shape[:2]
-        
-        # 줌 레벨 계산
-        zoom = self.zoom_slider.value() / 10.0
-        
-        # 프리뷰 프레임과 이미지 비율 계산
-        frame_ratio = self.preview_frame.width() / self.preview_frame.height()
-        image_ratio = img_width / img_height
-        
-        # 이미지 크기 계산
-        if image_ratio > frame_ratio:
-            # 이미지가 더 넓은 경우
-            display_width = self.preview_frame.width() * zoom
-            display_height = display_width / image_ratio
-        else:
-            # 이미지가 더 높은 경우
-            display_height = self.preview_frame.height() * zoom
-            display_width = display_height * image_ratio
-        
-        # 이미지 중앙 정렬 및 위치 조정
-        x_offset = int((self.preview_frame.width() - display_width) / 2 + self.image_position["x"])
-        y_offset = int((self.preview_frame.height() - display_height) / 2 + self.image_position["y"])
+            return False
+        zoom_value, (x, y) = compute_framing(
+            face,
+            (image.width, image.height),
+            (self.preview_frame.width(), self.preview_frame.height()),
+            ZOOM_RANGE
+        )
+        # 슬라이더 시그널로 그리기가 예약되지 않도록 막고 값만 변경
+        self.zoom_slider.blockSignals(True)
+        self.zoom_slider.setValue(zoom_value)
+        self.zoom_slider.blockSignals(False)
+        self.image_position = {"x": x, "y": y}
+        return True
+    
+    def get_geometry(self, image=None):
+        """현재 상태(이미지, 프레임 크기, 배율, 위치, 각도)의 프리뷰 좌표 변환
+
+        상태가 바뀌지 않았으면 이전에 계산한 변환을 재사용한다.
+        """
+        if image is None:
+            image = self.load_image()
+            if image is None:
+                return None
         
-        # 프리뷰 프레임 내에서 보이는 영역 계산
-        visible_x1 = max(0, -x_offset)
-        visible_y1 = max(0, -y_offset)
-        visible_x2 = min(display_width, self.preview_frame.width() - x_offset)
-        visible_y2 = min(display_height, self.preview_frame.height() - y_offset)
+        key = (
+            image.width, image.height,
+            self.preview_frame.width(), self.preview_frame.height(),
+            self.zoom_slider.value(),
+            self.image_position["x"], self.image_position["y"],
+            self.rotation_angle,
+        )
+        if key != self.geometry_key:
+            self.geometry = PreviewGeometry(
+                (image.width, image.height),
+                (self.preview_frame.width(), self.preview_frame.height()),
+                self.zoom_slider.value() / 10.0,
+                (self.image_position["x"], self.image_position["y"]),
+                self.rotation_angle
+            )
+            self.geometry_key = key
+        return self.geometry
+    
+    def get_preview_coordinates(self):
+        """현재 프리뷰 영역의 원본 이미지 내 좌표와 크기 계산
+
+        Returns:
+            dict: 보이는 영역을 감싸는 사각형(x1, y1, x2, y2, width, height),
+                  rotation_angle, corners(원본 좌표 꼭짓점) (이미지가 없으면 None)
+        """
+        geometry = self.get_geometry()
+        if geometry is None:
+            return None
+        return geometry.source_bounds()
+    
+    def get_crop_params(self):
+        """크롭에 필요한 현재 상태를 모아 반환 (UI 스레드에서 호출)
+
+        반환된 값만으로 crop_image()를 다른 스레드에서 실행할 수 있다.
+
+        Returns:
+            dict: image(원본 BGR 배열), geometry, coordinates, rotation_angle, original_path
+                  (이미지를 불러올 수 없으면 None)
+        """
+        decoded = self.load_image()
+        if decoded is None:
+            print("이미지를 불러올 수 없습니다.")
+            return None
+        geometry = self.get_geometry(decoded)
         
-        # 원본 이미지에서의 비율 계산
-        scale_x = img_width / display_width
-        scale_y = img_height / display_height
+        return {
+            "image": decoded.bgr,
+            "geometry": geometry,
+            "coordinates": geometry.source_bounds(),
+            "rotation_angle": self.rotation_angle,
+            "original_path": self.captured_image_path,
+        }
+    
+    @staticmethod
+    def crop_image(image, geometry):
+        """원본 이미지에서 프리뷰에 보이는 영역만 원본 해상도로 잘라 반환
+
+        UI 상태를 쓰지 않으므로 작업 스레드에서 호출 가능하다.
+        """
+        if geometry.rotation_angle == 0:
+            # 회전이 없는 경우 직접 크롭 (복사 없음)
+            coords = geometry.source_bounds()
+            return image[coords["y1"]:coords["y2"], coords["x1"]:coords["x2"]]
         
-        # 원본 이미지에서의 좌표 계산
-        orig_x1 = int(visible_x1 * scale_x)
-        orig_y1 = int(visible_y1 * scale_y)
-        orig_x2 = int(visible_x2 * scale_x)
-        orig_y2 = int(visible_y2 * scale_y)
+        # 회전된 경우 프리뷰와 같은 방향으로 보이는 영역만 계산 (원본 밖은 검은색)
+        size = geometry.crop_size()
+        return cv2.warpAffine(image, geometry.crop_matrix(size), size,
+                              flags=cv2.INTER_LINEAR | cv2.WARP_INVERSE_MAP)
+    
+    @staticmethod
+    def crop_to_size(image, geometry, size):
+        """프리뷰 영역을 잘라 카드에 찍히는 크기(size)의 이미지로 바로 만듦
+
+        축소 비율이 2배 이내인 회전 이미지는 회전/크롭/축소를 한 번의 변환으로 처리하고,
+        그보다 많이 줄이는 경우에는 크롭한 뒤 INTER_AREA로 축소하여 계단 현상을 막는다.
+        """
+        width, height = size
+        crop_width, crop_height = geometry.crop_size()
         
-        # 회전이 적용된 경우 좌표 변환
-        if self.rotation_angle != 0:
-            # 회전 중심점 (원본 이미지 중심)
-            center_x = img_width / 2
-            center_y = img_height / 2
-            
-            # 회전 전 좌표를 중심점 기준으로 변환
-            points = [
-                (orig_x1, orig_y1),  # 좌상단
-                (orig_x2, orig_y1),  # 우상단
-                (orig_x2, orig_y2),  # 우하단
-                (orig_x1, orig_y2)   # 좌하단
-            ]
-            
-            # 회전 행렬 생성 (반시계 방향으로 회전)
-            angle_rad = -np.radians(self.rotation_angle)
-            cos_val = np.cos(angle_rad)
-            sin_val = np.sin(angle_rad)
-            
-            # 회전된 좌표 계산
-            rotated_points = []
-            for x, y in points:
-                # 중심점 기준으로 좌표 이동
-                tx = x - center_x
-                ty = y - center_y
-                
-                # 회전 적용
-                rx = tx * cos_val - ty * sin_val
-                ry = tx * sin_val + ty * cos_val
-                
-                # 다시 원래 좌표계로 이동
-                rotated_points.append((int(rx + center_x), int(ry + center_y)))
-            
-            # 회전된 좌표의 경계 계산
-            min_x = min(p[0] for p in rotated_points)
-            min_y = min(p[1] for p in rotated_points)
-            max_x = max(p[0] for p in rotated_points)
-            max_y = max(p[1] for p in rotated_points)
-            
-            # 경계값이 이미지 범위를 벗어나지 않도록 조정
-            min_x = max(0, min_x)
-            min_y = max(0, min_y)
-            max_x = min(img_width, max_x)
-            max_y = min(img_height, max_y)
-            
-            return {
-                "x1": min_x,
-                "y1": min_y,
-                "x2": max_x,
-                "y2": max_y,
-                "width": max_x - min_x,
-                "height": max_y - min_y,
-                "rotation_angle": self.rotation_angle,
-                "rotated_points": rotated_points
-            }
+        if geometry.rotation_angle != 0 and min(width / crop_width, height / crop_height) >= 0.5:
+            return cv2.warpAffine(image, geometry.crop_matrix(size), size,
+                                  flags=cv2.INTER_LINEAR | cv2.WARP_INVERSE_MAP)
         
-        return {
-            "x1": orig_x1,
-            "y1": orig_y1,
-            "x2": orig_x2,
-            "y2": orig_y2,
-            "width": orig_x2 - orig_x1,
-            "height": orig_y2 - orig_y1,
-            "rotation_angle": self.rotation_angle
-        }
+        # 회전이 없으면 원본의 일부(복사 없음)를 바로 리사이즈
+        cropped_image = ImagePreviewManager.crop_image(image, geometry)
+        if cropped_image.shape[1::-1] == (width, height):
+            return cropped_image
+        shrinking = cropped_image.shape[1] > width
+        interpolation = cv2.INTER_AREA if shrinking else cv2.INTER_CUBIC
+        return cv2.resize(cropped_image, (width, height), interpolation=interpolation)
     
     def crop_preview_area(self, output_path=None):
         """현재 프리뷰 영역만 크롭하여 저장"""
         if output_path is None:
             output_path = get_temp_path("cropped_preview.jpg")
-                
-        coords = self.get_preview_coordinates()
-        if coords is None:
-            print("이미지를 불러올 수 없습니다.")
-            return None
-            
-        # 원본 이미지 로드
-        image_path = self.captured_image_path
-        image = cv2.imread(image_path)
         
-        if image is None:
-            print("이미지를 불러올 수 없습니다.")
+        params = self.get_crop_params()
+        if params is None:
             return None
-            
-        # 회전이 적용된 경우
-        if self.rotation_angle != 0:
-            # 원본 이미지 크기
-            img_height, img_width = image.shape[:2]
-            
-            # 회전 중심점 (원본 이미지 중심)
-            center = (img_width // 2, img_height // 2)
-            
-            # 회전 행렬 생성
-            rotation_matrix = cv2.getRotationMatrix2D(center, self.rotation_angle, 1)
-            
-            # 이미지 회전
-            rotated_image = cv2.warpAffine(image, rotation_matrix, (img_width, img_height))
-            
-            # 회전된 이미지에서 프리뷰 영역 크롭
-            cropped_image = rotated_image[coords["y1"]:coords["y2"], coords["x1"]:coords["x2"]]
-        else:
-            # 회전이 없는 경우 직접 크롭
-            cropped_image = image[coords["y1"]:coords["y2"], coords["x1"]:coords["x2"]]
+        
+        cropped_image = self.crop_image(params["image"], params["geometry"])
         
         # 결과 이미지 저장
         cv2.imwrite(output_path, cropped_image)
@@ -398,8 +353,8 @@ class ImagePreviewManager:
         return {
             "cropped_image": cropped_image,
             "output_path": output_path,
-            "original_path": image_path,  # 원본 이미지 경로 추가
-            "coordinates": coords
+            "original_path": params["original_path"],  # 원본 이미지 경로 추가
+            "coordinates": params["coordinates"]
         }
     
     def show_preview_area(self, debug_mode=False):
@@ -409,31 +364,24 @@ class ImagePreviewManager:
             print("이미지를 불러올 수 없습니다.")
             return
             
-        # 원본 이미지 로드
-        image_path = self.captured_image_path
-        image = cv2.imread(image_path)
-        
-        if image is None:
-            print("이미지를 불러올 수 없습니다.")
-            return
-            
-        # 프리뷰 영역 표시
-        if self.rotation_angle != 0 and "rotated_points" in coords:
-            # 회전된 경우 다각형 그리기
-            points = np.array(coords["rotated_points"], np.int32)
-            points = points.reshape((-1, 1, 2))
-            cv2.polylines(image, [points], True, (0, 255, 0), 2)
-        else:
-            # 회전되지 않은 경우 사각형 그리기
-            cv2.rectangle(image, (coords["x1"], coords["y1"]), (coords["x2"], coords["y2"]), (0, 255, 0), 2)
-        
         # 좌표 정보 출력
         print(f"프리뷰 영역 좌표: x1={coords['x1']}, y1={coords['y1']}, x2={coords['x2']}, y2={coords['y2']}")
         print(f"프리뷰 영역 크기: 너비={coords['width']}, 높이={coords['height']}")
         print(f"회전 각도: {coords['rotation_angle']}도")
         
-        # 디버깅 모드일 때만 이미지 저장
+        # 디버깅 모드일 때만 영역을 그린 이미지 저장
         if debug_mode:
+            decoded = self.load_image()
+            if decoded is None:
+                print("이미지를 불러올 수 없습니다.")
+                return coords
+            # 캐시된 원본은 읽기 전용이므로 사본에 그림
+            image = decoded.bgr.copy()
+            
+            # 프리뷰 영역 표시 (회전된 경우 기울어진 사각형)
+            points = np.array(coords["corners"], np.int32).reshape((-1, 1, 2))
+            cv2.polylines(image, [points], True, (0, 255, 0), 2)
+            
             preview_area_image_path = get_temp_path("preview_area.jpg")
             cv2.imwrite(preview_area_image_path, image)
             print(f"프리뷰 영역이 표시된 이미지가 저장되었습니다: {preview_area_image_path}")
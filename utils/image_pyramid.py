@@ -0,0 +1,88 @@
+import threading
+import cv2
+import numpy as np
+
+# 이 크기보다 작아지면 더 줄이지 않음 (프리뷰 최소 표시 크기보다 작게)
+MIN_LEVEL_SIZE = 256
+
+
+class ImagePyramid:
+    """원본을 절반씩 줄인 이미지 단계(밉맵)를 보관
+
+    0단계는 원본이며, 나머지 단계는 build_async()로 백그라운드에서 만든다.
+    만드는 도중에도 levels에 이미 추가된 단계는 바로 사용할 수 있다.
+    """
+
+    def __init__(self, image):
+        self.levels = [image]
+        self._thread = None
+
+    def build(self):
+        """남은 단계를 모두 생성 (INTER_AREA로 절반씩 축소)"""
+        level = self.levels[-1]
+        while max(level.shape[:2]) // 2 >= MIN_LEVEL_SIZE:
+            height, width = level.shape[:2]
+            level = cv2.resize(level, (width // 2, height // 2), interpolation=cv2.INTER_AREA)
+            level.setflags(write=False)
+            # 리스트 append는 원자적이므로 읽는 쪽은 잠금 없이 사용 가능
+            self.levels.append(level)
+
+    def build_async(self):
+        """백그라운드 스레드에서 단계 생성 시작 (이미 시작했으면 무시)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.build, name="image-pyramid", daemon=True)
+            self._thread.start()
+        return self._thread
+
+    def level_for(self, display_width, display_height):
+        """표시 크기 이상인 단계 중 가장 작은 단계 반환 (축소 비율이 2배 이내가 되도록)"""
+        chosen = self.levels[0]
+        for level in self.levels[1:]:
+            height, width = level.shape[:2]
+            if width < display_width or height < display_height:
+                break
+            chosen = level
+        return chosen
+
+
+def render_viewport(level, display_width, display_height, x_offset, y_offset, canvas, rotation_angle=0):
+    """display 크기로 확대/축소한 이미지 중 캔버스에 보이는 부분만 계산하여 그림
+
+    전체 이미지를 회전하거나 display 크기로 리사이즈하지 않고, 회전/확대/이동을
+    하나의 아핀 변환으로 합쳐 캔버스와 겹치는 영역의 픽셀만 level에서 직접 샘플링한다.
+
+    Args:
+        level: 샘플링할 이미지 단계 (BGR 배열)
+        display_width, display_height: 확대/축소된 이미지의 크기
+        x_offset, y_offset: 캔버스 안에서 확대/축소된 이미지의 왼쪽 위 위치
+        canvas: 결과를 그릴 배열 (보이지 않는 부분은 그대로 둠)
+        rotation_angle: 이미지 중심 기준 회전 각도 (크기는 그대로, 벗어난 부분은 검은색)
+    """
+    canvas_height, canvas_width = canvas.shape[:2]
+    y1 = max(0, y_offset)
+    y2 = min(canvas_height, y_offset + display_height)
+    x1 = max(0, x_offset)
+    x2 = min(canvas_width, x_offset + display_width)
+    if y2 <= y1 or x2 <= x1:
+        return
+
+    level_height, level_width = level.shape[:2]
+    scale_x = display_width / level_width
+    scale_y = display_height / level_height
+
+    # 단계 좌표 -> 보이는 영역 좌표 (cv2.resize와 같이 픽셀 중심 기준으로 맞춤)
+    matrix = np.array([
+        [scale_x, 0, x_offset - x1 + (scale_x - 1) / 2],
+        [0, scale_y, y_offset - y1 + (scale_y - 1) / 2],
+        [0, 0, 1],
+    ])
+    border_mode = cv2.BORDER_REPLICATE
+    if rotation_angle != 0:
+        # 단계 중심 기준 회전을 먼저 적용한 것과 같도록 변환을 합침
+        rotation = cv2.getRotationMatrix2D((level_width / 2, level_height / 2), rotation_angle, 1)
+        matrix = matrix @ np.vstack([rotation, [0, 0, 1]])
+        # 회전으로 원본 밖이 된 부분은 기존처럼 검은색
+        border_mode = cv2.BORDER_CONSTANT
+
+    cv2.warpAffine(level, matrix[:2], (x2 - x1, y2 - y1), dst=canvas[y1:y2, x1:x2],
+                   flags=cv2.INTER_LINEAR, borderMode=border_mode, borderValue=0)
@@ -0,0 +1,112 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import cv2
+from PIL import Image
+from PySide6.QtCore import QObject, Signal
+from printer_utils.card_layout import get_render_plan, get_image_size
+from utils.image_preview_manager import ImagePreviewManager
+from utils.image_enhancement import ImageEnhancer
+
+# 사진 필드 이름 (카드 레이아웃의 image.photo)
+PHOTO_FIELD = "photo"
+
+
+class IssuancePipeline(QObject):
+    """발급 버튼 이후의 작업을 UI 스레드 밖에서 처리하는 파이프라인
+
+    인쇄 크기로 크롭 -> 보정 -> 발급 기록 저장 -> 인쇄 작업 등록 순서로
+    작업 스레드 풀에서 실행하고, 진행 상황과 결과는 시그널로 UI 스레드에 알린다.
+    """
+    progress = Signal(str)  # 진행 중인 단계 설명
+    finished = Signal(object)  # 결과 딕셔너리
+    failed = Signal(str, str)  # (다이얼로그 제목, 메시지)
+
+    def __init__(self, print_manager, validator, max_workers=2):
+        super().__init__()
+        self.print_manager = print_manager
+        self.validator = validator
+        # 행사장 조명 차이를 줄이는 인쇄용 사진 보정 (config.txt의 enhance_* 항목)
+        self.enhancer = ImageEnhancer()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="issuance")
+        # 발급 기록(CSV)은 파일 전체를 다시 쓰므로 한 번에 하나씩만 기록
+        self.ledger_lock = threading.Lock()
+
+    def submit(self, name, birth_date, crop_params, on_printed=None):
+        """발급 작업 등록 (바로 반환)
+
+        Args:
+            name (str): 이름
+            birth_date (str): 생년월일(YYYYMMDD)
+            crop_params (dict): ImagePreviewManager.get_crop_params() 결과
+            on_printed: 인쇄 완료 시 호출할 콜백
+
+        Returns:
+            Future: 작업 완료 시 결과 딕셔너리 (실패하면 None)
+        """
+        return self.executor.submit(self._run, name, birth_date, crop_params, on_printed)
+
+    def _run(self, name, birth_date, crop_params, on_printed):
+        try:
+            return self._process(name, birth_date, crop_params, on_printed)
+        except Exception as e:
+            print(f"발급 처리 중 오류 발생: {e}")
+            self.failed.emit("이미지 처리 오류", "이미지 처리 중 오류가 발생했습니다.")
+            return None
+
+    def _process(self, name, birth_date, crop_params, on_printed):
+        # 1. 프리뷰 영역을 카드에 찍히는 크기로 바로 크롭/축소
+        self.progress.emit("사진 처리 중")
+        coords = crop_params["coordinates"]
+        print(f"프리뷰 영역 좌표: x1={coords['x1']}, y1={coords['y1']}, x2={coords['x2']}, y2={coords['y2']}")
+        geometry = crop_params["geometry"]
+        crop_size = geometry.crop_size()
+        if min(crop_size) <= 0:
+            self.failed.emit("이미지 처리 오류", "이미지 처리 중 오류가 발생했습니다.")
+            return None
+        plan = get_render_plan(self.print_manager.layout_path)
+        print_size = get_image_size(plan, PHOTO_FIELD)
+        if print_size is None:
+            # 레이아웃에 사진 칸이 없으면 원본 해상도로 자른 크기 그대로 사용
+            print_size = crop_size
+        raster = ImagePreviewManager.crop_to_size(crop_params["image"], geometry, print_size)
+
+        # 2. 노출/색/선명도 보정 (인쇄 크기 이미지에만 적용)
+        raster = self.enhancer.enhance(raster)
+
+        # 3. 인쇄 단계로 메모리에서 바로 전달 (JPEG 인코딩/디코딩 없음)
+        photo = Image.fromarray(cv2.cvtColor(raster, cv2.COLOR_BGR2RGB))
+
+        # 4. 발급 기록 저장
+        self.progress.emit("발급 기록 저장 중")
+        with self.ledger_lock:
+            success = self.validator.add_record(name, birth_date)
+        if not success:
+            self.failed.emit(
+                "데이터 저장 오류",
+                "발급 기록을 저장할 수 없습니다.\n\n발급기록.csv 파일이 열려있다면 닫아주세요.\n"
+                "그래도 문제가 계속되면 관리자에게 문의하세요."
+            )
+            return None
+
+        # 5. 인쇄 작업 등록 (실제 인쇄는 PrintManager의 워커가 처리)
+        self.progress.emit("인쇄 등록 중")
+        success = self.print_manager.print_card(
+            photo,
+            name,
+            on_finished_callback=on_printed
+        )
+        if not success:
+            self.failed.emit("인쇄 오류", "인쇄 작업을 등록하지 못했습니다.\n관리자에게 문의하세요.")
+            return None
+
+        result = {
+            "name": name,
+            "photo": photo,
+            "original_path": crop_params["original_path"],
+        }
+        self.finished.emit(result)
+        return result
+
+    def shutdown(self):
+        """진행 중인 발급 작업을 마친 뒤 스레드 풀 종료"""
+        self.executor.shutdown(wait=True)
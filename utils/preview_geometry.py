@@ -0,0 +1,158 @@
+import numpy as np
+
+
+class PreviewGeometry:
+    """프리뷰 화면 좌표와 원본 이미지 좌표 사이의 변환
+
+    원본 -> 프리뷰 변환(이미지 중심 기준 회전, 확대/축소, 이동)을 3x3 행렬 하나로
+    표현하고, 좌표 변환은 여러 점을 한 번에 계산한다.
+    좌표는 픽셀 모서리 기준 연속 좌표이다 (픽셀 (i, j)의 중심은 (i + 0.5, j + 0.5)).
+    Qt를 사용하지 않으므로 작업 스레드에서 그대로 사용할 수 있다.
+
+    Args:
+        image_size: 원본 이미지 크기 (너비, 높이)
+        frame_size: 프리뷰 프레임 크기 (너비, 높이)
+        zoom: 확대 배율 (1.0이면 프레임에 꼭 맞는 크기)
+        position: 중앙 기준 이미지 이동량 (x, y)
+        rotation_angle: 이미지 중심 기준 회전 각도 (반시계 방향, 도)
+    """
+
+    def __init__(self, image_size, frame_size, zoom, position=(0, 0), rotation_angle=0):
+        self.image_width, self.image_height = image_size
+        self.frame_width, self.frame_height = frame_size
+        self.zoom = zoom
+        self.rotation_angle = rotation_angle
+
+        # 이미지 비율을 유지하면서 프레임에 맞춘 크기에 배율 적용
+        image_ratio = self.image_width / self.image_height
+        if image_ratio > self.frame_width / self.frame_height:
+            # 이미지가 더 넓은 경우
+            display_width = self.frame_width * zoom
+            display_height = display_width / image_ratio
+        else:
+            # 이미지가 더 높은 경우
+            display_height = self.frame_height * zoom
+            display_width = display_height * image_ratio
+        self.display_width = int(display_width)
+        self.display_height = int(display_height)
+
+        # 이미지 중앙 정렬 및 위치 조정 (프레임 안에서 이미지 왼쪽 위 위치)
+        self.x_offset = int((self.frame_width - self.display_width) / 2 + position[0])
+        self.y_offset = int((self.frame_height - self.display_height) / 2 + position[1])
+
+        self.matrix = self._build_matrix()
+        self._inverse = None
+
+    def _build_matrix(self):
+        """원본 좌표 -> 프리뷰 좌표 3x3 행렬 (회전 -> 확대/축소 -> 이동)"""
+        angle = np.radians(self.rotation_angle)
+        cos_val, sin_val = np.cos(angle), np.sin(angle)
+        center_x, center_y = self.image_width / 2, self.image_height / 2
+        # cv2.getRotationMatrix2D와 같은 방향
+        rotation = np.array([
+            [cos_val, sin_val, (1 - cos_val) * center_x - sin_val * center_y],
+            [-sin_val, cos_val, sin_val * center_x + (1 - cos_val) * center_y],
+            [0, 0, 1],
+        ])
+        scale = np.diag([self.display_width / self.image_width, self.display_height / self.image_height, 1])
+        translation = np.array([
+            [1, 0, self.x_offset],
+            [0, 1, self.y_offset],
+            [0, 0, 1],
+        ])
+        return translation @ scale @ rotation
+
+    @property
+    def inverse(self):
+        """프리뷰 좌표 -> 원본 좌표 행렬 (처음 사용할 때 한 번만 계산)"""
+        if self._inverse is None:
+            self._inverse = np.linalg.inv(self.matrix)
+        return self._inverse
+
+    @staticmethod
+    def _apply(matrix, points):
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        return points @ matrix[:2, :2].T + matrix[:2, 2]
+
+    def to_preview(self, points):
+        """원본 좌표 (N, 2) -> 프리뷰 좌표 (N, 2)"""
+        return self._apply(self.matrix, points)
+
+    def to_source(self, points):
+        """프리뷰 좌표 (N, 2) -> 원본 좌표 (N, 2)"""
+        return self._apply(self.inverse, points)
+
+    def can_drag(self):
+        """이미지가 프레임보다 커서 드래그로 이동할 수 있는지 여부"""
+        return self.display_width > self.frame_width or self.display_height > self.frame_height
+
+    def clamp_position(self, x, y):
+        """이미지가 프레임 밖으로 벗어나지 않는 이동량으로 제한"""
+        max_x = max(0, (self.display_width - self.frame_width) / 2)
+        max_y = max(0, (self.display_height - self.frame_height) / 2)
+        return max(-max_x, min(max_x, x)), max(-max_y, min(max_y, y))
+
+    def visible_rect(self):
+        """프레임 안에서 이미지가 보이는 영역 (x1, y1, x2, y2, 프리뷰 좌표)"""
+        x1 = max(0, self.x_offset)
+        y1 = max(0, self.y_offset)
+        x2 = min(self.frame_width, self.x_offset + self.display_width)
+        y2 = min(self.frame_height, self.y_offset + self.display_height)
+        return x1, y1, max(x1, x2), max(y1, y2)
+
+    def visible_corners(self):
+        """보이는 영역의 네 꼭짓점을 원본 좌표로 변환 (좌상, 우상, 우하, 좌하 순서의 (4, 2) 배열)"""
+        x1, y1, x2, y2 = self.visible_rect()
+        return self.to_source([(x1, y1), (x2, y1), (x2, y2), (x1, y2)])
+
+    def source_bounds(self):
+        """보이는 영역을 감싸는 원본 이미지 내 사각형 (이미지 범위로 제한)
+
+        Returns:
+            dict: x1, y1, x2, y2, width, height, rotation_angle, corners(원본 좌표 꼭짓점)
+        """
+        corners = self.visible_corners()
+        x1, y1 = np.floor(corners.min(axis=0) + 1e-6).astype(int)
+        x2, y2 = np.ceil(corners.max(axis=0) - 1e-6).astype(int)
+        x1, x2 = np.clip([x1, x2], 0, self.image_width)
+        y1, y2 = np.clip([y1, y2], 0, self.image_height)
+        return {
+            "x1": int(x1),
+            "y1": int(y1),
+            "x2": int(x2),
+            "y2": int(y2),
+            "width": int(x2 - x1),
+            "height": int(y2 - y1),
+            "rotation_angle": self.rotation_angle,
+            "corners": np.rint(corners).astype(int).tolist(),
+        }
+
+    def crop_size(self):
+        """보이는 영역을 원본 해상도로 잘랐을 때의 크기 (너비, 높이)"""
+        x1, y1, x2, y2 = self.visible_rect()
+        width = (x2 - x1) * self.image_width / self.display_width
+        height = (y2 - y1) * self.image_height / self.display_height
+        return int(round(width)), int(round(height))
+
+    def crop_matrix(self, size):
+        """보이는 영역을 size 크기로 잘라낼 때 결과 픽셀 -> 원본 픽셀 2x3 행렬
+
+        cv2.warpAffine(..., flags=cv2.WARP_INVERSE_MAP)에 그대로 사용한다.
+        """
+        x1, y1, x2, y2 = self.visible_rect()
+        width, height = size
+        step_x = (x2 - x1) / width
+        step_y = (y2 - y1) / height
+        # 결과 픽셀 중심 -> 프리뷰 좌표
+        output = np.array([
+            [step_x, 0, x1 + step_x / 2],
+            [0, step_y, y1 + step_y / 2],
+            [0, 0, 1],
+        ])
+        # 원본 연속 좌표 -> 원본 픽셀 인덱스
+        to_index = np.array([
+            [1, 0, -0.5],
+            [0, 1, -0.5],
+            [0, 0, 1],
+        ])
+        return (to_index @ self.inverse @ output)[:2]
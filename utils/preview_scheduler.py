@@ -0,0 +1,53 @@
+import time
+from PySide6.QtCore import QObject, QTimer
+
+# 디스플레이 한 프레임 (60Hz)
+FRAME_MS = 16
+
+
+class PreviewRenderScheduler(QObject):
+    """드래그/확대/회전 요청을 모아 한 프레임에 한 번만 프리뷰를 그리는 스케줄러
+
+    request()는 그리기를 예약만 하고 바로 반환한다. 예약된 그리기가 실행되기 전에
+    들어온 요청은 대기열에 쌓이지 않고 하나로 합쳐지며, 그릴 때는 그 시점의
+    최신 상태(위치, 배율, 각도)를 사용한다.
+    """
+
+    def __init__(self, render_func, frame_ms=FRAME_MS, parent=None):
+        super().__init__(parent)
+        self.render_func = render_func
+        self.frame_ms = frame_ms
+        self.pending = False
+        self.last_render = 0.0  # 마지막으로 그린 시각 (time.monotonic)
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._on_timeout)
+
+    def request(self):
+        """프리뷰 그리기 예약 (이미 예약되어 있으면 합쳐짐)"""
+        self.pending = True
+        if self.timer.isActive():
+            return
+        # 마지막 그리기로부터 한 프레임이 지나지 않았으면 남은 시간만큼 기다림
+        elapsed_ms = (time.monotonic() - self.last_render) * 1000
+        self.timer.start(max(0, int(self.frame_ms - elapsed_ms)))
+
+    def render_now(self):
+        """예약 여부와 관계없이 바로 그림 (화면 전환, 초기화 등)"""
+        self.timer.stop()
+        self._render()
+
+    def cancel(self):
+        """예약된 그리기 취소"""
+        self.timer.stop()
+        self.pending = False
+
+    def _on_timeout(self):
+        if self.pending:
+            self._render()
+
+    def _render(self):
+        self.pending = False
+        self.last_render = time.monotonic()
+        self.render_func()
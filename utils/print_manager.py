@@ -1,200 +1,229 @@
-from printer_utils.printer_thread import PrinterThread
-from printer_utils.device_functions import (
-    get_device_list, get_device_id, open_device, draw_image, get_preview_bitmap, 
-    print_image, close_device, draw_text, draw_text2, load_font
-)
-from printer_utils.cffi_defs import SMART_OPENDEVICE_BYID, PAGE_FRONT, PANELID_COLOR
-from printer_utils.image_utils import bitmapinfo_to_image
+from printer_utils.device_functions import draw_image, print_image
+from printer_utils.cffi_defs import PAGE_FRONT
+from printer_utils.session_pool import PrinterSessionPool
+from printer_utils.print_scheduler import PrintScheduler
+from printer_utils.print_job import PrintJob, JOB_RENDERING, JOB_WAITING, JOB_PRINTING, JOB_DONE, JOB_FAILED
+from printer_utils.job_queue import PrintJobQueue
+from printer_utils.render_worker import RenderWorker
+from printer_utils.card_renderer import render_card, save_card
+from printer_utils.card_layout import get_render_plan, get_layout_path
+from printer_utils.status_monitor import PrinterStatusMonitor, DEFAULT_POLL_MS
+from printer_utils.config_reader import read_config
 import os
-from PySide6.QtCore import QThread, Signal
-from utils.temp_path import get_temp_path, cleanup_temp_files
-
-class CardPrinterThread(QThread):
-    """이미지와 텍스트를 함께 출력하는 프린터 스레드 클래스"""
-    finished = Signal()
-    error = Signal(str)
-    preview_ready = Signal(object)  # 미리보기 이미지 전달용
-    
-    def __init__(self, image_filename, name, show_preview=True):
-        super().__init__()
-        self.image_filename = image_filename
-        self.name = name
-        self.show_preview = show_preview
-        self.is_canceled = False
-        
-    def cancel(self):
-        """인쇄 작업 취소"""
-        self.is_canceled = True
-        
-    def run(self):
-        try:
-            # 1. 장치 목록 조회
-            result, printer_list = get_device_list()
-            if result != 0:
-                self.error.emit("프린터 목록 가져오기 실패")
-                return
-                
-            # 2. 장치 선택 (첫 번째 장치 사용)
-            device_index = 0
-            device_id = get_device_id(printer_list, device_index)
-            
-            # 3. 장치 열기
-            result, device_handle = open_device(device_id, SMART_OPENDEVICE_BYID)
-            if result != 0:
-                self.error.emit("장치 열기 실패")
-                return
-                
-            try:
-                # 작업 취소 확인
-                if self.is_canceled:
-                    return
-                
-                # base_result = draw_image(device_handle, PAGE_FRONT, PANELID_COLOR,
-                #                           0, 0, 635, 1027, "gurye_base_card.jpg")
-                # if base_result != 0:
-                #     self.error.emit("배경 이미지 그리기 실패")
-                #     return
-                    
-                # 4. 이미지 그리기
-                # 카드 크기: 58mm x 90mm (스마트 프린터 기본 설정 635px x 1027px @ 300 DPI)
-                card_width = 635    # 58mm
-                card_height = 1027  # 90mm
-                
-                # 이미지 크기: 40mm x 40mm
-                image_width = 438  # 40mm @ 300 DPI
-                image_height = 438  # 40mm @ 300 DPI
-                
-                # 이미지 위치 계산 (가로 중앙 정렬)
-                image_x = (card_width - image_width) // 2  # 카드 중앙 정렬
-                image_y = 250  # 상단에서 아래로 적절한 위치
-                
-                # 이미지 그리기
-                result = draw_image(device_handle, PAGE_FRONT, PANELID_COLOR, 
-                                  image_x, image_y, image_width, image_height, 
-                                  self.image_filename)
-                                  
-                if result != 0:
-                    self.error.emit("사진 이미지 그리기 실패")
-                    return
-                
-                # 작업 취소 확인
-                if self.is_canceled:
-                    return
-                
-                # 5. 텍스트 그리기 (중앙 정렬)
-                # 폰트 설정
-                font_name = "맑은 고딕"  # 한글 지원 폰트
-                font_size = 16  # 적절한 크기
-                
-                # 텍스트 위치 계산 (가로 중앙, 이미지 아래)
-                # 참고: draw_text 함수는 텍스트를 가로 중앙에 배치하는 옵션이 없음
-                # 텍스트 너비를 대략 추정하여 위치 조정
-                # 한글은 문자당 약 font_size 픽셀의 너비 가정
-                text_width = 438  # 대략적인 텍스트 너비
-                text_height = 100
-                text_x = image_x
-                text_y = image_y + image_height + 50  # 이미지 아래 여백
-                
-                # 이름 그리기
-                name_result = draw_text2(device_handle, PAGE_FRONT, PANELID_COLOR,
-                                      text_x, text_y, text_width, text_height, font_name, font_size, 0, 0x00,
-                                      0x000000, self.name, 0, 0x01, 0)
-                                      
-                if name_result != 0:
-                    # 기본 폰트로 재시도
-                    font_name = "Arial"
-                    name_result = draw_text2(device_handle, PAGE_FRONT, PANELID_COLOR,
-                                      text_x, text_y, text_width, text_height, font_name, font_size, 0x00,
-                                      0x000000, self.name, 0, 0x01, 0)
-                    if name_result != 0:
-                        self.error.emit("이름 텍스트 그리기 실패")
-                
-                # 작업 취소 확인
-                if self.is_canceled:
-                    return
-                
-                # 6. 미리보기 비트맵 가져오기 (필요한 경우)
-                # if self.show_preview:
-                #     result, bm_info = get_preview_bitmap(device_handle, PAGE_FRONT)
-                #     if result == 0:
-                #         image = bitmapinfo_to_image(bm_info)
-                #         if image:
-                #             self.preview_ready.emit(image)
-                #     else:
-                #         self.error.emit("미리보기 비트맵 가져오기 실패")
-                        # 실패해도 계속 진행
-                
-                # 작업 취소 확인
-                if self.is_canceled:
-                    return
-                
-                # 7. 이미지 인쇄
-                result = print_image(device_handle)
-                if result != 0:
-                    self.error.emit("이미지 인쇄 실패")
-                    return
-                    
-                self.finished.emit()
-            finally:
-                # 8. 장치 닫기 (항상 실행)
-                close_device(device_handle)
-        except Exception as e:
-            self.error.emit(f"인쇄 중 오류 발생: {str(e)}")
+from PIL import Image
+from utils.temp_path import cleanup_temp_files
+
+def print_card_job(session, job):
+    """세션 핸들로 미리 합성된 카드 이미지 한 장을 그리고 인쇄
+
+    PrintScheduler의 프린터 워커 스레드에서 session.lock을 잡은 상태로 호출된다.
+    배경/사진/이름 배치는 RenderWorker에서 끝나 있으므로 DrawImage 한 번만 호출한다.
+
+    Returns:
+        tuple: (성공 여부, 오류 메시지)
+    """
+    # 1. 세션 핸들 확보 (이미 열려있으면 장치 목록 조회/열기 생략)
+    result = session.ensure_open()
+    if result != 0:
+        return False, "장치 열기 실패"
+    device_handle = session.handle
+
+    # 작업 취소 확인
+    if job.is_canceled:
+        return False, "인쇄 작업 취소"
+
+    # 2. 합성된 카드 전체 이미지 그리기
+    plan = job.render_plan
+    result = draw_image(device_handle, PAGE_FRONT, plan.panel,
+                        0, 0, plan.width, plan.height, job.card_filename)
+    if result != 0:
+        # 장치 분리 등으로 핸들이 끊겼을 수 있으므로 다음 작업에서 다시 열기
+        session.invalidate()
+        return False, "카드 이미지 그리기 실패"
+    job.mark("drawn")
+
+    # 작업 취소 확인 (그려진 내용이 다음 카드에 남지 않도록 세션을 닫음)
+    if job.is_canceled:
+        session.invalidate()
+        return False, "인쇄 작업 취소"
+
+    # 3. 이미지 인쇄 (세션은 닫지 않고 다음 카드에 재사용)
+    result = print_image(device_handle)
+    if result != 0:
+        session.invalidate()
+        return False, "이미지 인쇄 실패"
+
+    return True, ""
 
 
 class PrintManager:
     """인쇄 관련 기능을 관리하는 클래스"""
     
     def __init__(self):
-        self.printer_thread = None
+        # 프린터 핸들을 작업 간에 유지하는 세션 풀
+        self.session_pool = PrinterSessionPool()
+        # 연결된 모든 프린터에 작업을 분배하는 스케줄러
+        self.scheduler = PrintScheduler(self.session_pool, self.print_job)
+        self.scheduler.job_started.connect(self.on_job_started)
+        self.scheduler.job_finished.connect(self.on_job_finished)
+        self.scheduler.job_failed.connect(self.on_job_failed)
+
+        # 프린터 상태를 주기적으로 조회하는 스레드 (발급 전 확인과 작업 배정에 사용)
+        poll_ms = read_config().get("status_poll_ms", DEFAULT_POLL_MS)
+        self.status_monitor = PrinterStatusMonitor(self.session_pool, poll_ms)
+        self.scheduler.status_monitor = self.status_monitor
+        self.status_monitor.status_changed.connect(self.scheduler.on_status_changed)
+        # 조회 스레드가 찾은 프린터를 등록 (장치 목록 조회는 UI 스레드에서 하지 않음)
+        self.status_monitor.devices_changed.connect(self.scheduler.on_devices_changed)
+        self.status_monitor.start()
+
+        # 재시작 후에도 남는 작업 큐
+        self.job_queue = PrintJobQueue()
+
+        # 카드 레이아웃 파일 (렌더링 계획은 처음 합성할 때 한 번만 컴파일)
+        self.layout_path = get_layout_path()
+
+        # 이전 카드가 인쇄되는 동안 다음 카드를 미리 합성하는 스레드
+        self.render_worker = RenderWorker(self.render_card_job)
+        self.render_worker.job_rendered.connect(self.on_job_rendered)
+        self.render_worker.job_failed.connect(self.on_job_failed)
+        self.render_worker.start()
+
+        # 이전 실행에서 끝나지 않은 작업 다시 합성/인쇄
+        for job in self.job_queue.recover():
+            self.render_worker.submit(job)
     
-    def print_card(self, image_path, name, on_finished_callback=None, show_preview=True):
-        """이미지와 텍스트를 포함한 카드 인쇄 시작"""
-        if not os.path.exists(image_path):
+    def printer_ready(self):
+        """새 카드를 발급할 수 있는 프린터가 있는지 확인 (프린터를 직접 호출하지 않음)
+
+        Returns:
+            tuple: (인쇄 가능 여부, 사용자에게 보여줄 메시지)
+        """
+        monitor = self.status_monitor
+        if not monitor.discovery_done():
+            # 프로그램 시작 직후 첫 장치 목록 조회 전이면 막지 않음 (인쇄 단계에서 다시 확인됨)
+            return True, ""
+        if not monitor.devices():
+            return False, "프린터 연결 없음: 연결된 프린터를 찾지 못했습니다."
+        if monitor.ready_devices():
+            return True, ""
+        snapshots = monitor.snapshots()
+        if not snapshots:
+            # 프린터는 찾았지만 아직 상태를 조회하기 전
+            return True, ""
+        # 인쇄할 수 없는 이유는 첫 번째 프린터 기준으로 안내
+        status = next(iter(snapshots.values()))
+        return False, status.describe()
+
+    def print_card(self, image_path, name, on_finished_callback=None):
+        """이미지와 텍스트를 포함한 카드 인쇄 작업을 큐에 등록
+
+        작업은 저널에 기록된 뒤 백그라운드 프린터 워커가 처리하므로
+        호출 즉시 반환된다.
+
+        Args:
+            image_path: 사진 파일 경로 또는 PIL Image (인쇄 크기로 만든 사진은
+                파일로 다시 인코딩/디코딩하지 않고 그대로 합성에 사용)
+        """
+        if isinstance(image_path, Image.Image):
+            job = PrintJob(None, name, on_finished_callback)
+            job.photo = image_path
+        elif not os.path.exists(image_path):
             print(f"인쇄할 이미지 파일({image_path})이 존재하지 않습니다.")
             return False
-                
-        image_filename = os.path.basename(image_path)
-        self.printer_thread = CardPrinterThread(image_filename, name, show_preview)
-        
-        # 콜백 연결
-        if on_finished_callback:
-            self.printer_thread.finished.connect(on_finished_callback)
-                
-        # 에러 콜백 연결
-        self.printer_thread.error.connect(self.on_print_error)
-        
-        # 미리보기 콜백 연결
-        if show_preview:
-            self.printer_thread.preview_ready.connect(self.show_preview)
-                
-        self.printer_thread.start()
-        print(f"카드 인쇄 작업을 시작합니다: {image_filename}")
+        else:
+            job = PrintJob(image_path, name, on_finished_callback)
+
+        try:
+            if job.photo is not None:
+                # 재시작 후 다시 합성할 수 있도록 무손실로 보관
+                dpi = get_render_plan(self.layout_path).dpi
+                job.image_filename = self.job_queue.spool_photo(job.photo, job.job_id, dpi)
+            else:
+                # 다음 작업이 같은 임시 파일을 덮어써도 영향이 없도록 작업 전용 사본 사용
+                job.image_filename = self.job_queue.spool_image(image_path, job.job_id)
+            self.job_queue.enqueue(job)
+        except Exception as e:
+            print(f"인쇄 작업 저장 중 오류 발생: {e}")
+            return False
+
+        self.render_worker.submit(job)
+        print(f"카드 인쇄 작업을 등록합니다: {job}")
         return True
+
+    def render_card_job(self, job):
+        """카드 전체 이미지를 합성하여 스풀 폴더에 저장 (RenderWorker 스레드에서 실행)"""
+        self.job_queue.set_state(job, JOB_RENDERING)
+        plan = get_render_plan(self.layout_path)
+        photo = job.photo if job.photo is not None else job.image_filename
+        card = render_card(plan, {"photo": photo, "name": job.name})
+        job.card_filename = save_card(card, self.job_queue.card_path(job), plan.dpi)
+        job.render_plan = plan
+        job.photo = None
+        # 프린터 워커 큐나 스케줄러 대기 목록에서 인쇄 차례를 기다림
+        self.job_queue.set_state(job, JOB_WAITING)
     
     def print_image(self, image_path, on_finished_callback=None):
         """기존 이미지만 인쇄하는 메서드 (이전 버전과의 호환성 유지)"""
-        return self.print_card(image_path, "", on_finished_callback, False)
+        return self.print_card(image_path, "", on_finished_callback)
+
+    def on_job_rendered(self, job):
+        """합성이 끝난 카드를 프린터에 배정"""
+        self.scheduler.submit(job)
+
+    def print_job(self, session, job):
+        """카드 한 장을 인쇄하고 결과를 바로 저널에 기록 (프린터 워커 스레드에서 실행)
+
+        완료 시그널은 UI 스레드로 늦게 전달되거나 종료 중에는 전달되지 않을 수 있으므로
+        인쇄가 끝난 이 스레드에서 완료를 기록하여 다음 실행 때 다시 인쇄하지 않도록 한다.
+        """
+        self.job_queue.set_state(job, JOB_PRINTING)
+        success, message = print_card_job(session, job)
+        # 실패한 작업은 스케줄러가 다시 배정하거나 실패로 처리할 때까지 대기 상태
+        self.job_queue.set_state(job, JOB_DONE if success else JOB_WAITING)
+        return success, message
+
+    def on_job_started(self, job):
+        """프린터 워커가 작업을 시작함 (상태는 워커 스레드에서 기록됨)"""
+        print(f"{job} 인쇄 시작")
+
+    def on_job_finished(self, job):
+        """인쇄 완료 처리 (저널에는 워커 스레드에서 이미 기록됨)"""
+        job.mark("done")
+        print(f"{job} 인쇄 완료")
+        if job.on_finished:
+            job.on_finished()
+
+    def on_job_failed(self, job, error_message):
+        """재시도 후에도 실패한 작업 처리"""
+        self.job_queue.set_state(job, JOB_FAILED, error_message)
+        self.on_print_error(f"{job} {error_message}")
     
     def on_print_error(self, error_message):
         """인쇄 에러 처리"""
         print(f"인쇄 오류: {error_message}")
     
-    def show_preview(self, image):
-        """인쇄 미리보기 표시"""
-        if image:
-            # 미리보기 이미지 표시 (필요한 경우 구현)
-            image.show()  # PIL Image 객체인 경우
-            pass
-    
     def cancel_printing(self):
         """인쇄 작업 취소"""
-        if self.printer_thread and self.printer_thread.isRunning():
-            self.printer_thread.cancel()
+        pending = self.render_worker.take_pending()
+        for job in pending:
+            job.cancel()
+            self.on_job_failed(job, "인쇄 작업 취소")
+        if self.scheduler.cancel_all() or pending:
             print("인쇄 작업을 취소했습니다.")
             return True
         return False
     
     def clean_up_image_files(self, image_paths=[]):
         """인쇄 후 이미지 파일 정리"""
-        cleanup_temp_files()
\ No newline at end of file
+        cleanup_temp_files()
+
+    def shutdown(self):
+        """프로그램 종료 시 진행 중인 작업을 기다린 뒤 프린터 세션 닫기"""
+        self.render_worker.stop()
+        self.render_worker.wait()
+        self.status_monitor.stop()
+        self.scheduler.shutdown()
+        # 인쇄를 마친 작업의 완료 기록까지 디스크에 쓴 뒤 종료
+        self.job_queue.close()
+        self.session_pool.close_all()
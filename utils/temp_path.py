@@ -13,6 +13,21 @@ def get_temp_path(filename):
     # 전체 파일 경로 반환
     return os.path.join(app_temp_dir, filename)
 
+def get_spool_path(filename):
+    """인쇄 대기 작업(저널, 이미지)을 보관하는 경로 반환
+
+    임시 디렉토리는 종료 시 정리되므로, 재시작 후에도 남아야 하는
+    인쇄 작업은 사용자 로컬 앱 데이터 폴더에 보관한다.
+    """
+    base_dir = os.environ.get("LOCALAPPDATA", os.path.expanduser("~"))
+    spool_dir = os.path.join(base_dir, "GureyCitizenCard", "spool")
+    
+    # 폴더가 없으면 생성
+    if not os.path.exists(spool_dir):
+        os.makedirs(spool_dir)
+    
+    return os.path.join(spool_dir, filename)
+
 def cleanup_temp_files():
     """임시 디렉토리 내 모든 파일 정리"""
     app_temp_dir = os.path.join(tempfile.gettempdir(), "GureyCitizenCard")
@@ -0,0 +1,223 @@
+import os
+import time
+import logging
+import cv2
+import numpy as np
+from printer_utils.config_reader import read_config
+
+# 사용할 수 있는 프레임 소스 (환경 변수 CAMERA_SOURCE 또는 config.txt의 camera_source)
+#   live: 연결된 웹캠 (기본값)
+#   video:<파일 경로>: 동영상 파일을 반복 재생
+#   images:<폴더 경로>: 폴더의 이미지 파일을 이름 순서로 반복 재생
+#   synthetic 또는 synthetic:<너비>x<높이>@<fps>: 장치 없이 만든 움직이는 화면
+SOURCE_LIVE = "live"
+SOURCE_VIDEO = "video"
+SOURCE_IMAGES = "images"
+SOURCE_SYNTHETIC = "synthetic"
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+
+def get_source_spec():
+    """설정된 프레임 소스 반환 (환경 변수가 config.txt보다 우선)"""
+    spec = os.environ.get("CAMERA_SOURCE") or read_config().get("camera_source", SOURCE_LIVE)
+    return str(spec).strip()
+
+
+def open_live_camera(camera_index=0, width=1920, height=1080, fps=60):
+    """카메라 초기화 및 최적화"""
+    camera = cv2.VideoCapture(camera_index, cv2.CAP_DSHOW)
+    if not camera.isOpened():
+        camera = cv2.VideoCapture(camera_index)
+
+    if camera.isOpened():
+        camera.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        camera.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        camera.set(cv2.CAP_PROP_FPS, fps)
+        camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        camera.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+        camera.set(cv2.CAP_PROP_AUTOFOCUS, 0)  # 기본값 유지, 필요 시 변경 가능
+        camera.set(cv2.CAP_PROP_AUTO_EXPOSURE, 0.75)  # 자동 노출을 부드럽게 조정
+        for _ in range(5):  # 프레임 버퍼 줄이기
+            camera.read()
+        logging.info("카메라 초기화 완료")
+        return camera
+    logging.error("카메라 초기화 실패")
+    return None
+
+
+class FrameSource:
+    """cv2.VideoCapture처럼 사용하는 재생용 프레임 소스의 기본 클래스
+
+    read()는 실제 카메라처럼 fps 간격에 맞춰 다음 프레임까지 기다린 뒤 반환한다.
+    하위 클래스는 _next_frame(image)만 구현하면 된다.
+    """
+
+    def __init__(self, fps):
+        self.fps = fps
+        self.frame_count = 0  # 지금까지 내보낸 프레임 수
+        self.last_frame_time = None  # 마지막 프레임을 내보낸 시각 (time.perf_counter)
+        self._next_time = None
+        self._opened = True
+
+    def isOpened(self):
+        return self._opened
+
+    def read(self, image=None):
+        if not self._opened:
+            return False, None
+        # 다음 프레임 시각까지 대기 (늦었으면 기다리지 않고 기준 시각을 다시 잡음)
+        now = time.perf_counter()
+        if self._next_time is None or now - self._next_time > 1.0 / self.fps:
+            self._next_time = now
+        elif self._next_time > now:
+            time.sleep(self._next_time - now)
+        self._next_time += 1.0 / self.fps
+
+        frame = self._next_frame(image)
+        if frame is None:
+            return False, None
+        self.frame_count += 1
+        self.last_frame_time = time.perf_counter()
+        return True, frame
+
+    def _next_frame(self, image):
+        raise NotImplementedError
+
+    @staticmethod
+    def _output(frame, image):
+        """image가 같은 크기이면 그 배열에 복사하여 반환 (VideoCapture.read와 같은 동작)"""
+        if image is not None and image.shape == frame.shape and image.dtype == frame.dtype:
+            np.copyto(image, frame)
+            return image
+        return frame.copy()
+
+    def set(self, prop, value):
+        if prop == cv2.CAP_PROP_FPS and value > 0:
+            self.fps = value
+            return True
+        return False
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_FPS:
+            return self.fps
+        return 0
+
+    def release(self):
+        self._opened = False
+
+
+class VideoFileSource(FrameSource):
+    """동영상 파일을 끝까지 재생하면 처음부터 다시 재생"""
+
+    def __init__(self, path, fps=None):
+        self.path = path
+        self.capture = cv2.VideoCapture(path)
+        file_fps = self.capture.get(cv2.CAP_PROP_FPS)
+        super().__init__(fps or file_fps or 30)
+        self._opened = self.capture.isOpened()
+
+    def _next_frame(self, image):
+        ret, frame = self.capture.read(image)
+        if not ret:
+            # 처음으로 되감기
+            self.capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self.capture.read(image)
+        return frame if ret else None
+
+    def release(self):
+        super().release()
+        self.capture.release()
+
+
+class ImageSequenceSource(FrameSource):
+    """폴더의 이미지를 이름 순서로 반복 재생 (처음 한 번만 디코딩하여 보관)"""
+
+    def __init__(self, directory, fps=30):
+        super().__init__(fps)
+        names = []
+        if os.path.isdir(directory):
+            names = sorted(name for name in os.listdir(directory)
+                           if name.lower().endswith(IMAGE_EXTENSIONS))
+        self.paths = [os.path.join(directory, name) for name in names]
+        self.frames = {}  # 인덱스 -> 디코딩된 프레임
+        self._opened = bool(self.paths)
+
+    def _next_frame(self, image):
+        index = self.frame_count % len(self.paths)
+        frame = self.frames.get(index)
+        if frame is None:
+            frame = cv2.imread(self.paths[index])
+            if frame is None:
+                return None
+            self.frames[index] = frame
+        return self._output(frame, image)
+
+
+class SyntheticSource(FrameSource):
+    """장치 없이 만든 움직이는 화면 (그라데이션 배경 위로 세로 막대가 이동)
+
+    프레임마다 왼쪽 위 8픽셀에 프레임 번호를 기록하므로(frame_number_of) 원본 해상도
+    프레임(촬영한 사진 등)이 몇 번째 프레임인지 알 수 있다.
+    """
+
+    def __init__(self, width=1920, height=1080, fps=60):
+        super().__init__(fps)
+        gradient = np.linspace(40, 215, width, dtype=np.uint8)
+        self.background = np.dstack([
+            np.tile(gradient, (height, 1)),
+            np.tile(gradient[::-1], (height, 1)),
+            np.full((height, width), 128, dtype=np.uint8),
+        ])
+        self.width = width
+        self.height = height
+
+    def _next_frame(self, image):
+        frame = self._output(self.background, image)
+        bar_x = (self.frame_count * 8) % self.width
+        frame[:, bar_x:bar_x + 16] = 255
+        frame[0, :8, 0] = np.frombuffer(self.frame_count.to_bytes(8, "little"), dtype=np.uint8)
+        return frame
+
+    @staticmethod
+    def frame_number_of(frame, mirrored=False):
+        """frame에 기록된 프레임 번호 (좌우 반전된 프레임이면 mirrored=True)"""
+        stamp = frame[0, -8:, 0][::-1] if mirrored else frame[0, :8, 0]
+        return int.from_bytes(np.ascontiguousarray(stamp).tobytes(), "little")
+
+
+def open_frame_source(spec=None, camera_index=0, width=1920, height=1080, fps=60):
+    """설정에 맞는 프레임 소스 열기 (cv2.VideoCapture와 같은 방식으로 사용)
+
+    Args:
+        spec: 소스 지정 문자열 (None이면 CAMERA_SOURCE 환경 변수/config.txt 사용)
+
+    Returns:
+        프레임 소스 (열지 못하면 None)
+    """
+    if spec is None:
+        spec = get_source_spec()
+    kind, _, argument = spec.partition(":")
+    kind = kind.strip().lower()
+
+    if kind == SOURCE_LIVE:
+        return open_live_camera(camera_index, width, height, fps)
+    if kind == SOURCE_VIDEO:
+        source = VideoFileSource(argument)
+    elif kind == SOURCE_IMAGES:
+        source = ImageSequenceSource(argument, fps)
+    elif kind == SOURCE_SYNTHETIC:
+        if argument:
+            size, _, rate = argument.partition("@")
+            width, height = (int(value) for value in size.lower().split("x"))
+            fps = float(rate) if rate else fps
+        source = SyntheticSource(width, height, fps)
+    else:
+        logging.error(f"알 수 없는 카메라 소스: {spec}")
+        return None
+
+    if not source.isOpened():
+        logging.error(f"카메라 소스를 열 수 없습니다: {spec}")
+        return None
+    logging.info(f"카메라 소스: {spec}")
+    return source
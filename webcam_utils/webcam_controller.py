@@ -1,34 +1,32 @@
 import cv2
 import logging
-from PySide6.QtCore import QTimer, Qt, QThread, Signal
-from PySide6.QtGui import QImage, QPixmap, QMouseEvent
+import threading
+import numpy as np
+from PySide6.QtCore import QTimer, Qt, QThread, Signal, QPoint
+from PySide6.QtGui import QMouseEvent
 from PySide6.QtWidgets import QLabel, QApplication, QWidget, QVBoxLayout
 import time
 import sys
 import os
 
 from utils.temp_path import get_temp_path
+from utils.image_cache import image_cache
+from utils.frame_presenter import FrameView
+from utils.auto_framing import auto_framer
+from webcam_utils.frame_sources import open_frame_source
+from printer_utils.config_reader import read_config
+
+# 카메라를 여는 해상도 기본값 (config.txt의 camera_width, camera_height로 변경)
+CAMERA_WIDTH = 1920
+CAMERA_HEIGHT = 1080
+
+# 촬영할 프레임이 아직 없을 때(재개 직후 등) 캡처 스레드의 다음 프레임을 기다리는 최대 시간과 확인 간격 (ms)
+STILL_WAIT_MS = 500
+STILL_RETRY_MS = 10
 
 def initialize_camera(camera_index=0, width=1920, height=1080, fps=60):
-    """카메라 초기화 및 최적화"""
-    camera = cv2.VideoCapture(camera_index, cv2.CAP_DSHOW)
-    if not camera.isOpened():
-        camera = cv2.VideoCapture(camera_index)
-    
-    if camera.isOpened():
-        camera.set(cv2.CAP_PROP_FRAME_WIDTH, width)
-        camera.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
-        camera.set(cv2.CAP_PROP_FPS, fps)
-        camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
-        camera.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
-        camera.set(cv2.CAP_PROP_AUTOFOCUS, 0)  # 기본값 유지, 필요 시 변경 가능
-        camera.set(cv2.CAP_PROP_AUTO_EXPOSURE, 0.75)  # 자동 노출을 부드럽게 조정
-        for _ in range(5):  # 프레임 버퍼 줄이기
-            camera.read()
-        logging.info("카메라 초기화 완료")
-        return camera
-    logging.error("카메라 초기화 실패")
-    return None
+    """카메라 초기화 (config.txt의 camera_source에 따라 웹캠 또는 재생용 프레임 소스)"""
+    return open_frame_source(None, camera_index, width, height, fps)
 
 def get_frame(camera):
     """최신 프레임을 반환"""
@@ -48,17 +46,156 @@ def release_camera(camera):
 from utils.temp_path import get_temp_path
 
 # capture_and_save_photo 함수 수정
-def capture_and_save_photo(camera, save_path="captured_image.jpg", x=0, y=0, width=None, height=None):
-    """현재 카메라 인스턴스를 사용하여 사진 촬영 후 저장, 특정 영역만 캡처 가능"""
-    frame = get_frame(camera)
+def capture_and_save_photo(camera, save_path="captured_image.jpg", x=0, y=0, width=None, height=None, frame=None):
+    """현재 카메라 인스턴스를 사용하여 사진 촬영 후 저장, 특정 영역만 캡처 가능
+
+    frame이 주어지면 카메라에서 다시 읽지 않고 그 프레임(좌우 반전된 상태)을 저장한다.
+    x, y, width, height는 프레임 좌표의 캡처 영역이며, width/height가 없으면 프레임 전체를 저장한다.
+    """
+    if frame is None:
+        frame = get_frame(camera)
+    if frame is not None and width is not None and height is not None:
+        # 캡처 영역만 잘라냄 (프레임 밖으로 나간 부분은 제외)
+        frame_height, frame_width = frame.shape[:2]
+        left, top = max(0, int(x)), max(0, int(y))
+        right = min(frame_width, int(x + width))
+        bottom = min(frame_height, int(y + height))
+        frame = np.ascontiguousarray(frame[top:bottom, left:right]) if right > left and bottom > top else None
     if frame is not None:
         # 임시 경로로 저장 
         file_path = get_temp_path(os.path.basename(save_path))
+        # 파일을 저장하는 동안 정보 입력 화면의 첫 프리뷰를 위한 얼굴 검출 시작
+        auto_framer.submit(file_path, frame)
         cv2.imwrite(file_path, frame)
+        # 정보 입력 화면이 파일을 다시 디코딩하지 않도록 촬영한 프레임을 캐시에 등록
+        image_cache.put(file_path, frame)
         return file_path
     logging.error("사진 촬영 실패")
     return None
 
+class CameraCaptureThread(QThread):
+    """카메라에서 프레임을 계속 읽어 가장 최근 프레임을 보관하는 스레드
+
+    camera.read()는 장치가 멈추면 그대로 대기하므로 UI 스레드 대신 이 스레드에서 호출한다.
+    카메라 원본 해상도 프레임과 프리뷰 크기로 줄여 좌우 반전한 프레임을 각각 미리 할당한
+    링 버퍼에 차례로 쓰고, 다 쓴 뒤에 최신 위치만 바꾸므로 읽는 쪽은 항상 완성된 프레임을 받는다.
+    UI는 작은 프리뷰 프레임만 표시하고, 촬영할 때만 원본 프레임을 사용한다.
+    pause()하면 장치는 열어 둔 채 읽기를 멈추므로 resume() 후 곧바로 프레임이 나온다.
+    """
+
+    def __init__(self, camera, preview_size=None, ring_size=3):
+        super().__init__()
+        self.camera = camera
+        self.preview_size = preview_size  # (너비, 높이), None이면 원본 크기
+        self.ring_size = ring_size
+        self.frames = []  # 카메라 원본 프레임 버퍼 (camera.read()가 바로 덮어씀, 반전 전)
+        self.previews = []  # 프리뷰 크기로 줄여 좌우 반전한 프레임 버퍼
+        self.index = -1  # 최신 프레임의 링 위치
+        self.sequence = 0  # 지금까지 읽은 프레임 수 (새 프레임 여부 확인용)
+        self.lock = threading.Lock()
+        self.is_running = True
+        self.active = threading.Event()  # 해제되어 있으면 일시 정지 상태
+        self.active.set()
+        self.skip_frames = 0  # 다시 시작한 뒤 버릴 프레임 수
+        self.generation = 0  # pause()마다 증가 (정지 전에 읽기 시작한 프레임 구분용)
+
+    def run(self):
+        while self.is_running:
+            if not self.active.is_set():
+                self.active.wait(0.1)
+                continue
+            # 읽는 쪽이 보고 있는 최신 프레임이 아닌 다음 칸에 바로 읽음 (프레임마다 할당하지 않음)
+            generation = self.generation
+            next_index = (self.index + 1) % self.ring_size
+            target = self.frames[next_index] if self.frames else None
+            ret, frame = self.camera.read(target)
+            if not ret:
+                time.sleep(0.01)
+                continue
+            if self.skip_frames > 0:
+                # 일시 정지 동안 드라이버 버퍼에 남아 있던 오래된 프레임
+                self.skip_frames -= 1
+                continue
+            if not self.frames or self.frames[0].shape != frame.shape:
+                with self.lock:
+                    self.frames = [np.empty_like(frame) for _ in range(self.ring_size)]
+                    self.previews = []
+                    self.index = -1
+                next_index = 0
+            if frame is not self.frames[next_index]:
+                np.copyto(self.frames[next_index], frame)
+            self._make_preview(next_index)
+            with self.lock:
+                # 읽는 동안 일시 정지되었으면 (곧바로 다시 시작했더라도) 정지 전 프레임을 내보내지 않음
+                if generation != self.generation or not self.active.is_set():
+                    continue
+                self.index = next_index
+                self.sequence += 1
+
+    def _make_preview(self, index):
+        """원본 프레임을 프리뷰 크기로 줄이고 좌우 반전하여 같은 위치의 프리뷰 버퍼에 씀"""
+        frame = self.frames[index]
+        height, width = frame.shape[:2]
+        preview_width, preview_height = self.preview_size or (width, height)
+        if not self.previews or self.previews[0].shape[:2] != (preview_height, preview_width):
+            self.previews = [np.empty((preview_height, preview_width, frame.shape[2]), dtype=frame.dtype)
+                             for _ in range(self.ring_size)]
+        preview = self.previews[index]
+        if (preview_width, preview_height) == (width, height):
+            cv2.flip(frame, 1, dst=preview)
+        else:
+            # 작은 프리뷰 크기에서 반전하는 편이 원본을 반전하는 것보다 훨씬 쌈
+            cv2.resize(frame, (preview_width, preview_height), dst=preview, interpolation=cv2.INTER_LINEAR)
+            cv2.flip(preview, 1, dst=preview)
+
+    def latest_frame(self, copy=False):
+        """가장 최근 프리뷰 프레임 반환 (기다리지 않음)
+
+        Args:
+            copy (bool): 오래 보관할 프레임이면 True (링 버퍼는 곧 다시 덮어씀)
+
+        Returns:
+            tuple: (프레임 번호, 프리뷰 프레임 또는 아직 없으면 None)
+        """
+        with self.lock:
+            if self.index < 0:
+                return self.sequence, None
+            frame = self.previews[self.index]
+            sequence = self.sequence
+        return sequence, frame.copy() if copy else frame
+
+    def latest_still(self):
+        """가장 최근 원본 해상도 프레임을 좌우 반전한 새 배열로 반환 (촬영용)
+
+        Returns:
+            tuple: (프레임 번호, 프레임 또는 아직 없으면 None)
+        """
+        # 복사하는 동안 쓰는 쪽이 최신 위치를 바꾸지 못하므로 이 칸은 덮어쓰이지 않음
+        with self.lock:
+            if self.index < 0:
+                return self.sequence, None
+            return self.sequence, cv2.flip(self.frames[self.index], 1)
+
+    def pause(self):
+        """프레임 읽기 중지 (장치는 열어 둠), 이전 프레임은 더 이상 반환하지 않음"""
+        with self.lock:
+            self.active.clear()
+            self.generation += 1
+            self.index = -1
+
+    def resume(self):
+        """프레임 읽기 다시 시작"""
+        if self.active.is_set():
+            return
+        self.skip_frames = 1
+        self.active.set()
+
+    def stop(self):
+        """스레드 종료 (멈춘 장치 때문에 종료가 늦어지면 최대 1초만 기다림)"""
+        self.is_running = False
+        self.active.set()
+        self.wait(1000)
+
 class CountdownThread(QThread):
     countdown_signal = Signal(int)
     finished_signal = Signal()
@@ -86,7 +223,7 @@ class WebcamViewer(QWidget):
     # 사진 촬영 완료 시그널 추가
     photo_captured_signal = Signal(str)
     
-    def __init__(self, camera_index=0, preview_width=640, preview_height=480, capture_width=None, capture_height=None, x=100, y=100, countdown=0):
+    def __init__(self, camera_index=0, preview_width=640, preview_height=480, capture_width=None, capture_height=None, x=100, y=100, countdown=0, frame_source=None, camera_width=None, camera_height=None):
         super().__init__()
         self.setWindowTitle("Webcam Viewer")
         self.setGeometry(x, y, preview_width, preview_height)  # 윈도우 위치 및 크기 설정
@@ -101,12 +238,27 @@ class WebcamViewer(QWidget):
         self.capture_x = 0
         self.capture_y = 0
         
-        # 카메라 초기화 - 프리뷰 크기로 설정
-        self.camera = initialize_camera(camera_index, preview_width, preview_height)
+        # 카메라 초기화 - 촬영 품질을 위해 원본 해상도로 열고 프리뷰는 줄여서 표시
+        # (frame_source가 주어지면 그 소스 사용)
+        if frame_source is not None:
+            self.camera = frame_source
+        else:
+            config = read_config()
+            camera_width = camera_width or int(config.get("camera_width", CAMERA_WIDTH))
+            camera_height = camera_height or int(config.get("camera_height", CAMERA_HEIGHT))
+            self.camera = initialize_camera(camera_index, camera_width, camera_height)
+        
+        # 카메라 읽기는 별도 스레드에서 (장치가 멈춰도 UI가 멈추지 않도록)
+        self.capture_thread = None
+        if self.camera is not None:
+            self.capture_thread = CameraCaptureThread(self.camera, (preview_width, preview_height))
+            self.capture_thread.start()
         
         # 프리뷰 레이블 - 프리뷰 크기로 설정
-        self.preview_label = QLabel(self)
-        self.preview_label.setFixedSize(preview_width, preview_height)
+        # 픽스맵을 거치지 않고 재사용 버퍼를 직접 그리는 위젯
+        self.preview_view = FrameView(self)
+        self.preview_view.setFixedSize(preview_width, preview_height)
+        self.last_sequence = 0  # 마지막으로 표시한 프레임 번호
 
         self.countdown_label = QLabel(self)
         self.countdown_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -117,7 +269,7 @@ class WebcamViewer(QWidget):
         self.countdown_time = countdown
         self.countdown_thread = None  # 카운트다운 스레드 초기화
         self.layout = QVBoxLayout()
-        self.layout.addWidget(self.preview_label)
+        self.layout.addWidget(self.preview_view)
         self.setLayout(self.layout)
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_frame)
@@ -125,22 +277,56 @@ class WebcamViewer(QWidget):
     
     # 캡처 영역 설정 메서드 추가
     def set_capture_area(self, x, y, width, height):
-        """캡처할 영역 설정"""
+        """캡처할 영역 설정 (부모 위젯 좌표, 부모가 없으면 이 위젯 기준 좌표)"""
         self.capture_x = x
         self.capture_y = y
         self.capture_width = width
         self.capture_height = height
+
+    def capture_rect(self, frame_width, frame_height):
+        """화면의 캡처 영역을 카메라 프레임 좌표로 변환
+
+        프리뷰는 프레임 전체를 프리뷰 크기로 줄여 표시하므로, 캡처 영역이 프리뷰에서 덮는
+        부분을 같은 비율로 원본 프레임에 옮긴다.
+
+        Returns:
+            tuple: (x, y, width, height) 프레임 좌표
+        """
+        reference = self.parentWidget() or self
+        origin = self.preview_view.mapTo(reference, QPoint(0, 0))
+        scale_x = frame_width / self.preview_width
+        scale_y = frame_height / self.preview_height
+        left = (self.capture_x - origin.x()) * scale_x
+        top = (self.capture_y - origin.y()) * scale_y
+        return (int(round(left)), int(round(top)),
+                int(round(self.capture_width * scale_x)), int(round(self.capture_height * scale_y)))
     
+    def pause(self):
+        """촬영 화면이 보이지 않는 동안 캡처와 프리뷰 표시 중지 (카메라는 열어 둠)"""
+        self.timer.stop()
+        if self.capture_thread is not None:
+            self.capture_thread.pause()
+        # 다음 사용자에게 이전 사용자의 마지막 화면이 보이지 않도록 지움
+        self.preview_view.clear()
+
+    def resume(self):
+        """캡처와 프리뷰 표시 다시 시작"""
+        if self.capture_thread is not None:
+            self.capture_thread.resume()
+        if not self.timer.isActive():
+            self.timer.start(16)
+
     def update_frame(self):
-        frame = get_frame(self.camera)
-        if frame is not None:
-            # 프레임을 프리뷰 크기로 리사이즈
-            resized_frame = cv2.resize(frame, (self.preview_width, self.preview_height))
-            rgb_image = cv2.cvtColor(resized_frame, cv2.COLOR_BGR2RGB)
-            h, w, ch = rgb_image.shape
-            qimage = QImage(rgb_image.data, w, h, w * ch, QImage.Format.Format_RGB888)
-            pixmap = QPixmap.fromImage(qimage)
-            self.preview_label.setPixmap(pixmap)
+        """캡처 스레드의 최신 프레임 표시 (카메라를 직접 읽지 않음)"""
+        if self.capture_thread is None:
+            return
+        sequence, frame = self.capture_thread.latest_frame()
+        # 카메라가 새 프레임을 주지 않은 틱은 건너뜀 (같은 화면을 다시 그리지 않음)
+        if frame is None or sequence == self.last_sequence:
+            return
+        self.last_sequence = sequence
+        # 캡처 스레드가 이미 프리뷰 크기로 줄인 프레임을 위젯 버퍼에 복사
+        self.preview_view.show_frame(frame)
     
     # def mousePressEvent(self, event: QMouseEvent):
     #     """마우스로 클릭 시 사진 촬영 (카운트다운 적용)"""
@@ -163,18 +349,37 @@ class WebcamViewer(QWidget):
         self.countdown_label.setText(str(count))
         self.countdown_label.show()  # 카운트다운 라벨이 보이도록 확실히 함
 
-    def capture_photo(self):
-        """사진 촬영 후 카운트다운 숨기기"""
+    def capture_photo(self, deadline=None):
+        """사진 촬영 후 카운트다운 숨기기
+
+        카메라는 캡처 스레드만 읽는다. 아직 프레임이 없으면(재개 직후 등) UI 스레드를
+        막지 않고 STILL_WAIT_MS까지 다음 프레임을 기다렸다가 촬영한다.
+        """
         self.countdown_label.hide()
         self.countdown_label.setText("")  # 텍스트 초기화
-        # 설정된 캡처 영역으로 사진 촬영
+        if self.capture_thread is None:
+            logging.error("사진 촬영 실패: 카메라가 없습니다.")
+            return
+        # 설정된 캡처 영역으로 사진 촬영 (카메라를 다시 읽지 않고 최신 원본 해상도 프레임 사용)
+        _, frame = self.capture_thread.latest_still()
+        if frame is None:
+            now = time.monotonic()
+            if deadline is None:
+                deadline = now + STILL_WAIT_MS / 1000
+            if now < deadline:
+                QTimer.singleShot(STILL_RETRY_MS, lambda: self.capture_photo(deadline))
+            else:
+                logging.error("사진 촬영 실패: 카메라 프레임이 없습니다.")
+            return
+        x, y, width, height = self.capture_rect(frame.shape[1], frame.shape[0])
         file_path = capture_and_save_photo(
             self.camera, 
             "resources/captured_image.jpg", 
-            x=self.capture_x, 
-            y=self.capture_y, 
-            width=self.capture_width, 
-            height=self.capture_height
+            x=x, 
+            y=y, 
+            width=width, 
+            height=height,
+            frame=frame
         )
         if file_path:
             # print(f"📸 사진 저장 완료: {file_path}")
@@ -193,5 +398,7 @@ class WebcamViewer(QWidget):
     def closeEvent(self, event):
         """창 닫을 때 카메라 해제"""
         self.timer.stop()
+        if self.capture_thread is not None:
+            self.capture_thread.stop()
         release_camera(self.camera)
         event.accept()